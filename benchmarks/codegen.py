@@ -0,0 +1,37 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sspc.compiler import compile_module  # noqa: E402
+from sspc.parser.parser import Parser  # noqa: E402
+from synth import CompilableProgramGenerator  # noqa: E402
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('--expressions', type=int, default=100000)
+    args_parser.add_argument('-n', '--repeat', type=int, default=3)
+    args = args_parser.parse_args()
+
+    generator = CompilableProgramGenerator()
+    source = generator.program(expressions=args.expressions)
+    module_ast = Parser(engine='descent').parse(source)
+
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        compile_module(module_ast)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    print('%d expressions in %d lines  codegen %.2f s  %.2f s per 100k expressions' % (
+        generator.expressions, source.count('\n'), best, best / generator.expressions * 100000,
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sspc.compiler import create_module_context  # noqa: E402
+from sspc.context import Context  # noqa: E402
+
+
+def build_scopes(depth, symbols):
+    root = create_module_context()
+    for index in range(symbols):
+        root.register('global%d' % index, index)
+
+    scopes = [root]
+    for level in range(depth):
+        scope = Context(scopes[-1])
+        scope.register('local%d' % level, level)
+        scope.register('shadow%d' % (level % 8), level, deduplicate=True)
+        scopes.append(scope)
+    return scopes
+
+
+def check_resolution(scopes, symbols):
+    innermost = scopes[-1]
+    for index in range(symbols):
+        assert innermost.find('global%d' % index) == index
+    for level in range(len(scopes) - 1):
+        assert innermost.find('local%d' % level) == level
+        assert scopes[level].find('local%d' % level) is None
+    assert innermost.find_type('int') is scopes[0].find('int')
+
+    for scope in reversed(scopes[1:]):
+        scope.close()
+    assert scopes[0].find('local0') is None
+    assert scopes[0].find('global0') == 0
+
+
+def measure(depth, symbols, lookups):
+    scopes = build_scopes(depth, symbols)
+    innermost = scopes[-1]
+    names = ['global%d' % (index % symbols) for index in range(lookups)]
+
+    start = time.perf_counter()
+    for name in names:
+        innermost.find(name)
+    find_elapsed = time.perf_counter() - start
+
+    scope = Context(innermost)
+    start = time.perf_counter()
+    for index in range(lookups):
+        scope.register('tmp', index, deduplicate=True)
+    register_elapsed = time.perf_counter() - start
+    scope.close()
+
+    check_resolution(scopes, symbols)
+    return find_elapsed, register_elapsed
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('--symbols', type=int, default=5000)
+    args_parser.add_argument('--lookups', type=int, default=100000)
+    args_parser.add_argument('--depth', type=int, nargs='+', default=[1, 10, 100, 1000])
+    args = args_parser.parse_args()
+
+    for depth in args.depth:
+        find_elapsed, register_elapsed = measure(depth, args.symbols, args.lookups)
+        print('depth %5d  %6d symbols  find %8.0f ns/op  register %8.0f ns/op' % (
+            depth, args.symbols,
+            find_elapsed / args.lookups * 1e9,
+            register_elapsed / args.lookups * 1e9,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sspc import backend  # noqa: E402
+from sspc.compiler import compile_module  # noqa: E402
+from sspc.parser.parser import Parser  # noqa: E402
+
+MODES = ('ll-string', 'll-text', 'bc-string', 'bc-text')
+
+
+def generate_module(functions):
+    lines = []
+    for index in range(functions):
+        lines.append('def f%d(a: int, b: int) -> int:' % index)
+        lines.append('    let c: int = a * %d + b' % (index % 97 + 1))
+        lines.append('    if c > %d:' % (index % 1000))
+        lines.append('        return c - a')
+        lines.append('    return %s' % ('f%d(c, a)' % (index - 1) if index else 'b'))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def write_ll_string(module_ir, target_machine, path):
+    with open(path, 'wb') as fp:
+        fp.write(str(module_ir).encode())
+
+
+def write_ll_text(module_ir, target_machine, path):
+    with open(path, 'w') as fp:
+        fp.write(backend.module_ir_text(module_ir))
+
+
+def write_bc_string(module_ir, target_machine, path):
+    module_ref = backend.parse_module(str(module_ir))
+    with open(path, 'wb') as fp:
+        fp.write(module_ref.as_bitcode())
+
+
+def write_bc_text(module_ir, target_machine, path):
+    module_ref = backend.parse_module(backend.module_ir_text(module_ir))
+    with open(path, 'wb') as fp:
+        fp.write(module_ref.as_bitcode())
+
+
+WRITERS = {
+    'll-string': write_ll_string,
+    'll-text': write_ll_text,
+    'bc-string': write_bc_string,
+    'bc-text': write_bc_text,
+}
+
+
+def max_rss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(mode, functions):
+    target_machine = backend.create_target_machine(0)
+    module_ir = compile_module(Parser(engine='descent').parse(generate_module(functions)))
+    backend.prepare_module(module_ir, target_machine)
+    rss_before = max_rss()
+
+    with tempfile.TemporaryDirectory(prefix='sspc-emit-') as temp_dir:
+        path = os.path.join(temp_dir, 'module.' + mode.split('-')[0])
+        tracemalloc.start()
+        start = time.perf_counter()
+        WRITERS[mode](module_ir, target_machine, path)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        size = os.path.getsize(path)
+
+    return {
+        'mode': mode,
+        'seconds': elapsed,
+        'python_peak': peak,
+        'rss_growth': max_rss() - rss_before,
+        'file_size': size,
+    }
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('--functions', type=int, default=100000)
+    args_parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    args_parser.add_argument('--measure', choices=MODES, help=argparse.SUPPRESS)
+    args = args_parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.functions)))
+        return
+
+    print('%d functions' % args.functions)
+    for mode in args.modes:
+        # each mode runs in a fresh process so that the RSS high-water mark is not shared
+        output = subprocess.run(
+            [sys.executable, __file__, '--functions', str(args.functions), '--measure', mode],
+            stdout=subprocess.PIPE, check=True,
+        ).stdout
+        result = json.loads(output)
+        print('%-10s %8.3f s  python peak %8.1f MiB  rss growth %8.1f MiB  output %8.1f MiB' % (
+            mode, result['seconds'], result['python_peak'] / 2 ** 20,
+            result['rss_growth'] / 2 ** 20, result['file_size'] / 2 ** 20,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sspc.parser.parser import Lexer  # noqa: E402
+from sspc.parser.tokens import tokenize  # noqa: E402
+from synth import generate_program  # noqa: E402
+
+
+def stream_tokens(source):
+    lexer = Lexer()
+    lexer.input(source)
+    return list(iter(lexer.token, None))
+
+
+def buffer_tokens(source):
+    return tokenize(source)
+
+
+PIPELINES = {
+    'stream': stream_tokens,
+    'buffer': buffer_tokens,
+}
+
+
+def build_source(lines):
+    chunk = generate_program(50, seed=0)
+    chunk_lines = chunk.count('\n')
+    return chunk * max(1, lines // chunk_lines)
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('--lines', type=int, default=1000000)
+    args = args_parser.parse_args()
+
+    source = build_source(args.lines)
+    print('%d lines, %.1f MiB of source' % (source.count('\n'), len(source) / 2 ** 20))
+
+    for name, pipeline in PIPELINES.items():
+        start = time.perf_counter()
+        tokens = pipeline(source)
+        elapsed = time.perf_counter() - start
+        count = len(tokens)
+        del tokens
+
+        tracemalloc.start()
+        tokens = pipeline(source)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del tokens
+
+        print('%-8s %10d tokens  %8.2f s  %10.0f tokens/s  peak %8.1f MiB' % (
+            name, count, elapsed, count / elapsed, peak / 2 ** 20,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sspc.parser.parser import Parser  # noqa: E402
+from synth import generate_program  # noqa: E402
+
+
+def check_equivalence(corpus):
+    parsers = {engine: Parser(engine=engine) for engine in Parser.ENGINES}
+    for seed, source in enumerate(corpus):
+        results = {engine: repr(parser.parse(source)) for engine, parser in parsers.items()}
+        if len(set(results.values())) != 1:
+            raise AssertionError('Parser engines disagree on program with seed %d:\n%s' % (seed, source))
+
+
+def measure(engine, source, repeat):
+    parser = Parser(engine=engine)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse(source)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('--corpus', type=int, default=200)
+    args_parser.add_argument('--functions', type=int, default=2000)
+    args_parser.add_argument('-n', '--repeat', type=int, default=3)
+    args = args_parser.parse_args()
+
+    corpus = [generate_program(5, seed=seed) for seed in range(args.corpus)]
+    check_equivalence(corpus)
+    print('%d generated programs parse identically with %s' % (len(corpus), ', '.join(Parser.ENGINES)))
+
+    source = generate_program(args.functions, seed=args.corpus)
+    lines = source.count('\n')
+    for engine in Parser.ENGINES:
+        elapsed = measure(engine, source, args.repeat)
+        print('%-8s %8d lines  %8.3f s  %10.0f lines/s' % (engine, lines, elapsed, lines / elapsed))
+
+
+if __name__ == '__main__':
+    main()
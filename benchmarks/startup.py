@@ -0,0 +1,50 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_TOKEN = '''
+from sspc.parser.parser import Parser
+parser = Parser()
+parser.lexer.input('def main() -> int:\\n    return 0\\n')
+parser.lexer.token()
+'''
+
+SCENARIOS = {
+    'interpreter': 'pass',
+    'import sspc.main': 'import sspc.main',
+    'first token': FIRST_TOKEN,
+    'llvm initialize': 'from sspc import backend; backend.initialize()',
+}
+
+
+def measure(code, repeat):
+    env = dict(os.environ, PYTHONPATH=REPO_DIR)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('-n', '--repeat', type=int, default=20)
+    args = args_parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        timings = measure(code, args.repeat)
+        print('%-20s median %7.1f ms   min %7.1f ms' % (
+            name,
+            statistics.median(timings) * 1000,
+            min(timings) * 1000,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_DIR = os.path.join(BENCHMARKS_DIR, 'baselines')
+
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+from sspc import ast, backend  # noqa: E402
+from sspc.compiler import compile_module  # noqa: E402
+from sspc.parser.descent import DescentParser  # noqa: E402
+from sspc.parser.parser import Parser  # noqa: E402
+from sspc.parser.tokens import tokenize  # noqa: E402
+from synth import generate_compilable_program  # noqa: E402
+
+SCALING_TOLERANCE = 1.5
+
+
+def count_nodes(node):
+    if isinstance(node, list):
+        return sum(count_nodes(item) for item in node)
+    elif hasattr(node, '_fields'):
+        return 1 + sum(count_nodes(value) for value in node)
+    elif dataclasses.is_dataclass(node):
+        return 1 + sum(count_nodes(getattr(node, field.name)) for field in dataclasses.fields(node))
+    elif isinstance(node, str):
+        return 1
+    return 0
+
+
+def count_instructions(module_ir):
+    return sum(len(block.instructions) for func in module_ir.functions for block in func.blocks)
+
+
+def lex(source):
+    tokens = tokenize(source)
+    return tokens, len(tokens)
+
+
+def parse(tokens):
+    declarations = DescentParser(tokens).parse_translation_unit()
+    return declarations, count_nodes(declarations)
+
+
+def codegen(declarations):
+    module_ir = compile_module(ast.module(declarations))
+    return module_ir, count_instructions(module_ir)
+
+
+def emit(module_ir, target_machine):
+    backend.prepare_module(module_ir, target_machine)
+    module_ref = backend.parse_module(str(module_ir))
+    backend.optimize_module(module_ref, target_machine, 2)
+    return backend.emit_object(module_ref, target_machine)
+
+
+STAGES = (
+    ('lex', 'tokens', lex),
+    ('parse', 'nodes', parse),
+    ('codegen', 'instructions', codegen),
+)
+
+
+def timed(func, *args, repeat=1):
+    best = result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def peak_memory(func, *args):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def measure_size(lines, repeat, trace_memory):
+    source = generate_compilable_program(lines, seed=lines)
+    results = {}
+    value = source
+    for name, unit, stage in STAGES:
+        elapsed, (output, count) = timed(stage, value, repeat=repeat)
+        peak = peak_memory(stage, value)[0] if trace_memory else None
+        results[name] = {
+            'lines': source.count('\n'),
+            'seconds': elapsed,
+            'count': count,
+            'unit': unit,
+            'throughput': count / elapsed,
+            'peak_bytes': peak,
+        }
+        value = output
+    return results
+
+
+def measure_end_to_end(files, lines, repeat):
+    target_machine = backend.create_target_machine(2)
+    sources = [generate_compilable_program(lines, seed=seed) for seed in range(files)]
+    parser = Parser(engine='descent')
+
+    def compile_files():
+        for source in sources:
+            emit(compile_module(parser.parse(source)), target_machine)
+
+    elapsed, _ = timed(compile_files, repeat=repeat)
+    return {'files': files, 'lines': lines, 'seconds': elapsed, 'throughput': files / elapsed, 'unit': 'files'}
+
+
+def check_scaling(sizes, measurements):
+    warnings = []
+    smallest, largest = sizes[0], sizes[-1]
+    for name, _, _ in STAGES:
+        first = measurements[smallest][name]
+        last = measurements[largest][name]
+        ratio = (last['seconds'] / last['lines']) / (first['seconds'] / first['lines'])
+        print('%-8s per-line cost x%.2f from %d to %d lines' % (name, ratio, first['lines'], last['lines']))
+        if ratio > SCALING_TOLERANCE:
+            warnings.append('%s scales superlinearly: per-line cost grew x%.2f' % (name, ratio))
+    return warnings
+
+
+def flatten(report):
+    metrics = {}
+    for size, stages in report['sizes'].items():
+        for name, result in stages.items():
+            metrics['%s@%s' % (name, size)] = result['throughput']
+    if report.get('end_to_end'):
+        metrics['end-to-end'] = report['end_to_end']['throughput']
+    return metrics
+
+
+def compare(report, baseline, tolerance):
+    regressions = []
+    current = flatten(report)
+    for key, previous in sorted(flatten(baseline).items()):
+        if key not in current:
+            continue
+        change = current[key] / previous - 1
+        flag = ''
+        if change < -tolerance:
+            flag = '  REGRESSION'
+            regressions.append(key)
+        print('%-24s %14.0f -> %14.0f  %+6.1f%%%s' % (key, previous, current[key], change * 100, flag))
+    return regressions
+
+
+def baseline_path(name):
+    if os.sep in name or name.endswith('.json'):
+        return name
+    return os.path.join(BASELINES_DIR, name + '.json')
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    args_parser.add_argument('--files', type=int, default=50)
+    args_parser.add_argument('--file-lines', type=int, default=200)
+    args_parser.add_argument('-n', '--repeat', type=int, default=3)
+    args_parser.add_argument('--no-memory', action='store_true')
+    args_parser.add_argument('--save-baseline', metavar='NAME')
+    args_parser.add_argument('--compare', metavar='NAME')
+    args_parser.add_argument('--tolerance', type=float, default=0.1)
+    args = args_parser.parse_args()
+
+    sizes = sorted(args.sizes)
+    report = {'sizes': {}, 'end_to_end': None}
+    for lines in sizes:
+        stages = measure_size(lines, args.repeat, not args.no_memory)
+        report['sizes'][str(lines)] = stages
+        for name, result in stages.items():
+            peak = result['peak_bytes']
+            print('%8d lines  %-8s %8.3f s  %12.0f %s/s%s' % (
+                result['lines'], name, result['seconds'], result['throughput'], result['unit'],
+                '' if peak is None else '  peak %8.1f MiB' % (peak / 2 ** 20),
+            ))
+
+    if args.files:
+        end_to_end = report['end_to_end'] = measure_end_to_end(args.files, args.file_lines, args.repeat)
+        print('end-to-end  %d files of %d lines  %8.3f s  %8.1f files/s' % (
+            end_to_end['files'], end_to_end['lines'], end_to_end['seconds'], end_to_end['throughput'],
+        ))
+
+    failed = False
+    if len(sizes) > 1:
+        for warning in check_scaling(sizes, {lines: report['sizes'][str(lines)] for lines in sizes}):
+            print('WARNING: ' + warning)
+
+    if args.compare:
+        with open(baseline_path(args.compare)) as fp:
+            regressions = compare(report, json.load(fp), args.tolerance)
+        if regressions:
+            print('%d metrics regressed by more than %.0f%%' % (len(regressions), args.tolerance * 100))
+            failed = True
+
+    if args.save_baseline:
+        path = baseline_path(args.save_baseline)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as fp:
+            json.dump(report, fp, indent=2)
+        print('baseline saved to %s' % path)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import random
+
+INTEGER_TYPES = ('byte', 'short', 'int', 'long', 'ubyte', 'ushort', 'uint', 'ulong')
+
+BINARY_OPERATORS = ('+', '-', '*', '/', '%', '&', '^', '|', '==', '<', '>', '<=', '>=', '!=', '&&', '||')
+
+UNARY_OPERATORS = ('-', '+', '~', '!')
+
+
+class ProgramGenerator:
+    def __init__(self, seed=0, expression_depth=4, block_depth=3, statements=6):
+        self.random = random.Random(seed)
+        self.expression_depth = expression_depth
+        self.block_depth = block_depth
+        self.statements = statements
+        self.functions = []
+
+    def expression(self, names, depth=None):
+        if depth is None:
+            depth = self.expression_depth
+
+        choice = self.random.random()
+        if depth <= 0 or choice < 0.2:
+            if names and self.random.random() < 0.6:
+                return self.random.choice(names)
+            return str(self.random.randrange(0, 1000))
+        elif choice < 0.3:
+            return '%s%s' % (self.random.choice(UNARY_OPERATORS), self.expression(names, depth - 1))
+        elif choice < 0.4:
+            return '(%s)' % self.expression(names, depth - 1)
+        elif choice < 0.5 and self.functions:
+            name, arity = self.random.choice(self.functions)
+            return '%s(%s)' % (name, ', '.join(self.expression(names, depth - 1) for _ in range(arity)))
+        return '%s %s %s' % (
+            self.expression(names, depth - 1),
+            self.random.choice(BINARY_OPERATORS),
+            self.expression(names, depth - 1),
+        )
+
+    def block(self, names, indent, depth):
+        lines = []
+        names = list(names)
+        for _ in range(self.random.randint(1, self.statements)):
+            choice = self.random.random()
+            prefix = '    ' * indent
+            if depth > 0 and choice < 0.15:
+                lines.append('%sif %s:' % (prefix, self.expression(names)))
+                lines.extend(self.block(names, indent + 1, depth - 1))
+                if self.random.random() < 0.5:
+                    lines.append('%selse:' % prefix)
+                    lines.extend(self.block(names, indent + 1, depth - 1))
+            elif depth > 0 and choice < 0.25:
+                lines.append('%swhile %s:' % (prefix, self.expression(names)))
+                lines.extend(self.block(names, indent + 1, depth - 1))
+            elif depth > 0 and choice < 0.3:
+                name = 'i%d' % self.random.randrange(1 << 30)
+                if self.random.random() < 0.3:
+                    lines.append('%s@loop(unroll=%d, vectorize=%d)' % (
+                        prefix, self.random.randint(1, 8), self.random.choice((1, 2, 4, 8)),
+                    ))
+                lines.append('%sfor %s in range(%s, %s):' % (
+                    prefix, name, self.expression(names), self.expression(names),
+                ))
+                lines.extend(self.block(names + [name], indent + 1, depth - 1))
+            elif choice < 0.8:
+                name = 'v%d' % self.random.randrange(1 << 30)
+                lines.append('%s%s %s: %s = %s' % (
+                    prefix, self.random.choice(('let', 'var')), name, self.random.choice(INTEGER_TYPES),
+                    self.expression(names),
+                ))
+                names.append(name)
+            elif choice < 0.9 and names:
+                lines.append('%s%s = %s' % (prefix, self.random.choice(names), self.expression(names)))
+            else:
+                lines.append('%s%s' % (prefix, self.expression(names)))
+        lines.append('%sreturn %s' % ('    ' * indent, self.expression(names)))
+        return lines
+
+    def function(self, index):
+        arity = self.random.randint(0, 4)
+        name = 'f%d' % index
+        arguments = ['a%d' % i for i in range(arity)]
+        lines = []
+        if self.random.random() < 0.1:
+            lines.append('@target_clones(avx2, sse4_2)')
+        lines.append('def %s(%s) -> int:' % (name, ', '.join('%s: int' % arg for arg in arguments)))
+        lines.extend(self.block(arguments, 1, self.block_depth))
+        lines.append('')
+        self.functions.append((name, arity))
+        return lines
+
+    def program(self, functions):
+        lines = []
+        for index in range(functions):
+            lines.extend(self.function(index))
+        return '\n'.join(lines) + '\n'
+
+
+def generate_program(functions, seed=0, **kwargs):
+    return ProgramGenerator(seed=seed, **kwargs).program(functions)
+
+
+SIGNED_TYPES = ('byte', 'short', 'int', 'long')
+
+ARITHMETIC_OPERATORS = ('+', '-', '*', '&', '^', '|')
+
+COMPARISON_OPERATORS = ('==', '<', '>', '<=', '>=', '!=')
+
+
+class CompilableProgramGenerator:
+    def __init__(self, seed=0, expression_depth=4, block_depth=3, statements=8):
+        self.random = random.Random(seed)
+        self.expression_depth = expression_depth
+        self.block_depth = block_depth
+        self.statements = statements
+        self.functions = []
+        self.counter = 0
+        self.expressions = 0
+
+    def fresh_name(self, prefix):
+        self.counter += 1
+        return '%s%d' % (prefix, self.counter)
+
+    def operand(self, names, dtype):
+        if names.get(dtype) and self.random.random() < 0.7:
+            return self.random.choice(names[dtype])
+        return str(self.random.randrange(0, 100))
+
+    def expression(self, names, dtype, depth=None):
+        if depth is None:
+            depth = self.expression_depth
+
+        choice = self.random.random()
+        if depth <= 0 or choice < 0.2:
+            return self.operand(names, dtype)
+
+        self.expressions += 1
+        if choice < 0.3:
+            source_type = self.random.choice(INTEGER_TYPES)
+            return '%s(%s)' % (dtype, self.expression(names, source_type, depth - 1))
+        elif choice < 0.35 and dtype in SIGNED_TYPES:
+            return '%s(%s)' % (self.random.choice(('-', '~')), self.typed_expression(names, dtype, depth - 1))
+        elif choice < 0.4 and self.functions:
+            name, arg_types = self.random.choice(self.functions)
+            call = '%s(%s)' % (name, ', '.join(self.expression(names, arg_type, depth - 1) for arg_type in arg_types))
+            return call if dtype == 'int' else '%s(%s)' % (dtype, call)
+        elif choice < 0.45:
+            return '%s %s %d' % (
+                self.typed_expression(names, dtype, depth - 1), self.random.choice('/%'), self.random.randint(1, 9),
+            )
+        return '(%s %s %s)' % (
+            self.typed_expression(names, dtype, depth - 1),
+            self.random.choice(ARITHMETIC_OPERATORS),
+            self.expression(names, dtype, depth - 1),
+        )
+
+    def typed_expression(self, names, dtype, depth):
+        # a typed operand makes constant subexpressions wrap instead of overflowing the declared type
+        result = self.expression(names, dtype, depth)
+        return '%s(%s)' % (dtype, result) if result.isdigit() else result
+
+    def condition(self, names):
+        self.expressions += 1
+        dtype = self.random.choice(INTEGER_TYPES)
+        comparison = '%s %s %s' % (
+            self.expression(names, dtype, 2),
+            self.random.choice(COMPARISON_OPERATORS),
+            self.expression(names, dtype, 2),
+        )
+        if self.random.random() < 0.3:
+            self.expressions += 1
+            return '%s %s %s' % (comparison, self.random.choice(('&&', '||')), self.condition(names))
+        return comparison
+
+    def block(self, names, indent, depth):
+        lines = []
+        names = {dtype: list(pool) for dtype, pool in names.items()}
+        variables = []
+        prefix = '    ' * indent
+        for _ in range(self.random.randint(1, self.statements)):
+            choice = self.random.random()
+            if depth > 0 and choice < 0.15:
+                lines.append('%sif %s:' % (prefix, self.condition(names)))
+                lines.extend(self.block(names, indent + 1, depth - 1))
+                if self.random.random() < 0.5:
+                    lines.append('%selse:' % prefix)
+                    lines.extend(self.block(names, indent + 1, depth - 1))
+            elif depth > 0 and choice < 0.25:
+                counter = self.fresh_name('i')
+                lines.append('%svar %s: int = 0' % (prefix, counter))
+                lines.append('%swhile %s < %d && %s:' % (
+                    prefix, counter, self.random.randint(2, 100), self.condition(names),
+                ))
+                body = self.block(names, indent + 1, depth - 1)
+                body.append('%s    %s = %s + 1' % (prefix, counter, counter))
+                lines.extend(body)
+            elif choice < 0.4 and variables:
+                name, dtype = self.random.choice(variables)
+                lines.append('%s%s = %s' % (prefix, name, self.expression(names, dtype)))
+            else:
+                dtype = self.random.choice(INTEGER_TYPES)
+                keyword = 'var' if self.random.random() < 0.2 else 'let'
+                name = self.fresh_name('v')
+                lines.append('%s%s %s: %s = %s' % (prefix, keyword, name, dtype, self.expression(names, dtype)))
+                names.setdefault(dtype, []).append(name)
+                if keyword == 'var':
+                    variables.append((name, dtype))
+        return lines
+
+    def function(self, index):
+        name = 'f%d' % index
+        arg_types = [self.random.choice(INTEGER_TYPES) for _ in range(self.random.randint(0, 3))]
+        names = {}
+        arguments = []
+        for position, dtype in enumerate(arg_types):
+            names.setdefault(dtype, []).append('a%d' % position)
+            arguments.append('a%d: %s' % (position, dtype))
+
+        lines = ['def %s(%s) -> int:' % (name, ', '.join(arguments))]
+        body = self.block(names, 1, self.block_depth)
+        lines.extend(body)
+        lines.append('    return int(%s)' % self.expression(names, self.random.choice(INTEGER_TYPES)))
+        lines.append('')
+        self.functions.append((name, arg_types))
+        return lines
+
+    def program(self, lines=0, expressions=0):
+        result = []
+        index = 0
+        while len(result) < lines or self.expressions < expressions:
+            result.extend(self.function(index))
+            index += 1
+        return '\n'.join(result) + '\n'
+
+
+def generate_compilable_program(lines, seed=0, **kwargs):
+    return CompilableProgramGenerator(seed=seed, **kwargs).program(lines)
@@ -0,0 +1,84 @@
+import argparse
+import array
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sspc import jit  # noqa: E402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def python_z(x):
+    return 100 <= x < 200 and x != 0
+
+
+def numpy_z(x):
+    return (x >= 100) & (x < 200) & (x != 0)
+
+
+def best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def report(label, elements, elapsed):
+    print('%-16s %11d elements  %8.3f s  %8.2f ns/element' % (label, elements, elapsed, elapsed / elements * 1e9))
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument('--elements', type=int, default=10 ** 7)
+    args_parser.add_argument('--python-elements', type=int, default=10 ** 6)
+    args_parser.add_argument('-n', '--repeat', type=int, default=3)
+    args = args_parser.parse_args()
+
+    with open(os.path.join(ROOT, 'test.ssp')) as fp:
+        source = fp.read()
+
+    start = time.perf_counter()
+    z = jit.vectorize(source, 'z')
+    print('vectorize(z) compiled in %.3f s' % (time.perf_counter() - start))
+
+    python_values = [index % 300 for index in range(min(args.python_elements, args.elements))]
+    elapsed, expected = best_of(args.repeat, lambda: [python_z(x) for x in python_values])
+    report('python', len(python_values), elapsed)
+
+    if numpy is None:
+        values = array.array('i', (index % 300 for index in range(args.elements)))
+        elapsed, result = best_of(args.repeat, z, values)
+        assert list(result[:len(expected)]) == expected
+        report('sspc', len(values), elapsed)
+        print('numpy is not installed, skipping the numpy comparison')
+        return
+
+    values = (numpy.arange(args.elements, dtype=numpy.int32) % 300).astype(numpy.int32)
+    out = numpy.empty(args.elements, dtype=bool)
+    elapsed, reference = best_of(args.repeat, numpy_z, values)
+    report('numpy', args.elements, elapsed)
+    elapsed, result = best_of(args.repeat, z, values)
+    report('sspc', args.elements, elapsed)
+    elapsed, _ = best_of(args.repeat, lambda: z(values, out=out))
+    report('sspc out=', args.elements, elapsed)
+    elapsed, strided = best_of(args.repeat, z, values[::2])
+    report('sspc strided', len(strided), elapsed)
+
+    assert result.tolist()[:len(expected)] == expected
+    assert numpy.array_equal(result, reference)
+    assert numpy.array_equal(out, reference)
+    assert numpy.array_equal(strided, reference[::2])
+
+
+if __name__ == '__main__':
+    main()
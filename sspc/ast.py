@@ -1,7 +1,14 @@
 from collections import namedtuple
 
 module = namedtuple('Module', ['declarations'])
-function_declaration = namedtuple('FunctionDeclaration', ['name', 'arguments', 'return_type', 'body'])
+function_declaration = namedtuple(
+    'FunctionDeclaration', ['name', 'arguments', 'return_type', 'body', 'decorators'], defaults=((),),
+)
 argument = namedtuple('Argument', ['name', 'type'])
+decorator = namedtuple('Decorator', ['name', 'args'])
+decorator_argument = namedtuple('DecoratorArgument', ['name', 'value'])
+import_declaration = namedtuple('ImportDeclaration', ['name', 'interface'], defaults=(None,))
 
-assign = namedtuple('Assign', ['l', 'r'])
+# pickle looks node types up by qualified name, which differs from the type name shown in repr()
+for _name in ('module', 'function_declaration', 'argument', 'decorator', 'decorator_argument', 'import_declaration'):
+    globals()[_name].__qualname__ = _name
@@ -0,0 +1,158 @@
+import subprocess
+
+import llvmlite.binding as llvm
+
+from sspc import multiversion
+
+_initialized = False
+
+
+def initialize():
+    global _initialized
+    if _initialized:
+        return
+
+    llvm.initialize()
+    llvm.initialize_native_target()
+    llvm.initialize_native_asmprinter()
+    llvm.initialize_native_asmparser()
+    _initialized = True
+
+
+def resolve_cpu(cpu='', features=''):
+    if cpu == 'native':
+        cpu = llvm.get_host_cpu_name()
+        host_features = llvm.get_host_cpu_features().flatten()
+        features = ','.join(filter(None, (host_features, features)))
+    return cpu or '', features or ''
+
+
+def create_target_machine(opt_level=2, jit=False, cpu='', features='', reloc=None, codemodel=None, codegen_opt=None):
+    initialize()
+    cpu, features = resolve_cpu(cpu, features)
+    if reloc is None:
+        reloc = 'default' if jit else 'pic'
+    if codemodel is None:
+        codemodel = 'jitdefault' if jit else 'default'
+    if codegen_opt is None:
+        codegen_opt = opt_level
+
+    target = llvm.Target.from_default_triple()
+    target_machine = target.create_target_machine(
+        cpu=cpu, features=features, opt=codegen_opt, reloc=reloc, codemodel=codemodel,
+    )
+    target_machine.options = '%s|%s|%s|%s|%d' % (cpu, features, reloc, codemodel, codegen_opt)
+    return target_machine
+
+
+def prepare_module(module_ir, target_machine):
+    multiversion.check_target(module_ir, target_machine.triple)
+    module_ir.triple = target_machine.triple
+    module_ir.data_layout = str(target_machine.target_data)
+
+
+def iter_module_ir(module_ir):
+    yield '; ModuleID = "%s"\n' % module_ir.name
+    yield 'target triple = "%s"\n' % module_ir.triple
+    yield 'target datalayout = "%s"\n\n' % module_ir.data_layout
+    for identified_type in module_ir.get_identified_types().values():
+        yield identified_type.get_declaration() + '\n'
+    for value in module_ir.globals.values():
+        yield str(value) + '\n'
+        release_text(value)
+    for line in module_ir._get_metadata_lines():
+        yield line + '\n'
+
+
+def release_text(value):
+    # llvmlite caches the text of every value and instruction on the object itself
+    for block in getattr(value, 'blocks', ()):
+        for instruction in block.instructions:
+            instruction._clear_string_cache()
+    if hasattr(value, '_clear_string_cache'):
+        value._clear_string_cache()
+
+
+def module_ir_text(module_ir):
+    return ''.join(iter_module_ir(module_ir))
+
+
+def parse_module(module_ir_text):
+    initialize()
+    module_ref = llvm.parse_assembly(module_ir_text)
+    module_ref.verify()
+    return module_ref
+
+
+def parse_bitcode(bitcode):
+    initialize()
+    return llvm.parse_bitcode(bitcode)
+
+
+def _inlining_threshold(opt_level, size_level):
+    if size_level == 1:
+        return 50
+    elif size_level > 1:
+        return 25
+    elif opt_level > 2:
+        return 250
+    return 225
+
+
+def create_pass_manager_builder(opt_level, size_level):
+    pmb = llvm.create_pass_manager_builder()
+    pmb.opt_level = opt_level
+    pmb.size_level = size_level
+    pmb.inlining_threshold = _inlining_threshold(opt_level, size_level)
+    pmb.loop_vectorize = opt_level >= 2
+    pmb.slp_vectorize = opt_level >= 2 and size_level == 0
+    return pmb
+
+
+def optimize_module(module_ref, target_machine, opt_level, size_level=0):
+    if opt_level == 0 and size_level == 0:
+        return module_ref
+
+    pmb = create_pass_manager_builder(opt_level, size_level)
+    fpm = llvm.create_function_pass_manager(module_ref)
+    target_machine.add_analysis_passes(fpm)
+    pmb.populate(fpm)
+    fpm.initialize()
+    for func in module_ref.functions:
+        fpm.run(func)
+    fpm.finalize()
+
+    return optimize_linked_module(module_ref, target_machine, opt_level, size_level, pmb)
+
+
+def optimize_linked_module(module_ref, target_machine, opt_level, size_level=0, pmb=None):
+    if opt_level == 0 and size_level == 0:
+        return module_ref
+
+    mpm = llvm.create_module_pass_manager()
+    target_machine.add_analysis_passes(mpm)
+    (pmb or create_pass_manager_builder(opt_level, size_level)).populate(mpm)
+    mpm.run(module_ref)
+    return module_ref
+
+
+def emit_object(module_ref, target_machine):
+    return target_machine.emit_object(module_ref)
+
+
+def emit_object_llc(module_ir_raw, opt_level=2, cpu='', features='', reloc='pic'):
+    command = ['llc', '-filetype=obj', '-O%d' % opt_level, '-relocation-model=' + reloc]
+    if cpu:
+        command.append('-mcpu=' + cpu)
+    if features:
+        command.append('-mattr=' + features)
+    result = subprocess.run([*command, '-'], input=module_ir_raw, stdout=subprocess.PIPE, check=True)
+    return result.stdout + b'\0' * 512
+
+
+def link_executable(object_path, output_path, extra_objects=()):
+    subprocess.run(['gcc', object_path, *extra_objects, '-o', output_path], check=True)
+
+
+def link_shared(object_path, output_path, extra_objects=()):
+    subprocess.run(['gcc', '-shared', object_path, *extra_objects, '-o', output_path], check=True)
@@ -0,0 +1,350 @@
+import copy
+import hashlib
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from sspc import interface, lto, timing
+from sspc.errors import CompileError
+from sspc.source import load_source
+
+SOURCE_SUFFIX = '.ssp'
+STATE_FILE = 'state.json'
+
+BuildModule = namedtuple('BuildModule', ['name', 'path', 'digest', 'imports'])
+
+
+def find_module(name, search_path):
+    for directory in search_path:
+        path = os.path.join(directory, name + SOURCE_SUFFIX)
+        if os.path.isfile(path):
+            return path
+    raise CompileError('Cannot find module %s%s' % (name, SOURCE_SUFFIX))
+
+
+def module_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def scan_modules(roots, search_path):
+    modules = {}
+    pending = [(module_name(path), path) for path in reversed(roots)]
+    while pending:
+        name, path = pending.pop()
+        if name in modules:
+            if os.path.abspath(modules[name].path) != os.path.abspath(path):
+                raise CompileError('Module %s is defined by both %s and %s' % (name, modules[name].path, path))
+            continue
+
+        source = bytes(load_source(path))
+        imports = list(dict.fromkeys(interface.scan_imports(source)))
+        modules[name] = BuildModule(name, path, hashlib.sha256(source).hexdigest(), imports)
+        for imported in reversed(imports):
+            if imported not in modules:
+                pending.append((imported, find_module(imported, search_path)))
+    return modules
+
+
+def topological_order(modules):
+    order = []
+    state = {}
+    for root in modules:
+        if root in state:
+            continue
+        stack = [(root, iter(modules[root].imports))]
+        state[root] = 'visiting'
+        while stack:
+            name, imports = stack[-1]
+            for imported in imports:
+                if state.get(imported) == 'visiting':
+                    raise CompileError('Import cycle between %s and %s' % (name, imported))
+                if imported not in state:
+                    state[imported] = 'visiting'
+                    stack.append((imported, iter(modules[imported].imports)))
+                    break
+            else:
+                stack.pop()
+                state[name] = 'done'
+                order.append(name)
+    return order
+
+
+def build_salt(args):
+    from sspc.incremental import compiler_fingerprint
+    from sspc.main import target_options
+
+    options = dict(target_options(args), opt_level=args.opt_level, backend=args.backend, lto=args.lto)
+    return compiler_fingerprint() + json.dumps(options, sort_keys=True)
+
+
+def module_key(module, salt, interface_hashes):
+    digest = hashlib.sha256(salt.encode())
+    digest.update(module.digest.encode())
+    for name in module.imports:
+        digest.update(('\0%s:%s' % (name, interface_hashes[name])).encode())
+    return digest.hexdigest()
+
+
+class BuildState:
+    def __init__(self, build_dir):
+        self.path = os.path.join(build_dir, STATE_FILE)
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        self.modules = data.get('modules', {})
+        self.partitions = data.get('partitions', {})
+        self.link = data.get('link')
+
+    def save(self):
+        tmp_path = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(tmp_path, 'w') as fp:
+            data = {'modules': self.modules, 'partitions': self.partitions, 'link': self.link}
+            json.dump(data, fp, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+_worker_state = None
+
+
+def _init_worker():
+    global _worker_state
+    from sspc import backend
+
+    backend.initialize()
+    _worker_state = ({}, {})
+
+
+def module_output(args, build_dir, name):
+    return os.path.join(build_dir, name + ('.bc' if args.lto else '.o'))
+
+
+def write_atomic(path, data):
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as fp:
+        fp.write(data)
+    os.replace(tmp_path, path)
+
+
+def _target_machine(args):
+    from sspc import main
+
+    if _worker_state is None:
+        _init_worker()
+    _, target_machines = _worker_state
+    key = json.dumps(main.target_options(args), sort_keys=True) + args.opt_level
+    if key not in target_machines:
+        target_machines[key] = main.create_target_machine(args)
+    return target_machines[key]
+
+
+def _compile_module(args, name, path, build_dir):
+    from sspc import main
+    from sspc.parser.parser import Parser
+    from sspc.source import parse_sources
+
+    target_machine = _target_machine(args)
+    parsers, _ = _worker_state
+    parser_key = (args.parser, args.lexer)
+    if parser_key not in parsers:
+        parsers[parser_key] = Parser(engine=args.parser, lexer=args.lexer)
+
+    with timing.function(name):
+        try:
+            module_ast = parse_sources(parsers[parser_key], [load_source(path)])
+        except SyntaxError as error:
+            raise SyntaxError('%s: %s' % (path, error)) from None
+        module_ast = interface.resolve_imports(module_ast, [build_dir])
+        module_ref = main.build_optimized_module(args, module_ast, target_machine)
+        if args.lto:
+            output = module_ref.as_bitcode()
+        else:
+            output = main.emit_object_code(args, module_ref, target_machine)
+
+    object_path = module_output(args, build_dir, name)
+    write_atomic(object_path, output)
+    interface_path = os.path.join(build_dir, name + interface.SUFFIX)
+    interface.write_interface(interface_path, interface.describe(module_ast), object_path)
+    return name
+
+
+def build_modules(args, modules, order, build_dir, state):
+    salt = build_salt(args)
+    jobs = args.jobs or os.cpu_count() or 1
+    args = copy.copy(args)
+    args.jobs = None
+    remaining = {name: set(modules[name].imports) for name in order}
+    dependents = {name: [] for name in order}
+    for name in order:
+        for imported in modules[name].imports:
+            dependents[imported].append(name)
+
+    interface_hashes = {}
+    ready = [name for name in order if not remaining[name]]
+    compiled = []
+    running = {}
+    executor = None
+
+    def finish(name):
+        interface_path = os.path.join(build_dir, name + interface.SUFFIX)
+        interface_hashes[name] = interface.load_interface(interface_path)['hash']
+        for dependent in dependents[name]:
+            remaining[dependent].discard(name)
+            if not remaining[dependent]:
+                ready.append(dependent)
+
+    try:
+        while ready or running:
+            while ready:
+                name = ready.pop(0)
+                key = module_key(modules[name], salt, interface_hashes)
+                object_path = module_output(args, build_dir, name)
+                interface_path = os.path.join(build_dir, name + interface.SUFFIX)
+                if state.modules.get(name) == key and os.path.exists(object_path) and os.path.exists(interface_path):
+                    finish(name)
+                    continue
+
+                state.modules.pop(name, None)
+                if jobs > 1:
+                    if executor is None:
+                        executor = ProcessPoolExecutor(jobs, initializer=_init_worker)
+                    running[executor.submit(_compile_module, args, name, modules[name].path, build_dir)] = key
+                else:
+                    _compile_module(args, name, modules[name].path, build_dir)
+                    state.modules[name] = key
+                    compiled.append(name)
+                    finish(name)
+
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                failed = None
+                for future in done:
+                    key = running.pop(future)
+                    if future.exception() is not None:
+                        failed = failed or future
+                        continue
+                    name = future.result()
+                    state.modules[name] = key
+                    compiled.append(name)
+                    finish(name)
+                if failed is not None:
+                    failed.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        state.save()
+    return compiled
+
+
+def _lto_partition(args, name, imports, exported, build_dir):
+    from sspc import main
+    from sspc.lto import link_partition
+
+    target_machine = _target_machine(args)
+    bitcodes = []
+    for module in (name, *imports):
+        with open(module_output(args, build_dir, module), 'rb') as fp:
+            bitcodes.append(fp.read())
+
+    opt_level, size_level = main.OPT_LEVELS[args.opt_level]
+    with timing.function(name):
+        module_ref = link_partition(bitcodes[0], bitcodes[1:], target_machine, opt_level, size_level, exported)
+        object_code = main.emit_object_code(args, module_ref, target_machine)
+    write_atomic(os.path.join(build_dir, name + '.thin.o'), object_code)
+    return name
+
+
+def link_thin(args, modules, order, build_dir, state):
+    jobs = args.jobs or os.cpu_count() or 1
+    args = copy.copy(args)
+    args.jobs = None
+    imported = {imported for name in order for imported in modules[name].imports}
+
+    pending = []
+    for name in order:
+        imports = modules[name].imports
+        exported = None if name in imported else lto.ENTRY_POINTS
+        key = hashlib.sha256(json.dumps([state.modules[module] for module in (name, *imports)]).encode()).hexdigest()
+        if state.partitions.get(name) == key and os.path.exists(os.path.join(build_dir, name + '.thin.o')):
+            continue
+        state.partitions.pop(name, None)
+        pending.append((name, imports, exported, key))
+
+    try:
+        if jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(min(jobs, len(pending)), initializer=_init_worker) as executor:
+                futures = [
+                    (executor.submit(_lto_partition, args, name, imports, exported, build_dir), name, key)
+                    for name, imports, exported, key in pending
+                ]
+                for future, name, key in futures:
+                    future.result()
+                    state.partitions[name] = key
+        else:
+            for name, imports, exported, key in pending:
+                _lto_partition(args, name, imports, exported, build_dir)
+                state.partitions[name] = key
+    finally:
+        state.save()
+    return [os.path.join(build_dir, name + '.thin.o') for name in reversed(order)], len(pending)
+
+
+def link_full(args, order, build_dir, output):
+    from sspc import main
+
+    bitcodes = []
+    for name in order:
+        with open(module_output(args, build_dir, name), 'rb') as fp:
+            bitcodes.append(fp.read())
+
+    target_machine = _target_machine(args)
+    opt_level, size_level = main.OPT_LEVELS[args.opt_level]
+    module_ref = lto.link_full(bitcodes, target_machine, opt_level, size_level)
+    object_path = os.path.join(build_dir, module_name(output) + '.lto.o')
+    write_atomic(object_path, main.emit_object_code(args, module_ref, target_machine))
+    return [object_path]
+
+
+def build_command(args):
+    from sspc import backend
+    from sspc.main import args_parser, import_search_path
+
+    if '-' in args.sources:
+        args_parser.error('sspc build cannot read modules from stdin')
+    build_dir = args.build_dir
+    os.makedirs(build_dir, exist_ok=True)
+
+    with timing.phase('scan'):
+        modules = scan_modules(args.sources, import_search_path(args))
+        order = topological_order(modules)
+
+    state = BuildState(build_dir)
+    with timing.phase('compile-modules'):
+        compiled = build_modules(args, modules, order, build_dir, state)
+
+    output = args.output or module_name(args.sources[0])
+    changed = len(compiled)
+    if args.lto == 'thin':
+        with timing.phase('lto-partitions'):
+            objects, changed = link_thin(args, modules, order, build_dir, state)
+
+    link_key = hashlib.sha256(json.dumps([output, [state.modules[name] for name in order]]).encode()).hexdigest()
+    relinked = False
+    if changed or state.link != link_key or not os.path.exists(output):
+        if args.lto == 'full':
+            with timing.phase('lto-link'):
+                objects = link_full(args, order, build_dir, output)
+        elif not args.lto:
+            objects = [os.path.join(build_dir, name + '.o') for name in reversed(order)]
+        with timing.phase('link'):
+            backend.link_executable(objects[0], output, objects[1:])
+        state.link = link_key
+        state.save()
+        relinked = True
+
+    if args.trace:
+        print('build: %d modules, %d compiled, %s' % (
+            len(order), len(compiled), 'linked ' + output if relinked else output + ' is up to date',
+        ))
@@ -0,0 +1,125 @@
+import keyword
+import os
+import re
+
+import llvmlite.ir as ir
+
+from sspc import datatypes
+from sspc.interface import ENTRY_POINT
+
+C_INCLUDES = ('stdbool.h', 'stdint.h')
+
+LOCAL_DEFINITION = 'dso_local'
+
+
+class AbiFunction(ir.Function):
+    # llvmlite has no field for preemption specifiers, they go right after the linkage of a definition
+    preemption = ''
+
+    def descr_prototype(self, buf):
+        prototype = []
+        super().descr_prototype(prototype)
+        if self.preemption and self.blocks:
+            head = ' '.join(word for word in ('define', self.linkage) if word)
+            prototype[0] = '%s %s%s' % (head, self.preemption, prototype[0][len(head):])
+        buf.extend(prototype)
+
+
+def c_type(dtype):
+    if isinstance(dtype, ir.VoidType):
+        return 'void'
+    elif isinstance(dtype, datatypes.Boolean):
+        return 'bool'
+    elif isinstance(dtype, datatypes.Integer):
+        return '%sint%d_t' % ('u' if dtype.is_unsigned else '', dtype.width)
+    raise TypeError('Type %s has no C equivalent' % dtype)
+
+
+def ctypes_type(dtype):
+    if isinstance(dtype, ir.VoidType):
+        return 'None'
+    elif isinstance(dtype, datatypes.Boolean):
+        return 'ctypes.c_bool'
+    elif isinstance(dtype, datatypes.Integer):
+        return 'ctypes.c_%sint%d' % ('u' if dtype.is_unsigned else '', dtype.width)
+    raise TypeError('Type %s has no ctypes equivalent' % dtype)
+
+
+def extension_attribute(dtype):
+    if isinstance(dtype, datatypes.Boolean):
+        return 'zeroext'
+    elif isinstance(dtype, datatypes.Integer) and dtype.width < 32:
+        return 'zeroext' if dtype.is_unsigned else 'signext'
+    return None
+
+
+def apply_abi_attributes(func):
+    attribute = extension_attribute(func.ftype.return_type)
+    if attribute is not None:
+        func.return_value.add_attribute(attribute)
+    for arg in func.args:
+        attribute = extension_attribute(arg.type)
+        if attribute is not None:
+            arg.add_attribute(attribute)
+
+
+def mark_local_definition(func):
+    if not func.linkage:
+        func.preemption = LOCAL_DEFINITION
+
+
+def exported_functions(module_ast):
+    from sspc.compiler import create_module_context, declare_function, iter_function_declarations
+
+    module = ir.Module('exports')
+    context = create_module_context()
+    return [
+        (decl, declare_function(decl, module, context))
+        for decl in iter_function_declarations(module_ast)
+        if decl.name != ENTRY_POINT
+    ]
+
+
+def header_guard(path):
+    return re.sub(r'[^A-Z0-9]', '_', os.path.basename(path).upper())
+
+
+def write_header(path, module_ast, sources=()):
+    lines = ['/* Generated by sspc from %s; do not edit. */' % (', '.join(sources) or 'stdin')]
+    guard = header_guard(path)
+    lines += ['#ifndef %s' % guard, '#define %s' % guard, '']
+    lines += ['#include <%s>' % include for include in C_INCLUDES]
+    lines += ['', '#ifdef __cplusplus', 'extern "C" {', '#endif', '']
+    for decl, func in exported_functions(module_ast):
+        arguments = ', '.join(
+            '%s %s' % (c_type(arg.type), arg_ast.name)
+            for arg, arg_ast in zip(func.args, decl.arguments)
+        )
+        lines.append('%s %s(%s);' % (c_type(func.ftype.return_type), decl.name, arguments or 'void'))
+    lines += ['', '#ifdef __cplusplus', '}', '#endif', '', '#endif', '']
+
+    with open(path, 'w') as fp:
+        fp.write('\n'.join(lines))
+
+
+def write_ctypes_stub(path, library_path, module_ast, sources=()):
+    library = os.path.relpath(os.path.abspath(library_path), os.path.dirname(os.path.abspath(path)))
+    lines = [
+        '# Generated by sspc from %s; do not edit.' % (', '.join(sources) or 'stdin'),
+        'import ctypes',
+        'import os',
+        '',
+        '_library = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), %r))' % library,
+    ]
+    for decl, func in exported_functions(module_ast):
+        name = decl.name + '_' if keyword.iskeyword(decl.name) else decl.name
+        lines += [
+            '',
+            '%s = _library[%r]' % (name, decl.name),
+            '%s.argtypes = [%s]' % (name, ', '.join(ctypes_type(arg.type) for arg in func.args)),
+            '%s.restype = %s' % (name, ctypes_type(func.ftype.return_type)),
+        ]
+    lines.append('')
+
+    with open(path, 'w') as fp:
+        fp.write('\n'.join(lines))
@@ -0,0 +1,40 @@
+import os
+
+
+def default_cache_dir():
+    cache_dir = os.environ.get('SSPC_CACHE_DIR')
+    if cache_dir:
+        return cache_dir
+    base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'sspc')
+
+
+class DiskCache:
+    suffix = '.bin'
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key[:2], key[2:] + self.suffix)
+
+    def load(self, key):
+        try:
+            with open(self._entry_path(key), 'rb') as fp:
+                data = fp.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def store(self, key, data):
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        tmp_path = '%s.%d.tmp' % (entry_path, os.getpid())
+        with open(tmp_path, 'wb') as fp:
+            fp.write(data)
+        os.replace(tmp_path, entry_path)
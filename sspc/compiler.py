@@ -1,58 +1,142 @@
+from collections import namedtuple
+
 import llvmlite.ir as ir
 
-import sspc.datatypes
-from sspc import ast, datatypes
+from sspc import ast, datatypes, multiversion, timing
+from sspc.cabi import AbiFunction, apply_abi_attributes, mark_local_definition
 from sspc.context import Context, FunctionContext
+from sspc.errors import CompileError, DuplicatedNameError
+from sspc.folding import fold
 
+ImportedModule = namedtuple('ImportedModule', ['name', 'symbols'])
 
-def compile_function(function_ast, module, parent_context):
+
+def create_module_context():
+    context = Context()
+    for name, symbol in (
+        ('ubyte', datatypes.Integer(8, True)),
+        ('ushort', datatypes.Integer(16, True)),
+        ('uint', datatypes.Integer(32, True)),
+        ('ulong', datatypes.Integer(64, True)),
+        ('byte', datatypes.Integer(8, False)),
+        ('short', datatypes.Integer(16, False)),
+        ('int', datatypes.Integer(32, False)),
+        ('long', datatypes.Integer(64, False)),
+        ('bool', datatypes.BOOL),
+    ):
+        context.register(name, symbol)
+    return context
+
+
+def iter_function_declarations(module_ast: ast.module):
+    for decl in module_ast.declarations:
+        if isinstance(decl, ast.function_declaration):
+            yield decl
+
+
+def iter_import_declarations(module_ast: ast.module):
+    for decl in module_ast.declarations:
+        if isinstance(decl, ast.import_declaration):
+            yield decl
+
+
+def create_function(function_ast, module, parent_context):
     return_type = (
         ir.VoidType()
         if function_ast.return_type is None
         else parent_context.find_type(function_ast.return_type)
     )
     func_type = ir.FunctionType(return_type, [parent_context.find_type(arg.type) for arg in function_ast.arguments])
-    func = ir.Function(module, func_type, name=function_ast.name)
+    func = AbiFunction(module, func_type, name=function_ast.name)
+    apply_abi_attributes(func)
+    for arg, arg_ast in zip(func.args, function_ast.arguments):
+        arg.name = arg_ast.name
+    return func
+
+
+def declare_function(function_ast, module, parent_context):
+    if parent_context.is_used(function_ast.name):
+        raise DuplicatedNameError(function_ast.name)
+    func = create_function(function_ast, module, parent_context)
     parent_context.register(function_ast.name, func)
+    return func
+
 
+def import_module(import_ast, module, parent_context):
+    if import_ast.interface is None:
+        raise CompileError('Interface of imported module %s is not loaded' % import_ast.name)
+
+    symbols = {}
+    for function_ast in import_ast.interface:
+        func = module.globals.get(function_ast.name)
+        if func is None:
+            func = create_function(function_ast, module, parent_context)
+        symbols[function_ast.name] = func
+    parent_context.add_import(ImportedModule(import_ast.name, symbols))
+
+
+def define_function(function_ast, func, parent_context):
+    mark_local_definition(func)
+    targets = multiversion.target_clones(function_ast.decorators)
+    if not targets:
+        return define_function_body(function_ast, func, parent_context)
+
+    clones = multiversion.declare_clones(func, targets)
+    for _, clone in clones:
+        define_function_body(function_ast, clone, parent_context)
+    return multiversion.define_dispatcher(func, clones)
+
+
+def define_function_body(function_ast, func, parent_context):
     bb_entry = func.append_basic_block()
     builder = ir.IRBuilder()
     builder.position_at_end(bb_entry)
 
-    for arg, arg_ast in zip(func.args, function_ast.arguments):
-        arg.name = arg_ast.name
-
-    context = FunctionContext(parent_context, builder=builder, func=func)
-    if function_ast.body:
-        for stmt in function_ast.body:
+    body = fold(function_ast.body, parent_context)
+    with FunctionContext(parent_context, builder=builder, func=func) as context:
+        for stmt in body:
             stmt.compile(context)
 
-        last_block = context.builder.function.blocks[-1]
-        if not len(last_block.instructions):
-            context.builder.function.blocks.pop()
-    else:
-        context.builder.ret_void()
+        if not context.builder.block.is_terminated:
+            if isinstance(func.ftype.return_type, ir.VoidType):
+                context.builder.ret_void()
+            else:
+                context.builder.unreachable()
 
     return func
 
 
+def compile_function(function_ast, module, parent_context):
+    func = declare_function(function_ast, module, parent_context)
+    return define_function(function_ast, func, parent_context)
+
+
 def compile_module(module_ast: ast.module):
     module = ir.Module('test')
-    context = Context()
-    context.symbols = {
-        'ubyte': datatypes.Integer(8, True),
-        'ushort': datatypes.Integer(16, True),
-        'uint': datatypes.Integer(32, True),
-        'ulong': datatypes.Integer(64, True),
-        'byte': datatypes.Integer(8, False),
-        'short': datatypes.Integer(16, False),
-        'int': datatypes.Integer(32, False),
-        'long': datatypes.Integer(64, False),
-        'bool': sspc.datatypes.Boolean(),
-    }
+    context = create_module_context()
+    for decl in iter_import_declarations(module_ast):
+        import_module(decl, module, context)
 
-    for decl in module_ast.declarations:
-        if isinstance(decl, ast.function_declaration):
-            compile_function(decl, module, context)
+    functions = [
+        (decl, declare_function(decl, module, context))
+        for decl in iter_function_declarations(module_ast)
+    ]
+    for decl, func in functions:
+        with timing.function(decl.name):
+            define_function(decl, func, context)
+
+    return module
+
+
+def compile_function_unit(function_ast, declarations, name=None, imports=()):
+    module = ir.Module(name or function_ast.name)
+    context = create_module_context()
+    for decl in imports:
+        import_module(decl, module, context)
+
+    for decl in declarations:
+        if decl is not function_ast:
+            declare_function(decl, module, context)
+    compile_function(function_ast, module, context)
 
     return module
@@ -4,19 +4,58 @@ from sspc.errors import CompileError, DuplicatedNameError
 
 
 class Context:
+    inherited_attributes = ('builder', 'func')
+
     def __init__(self, parent=None):
         self.parent = parent
         self.symbols = {}
         self._imports = deque()
         self._basename_map = defaultdict(int)
+        self._bound_names = []
+
+        if parent is None:
+            self.depth = 0
+            self._table = {}
+        else:
+            self.depth = parent.depth + 1
+            self._table = parent._table
+            for name in self.inherited_attributes:
+                if name in parent.__dict__:
+                    self.__dict__[name] = parent.__dict__[name]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        table = self._table
+        for name in reversed(self._bound_names):
+            stack = table[name]
+            for index in range(len(stack) - 1, -1, -1):
+                if stack[index][0] == self.depth:
+                    del stack[index]
+                    break
+            if not stack:
+                del table[name]
+        self._bound_names.clear()
 
     def is_used(self, name):
-        return any(result is not None for result in self._search_sequence(name))
+        return self.find(name) is not None
 
     def find(self, name):
-        for result in self._search_sequence(name):
-            if result is not None:
-                return result
+        stack = self._table.get(name)
+        if not stack:
+            return None
+
+        depth, symbol = stack[-1]
+        if depth <= self.depth:
+            return symbol
+
+        for depth, symbol in reversed(stack):
+            if depth <= self.depth:
+                return symbol
         return None
 
     def find_type(self, name):
@@ -32,8 +71,19 @@ class Context:
             raise DuplicatedNameError(name)
 
         self.symbols[name] = symbol
+        self._bind(name, symbol)
         return name
 
+    def add_import(self, module):
+        self._imports.append(module)
+        for name, symbol in module.symbols.items():
+            if name not in self.symbols:
+                self._bind(name, symbol)
+
+    def _bind(self, name, symbol):
+        self._table.setdefault(name, []).append((self.depth, symbol))
+        self._bound_names.append(name)
+
     def deduplicate(self, name):
         basename = name
         while self.is_used(name):
@@ -42,15 +92,6 @@ class Context:
             name = "{0}.{1}".format(basename, ident)
         return name
 
-    def _search_sequence(self, name):
-        yield self.symbols.get(name)
-
-        for mod in reversed(self._imports):
-            yield mod.find(name)
-
-        if self.parent is not None:
-            yield self.parent.find(name)
-
     def __getattr__(self, item):
         if self.parent is None:
             raise AttributeError(item)
@@ -63,6 +104,17 @@ class FunctionContext(Context):
         super().__init__(parent=parent)
         self.builder = builder
         self.func = func
+        self._last_alloca = None
 
         for arg in func.args:
             self.register(arg.name, arg)
+
+    def allocate(self, dtype, name=''):
+        block = self.builder.block
+        if self._last_alloca is None:
+            self.builder.position_at_start(self.func.entry_basic_block)
+        else:
+            self.builder.position_after(self._last_alloca)
+        self._last_alloca = self.builder.alloca(dtype, name=name)
+        self.builder.position_at_end(block)
+        return self._last_alloca
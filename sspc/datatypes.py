@@ -1,39 +1,127 @@
 from llvmlite import ir as ir
-from wrapt import CallableObjectProxy
 
 from sspc.errors import TypeMismatch
 
 
-def coerce(target_type, value, context):
-    value_type = value.type
-
-    if isinstance(target_type, Boolean):
-        if isinstance(value_type, Boolean):
-            return value
-        if isinstance(value_type, Integer):
-            result = context.builder.icmp_unsigned('!=', value, value_type(0))
-            result = context.builder.zext(result, target_type)
-            result.type = target_type
-            return result
-        else:
-            return ir.Constant(Boolean(), 1)
+def wrap_integer(value, dtype):
+    if dtype is BOOL:
+        return int(value != 0)
+
+    value &= (1 << dtype.width) - 1
+    if not dtype.is_unsigned and value >> (dtype.width - 1):
+        value -= 1 << dtype.width
+    return value
+
+
+def _identity(value, target_type, context):
+    return value
+
+
+def _zero_extend(value, target_type, context):
+    if isinstance(value, ir.Constant):
+        unsigned_value = value.constant & ((1 << value.type.width) - 1)
+        return ir.Constant(target_type, wrap_integer(unsigned_value, target_type))
+    return context.builder.zext(value, target_type)
+
+
+def _sign_extend(value, target_type, context):
+    if isinstance(value, ir.Constant):
+        signed_value = wrap_integer(value.constant, Integer(value.type.width, False))
+        return ir.Constant(target_type, wrap_integer(signed_value, target_type))
+    return context.builder.sext(value, target_type)
+
+
+def _truncate(value, target_type, context):
+    if isinstance(value, ir.Constant):
+        return ir.Constant(target_type, wrap_integer(value.constant, target_type))
+    return context.builder.trunc(value, target_type)
+
+
+def _reinterpret(value, target_type, context):
+    if isinstance(value, ir.Constant):
+        return ir.Constant(target_type, wrap_integer(value.constant, target_type))
+    return context.builder.bitcast(value, target_type)
 
-    elif value_type == target_type:
-        if value_type is not target_type:
-            value.type = target_type
-        return value
+
+def _nonzero(value, target_type, context):
+    if isinstance(value, ir.Constant):
+        return ir.Constant(target_type, int(value.constant != 0))
+    result = context.builder.icmp_unsigned('!=', value, value.type(0))
+    result.type = target_type
+    return result
+
+
+def _true(value, target_type, context):
+    return ir.Constant(target_type, 1)
+
+
+def _extend(target_type):
+    return _zero_extend if target_type.is_unsigned else _sign_extend
+
+
+def _coercion_rule(value_type, target_type):
+    if value_type is target_type:
+        return _identity
+
+    elif target_type is BOOL:
+        return _nonzero if isinstance(value_type, Integer) else _true
 
     elif isinstance(target_type, Integer):
-        if isinstance(value_type, Integer) and target_type.is_unsigned == value_type.is_unsigned:
-            if value_type.width < target_type.width:
-                if target_type.is_unsigned:
-                    return context.builder.zext(value, target_type)
-                else:
-                    return context.builder.sext(value, target_type)
-        elif isinstance(value_type, Boolean):
-            return context.builder.zext(value, target_type)
+        if value_type is BOOL:
+            return _zero_extend
+        elif isinstance(value_type, Integer):
+            if value_type.width == target_type.width:
+                return _reinterpret
+            elif value_type.width < target_type.width and value_type.is_unsigned == target_type.is_unsigned:
+                return _extend(target_type)
+
+
+def _cast_rule(value_type, target_type):
+    if value_type is target_type:
+        return _identity
+
+    elif target_type is BOOL:
+        return _coercion_rule(value_type, target_type)
 
-    raise TypeMismatch('Cannot assign %s to %s' % (value_type, target_type))
+    elif isinstance(target_type, Integer):
+        if value_type is BOOL:
+            return _zero_extend
+        elif isinstance(value_type, Integer):
+            if value_type.width > target_type.width:
+                return _truncate
+            elif value_type.width < target_type.width:
+                return _extend(target_type)
+            return _reinterpret
+
+
+_coercion_rules = {}
+_cast_rules = {}
+
+
+def _lookup_rule(rules, build_rule, value_type, target_type):
+    if not isinstance(value_type, Type):
+        return build_rule(value_type, target_type)
+
+    key = (value_type, target_type)
+    try:
+        return rules[key]
+    except KeyError:
+        rule = rules[key] = build_rule(value_type, target_type)
+        return rule
+
+
+def coerce(target_type, value, context):
+    rule = _lookup_rule(_coercion_rules, _coercion_rule, value.type, target_type)
+    if rule is None:
+        raise TypeMismatch('Cannot assign %s to %s' % (value.type, target_type))
+    return rule(value, target_type, context)
+
+
+def cast(target_type, value, context):
+    rule = _lookup_rule(_cast_rules, _cast_rule, value.type, target_type)
+    if rule is None:
+        raise TypeMismatch('Cannot cast %s to %s' % (value.type, target_type))
+    return rule(value, target_type, context)
 
 
 class Type:
@@ -49,37 +137,35 @@ class Type:
         pass
 
 
-class Integer(CallableObjectProxy, Type):
-    is_unsigned = None
+class Integer(ir.IntType, Type):
     has_explicit_cast = True
+    _instances = {}
+
+    def __new__(cls, bits, is_unsigned):
+        key = (bits, is_unsigned)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            self = cls._instances[key] = object.__new__(cls)
+            self.width = bits
+            self.is_unsigned = is_unsigned
+            return self
 
     def __init__(self, bits, is_unsigned):
-        super().__init__(ir.IntType(bits))
-        self.is_unsigned = is_unsigned
-
-    def explicit_cast(self, value, context):
-        value_type = value.type
-        if value_type == self:
-            if value_type is not self:
-                value.type = self
-            return value
+        pass
 
-        elif isinstance(value_type, Integer):
-            value_width = value_type.width
-            target_width = self.width
+    def __reduce__(self):
+        return Integer, (self.width, self.is_unsigned)
 
-            if value_width > target_width:
-                return context.builder.trunc(value, self)
-            elif value_width < target_width:
-                if self.is_unsigned:
-                    return context.builder.zext(value, self)
-                else:
-                    return context.builder.sext(value, self)
+    def __eq__(self, other):
+        if isinstance(other, Type):
+            return self is other
+        return NotImplemented
 
-        elif isinstance(value_type, Boolean):
-            return context.builder.zext(value, self)
+    __hash__ = object.__hash__
 
-        raise TypeMismatch('Cannot cast %s to %s' % (value_type, self))
+    def explicit_cast(self, value, context):
+        return cast(self, value, context)
 
     def op_unary(self, operation, x, context):
         from sspc.expression import OpUnaryType
@@ -97,8 +183,9 @@ class Integer(CallableObjectProxy, Type):
 
         if isinstance(b.type, Integer) and self.is_unsigned == b.type.is_unsigned:
             if b.type.width > self.width:
-                b, a = a, b
-            b = coerce(a.type, b, context)
+                a = coerce(b.type, a, context)
+            else:
+                b = coerce(a.type, b, context)
 
             if operation == OpBinaryType.ADD:
                 return context.builder.add(a, b)
@@ -141,18 +228,31 @@ class Integer(CallableObjectProxy, Type):
         else:
             result = context.builder.icmp_signed(operation, a, b)
 
-        result.type = Boolean()
+        result.type = BOOL
         return result
 
 
-class Boolean(CallableObjectProxy, Type):
+class Boolean(ir.IntType, Type):
     has_explicit_cast = True
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.width = 1
+        return cls._instance
 
     def __init__(self):
-        super().__init__(ir.IntType(1))
+        pass
+
+    def __reduce__(self):
+        return Boolean, ()
+
+    __eq__ = Integer.__eq__
+    __hash__ = object.__hash__
 
     def explicit_cast(self, value, context):
-        return coerce(Boolean(), value, context)
+        return cast(self, value, context)
 
     def op_unary(self, operation, x, context):
         from sspc.expression import OpUnaryType
@@ -160,11 +260,5 @@ class Boolean(CallableObjectProxy, Type):
         if operation == OpUnaryType.LOGICAL_NOT:
             return context.builder.not_(x)
 
-    def op_binary(self, operation, a, b, context):
-        from sspc.expression import OpBinaryType
-
-        if operation == OpBinaryType.LOGICAL_AND:
-            return context.builder.and_(a, b)
-        elif operation == OpBinaryType.LOGICAL_OR:
-            return context.builder.or_(a, b)
 
+BOOL = Boolean()
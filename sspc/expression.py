@@ -5,18 +5,29 @@ from typing import Any, List
 
 from llvmlite import ir
 
-from sspc.datatypes import coerce, Type, Boolean
-from sspc.errors import OperationNotAllowed, UnknownIdentifierError
+from sspc.datatypes import coerce, wrap_integer, Boolean, Integer, Type, BOOL
+from sspc.errors import CompileError, OperationNotAllowed, TypeMismatch, UnknownIdentifierError
 
 
-def compile_expression(node, context, *, type_hint=None):
-    if isinstance(node, ir.Constant):
-        result = node
+INT = Integer(32, False)
+LONG = Integer(64, False)
+
+BRANCH_HINTS = {'likely': True, 'unlikely': False}
 
-    elif isinstance(node, str):
+
+def compile_expression(node, context, *, type_hint=None):
+    if isinstance(node, str):
         result = context.find(node)
         if result is None:
             raise UnknownIdentifierError(node)
+        elif isinstance(result, ir.AllocaInstr):
+            result = context.builder.load(result)
+
+    elif isinstance(node, ir.Constant):
+        result = node
+
+    elif isinstance(node, IntLiteral):
+        result = node.materialize(type_hint)
 
     elif isinstance(node, Expression):
         result = node.compile(context)
@@ -30,12 +41,50 @@ def compile_expression(node, context, *, type_hint=None):
     return result
 
 
+def branch_hint(node, context):
+    if isinstance(node, Call) and node.func in BRANCH_HINTS and context.find(node.func) is None:
+        if len(node.args) != 1:
+            raise CompileError('%s() takes exactly one argument' % node.func)
+        return BRANCH_HINTS[node.func]
+    return None
+
+
+def compile_condition(node, context):
+    likely = branch_hint(node, context)
+    if likely is not None:
+        node = node.args[0]
+    return compile_expression(node, context, type_hint=BOOL), likely
+
+
+def set_branch_weights(branch, likely):
+    if likely is not None:
+        branch.set_weights([99, 1] if likely else [1, 99])
+
+
 class Expression(metaclass=ABCMeta):
     @abstractmethod
     def compile(self, context):
         pass
 
 
+@dataclass
+class IntLiteral(Expression):
+    value: int
+
+    def default_type(self):
+        return INT if wrap_integer(self.value, INT) == self.value else LONG
+
+    def materialize(self, dtype=None):
+        if not isinstance(dtype, (Integer, Boolean)):
+            dtype = self.default_type()
+        elif wrap_integer(self.value, dtype) != self.value:
+            raise TypeMismatch('Integer literal %d does not fit in %s' % (self.value, dtype))
+        return ir.Constant(dtype, self.value)
+
+    def compile(self, context):
+        return self.materialize()
+
+
 class OpUnaryType(Enum):
     PLUS = 0
     MINUS = 1
@@ -61,9 +110,16 @@ class OpUnary(Expression):
     def compile(self, context):
         args_type_hint = None
         if self.operation == OpUnaryType.LOGICAL_NOT:
-            args_type_hint = Boolean()
+            args_type_hint = BOOL
 
         x = compile_expression(self.x, context, type_hint=args_type_hint)
+        if isinstance(x, ir.Constant):
+            from sspc.folding import fold_unary
+
+            folded = fold_unary(OpUnary(x=x, operation=self.operation))
+            if isinstance(folded, ir.Constant):
+                return folded
+
         result = x.type.op_unary(self.operation, x, context)
         if result is None:
             raise OperationNotAllowed.for_unary_op(self.operation, x.type)
@@ -132,17 +188,57 @@ class OpBinary(Expression):
     operation: OpBinaryType
 
     def compile(self, context):
-        args_type_hint = None
         if self.operation in (OpBinaryType.LOGICAL_OR, OpBinaryType.LOGICAL_AND):
-            args_type_hint = Boolean()
+            return self.compile_short_circuit(context)
+
+        if isinstance(self.a, IntLiteral):
+            b = compile_expression(self.b, context)
+            a = compile_expression(self.a, context, type_hint=b.type)
+        else:
+            a = compile_expression(self.a, context)
+            b = compile_expression(self.b, context, type_hint=a.type if isinstance(self.b, IntLiteral) else None)
+
+        if isinstance(a, ir.Constant) and isinstance(b, ir.Constant):
+            from sspc.folding import fold_binary
+
+            folded = fold_binary(OpBinary(a=a, b=b, operation=self.operation))
+            if isinstance(folded, ir.Constant):
+                return folded
 
-        a = compile_expression(self.a, context, type_hint=args_type_hint)
-        b = compile_expression(self.b, context, type_hint=args_type_hint)
         result = a.type.op_binary(self.operation, a, b, context)
         if result is None:
             raise OperationNotAllowed.for_binary_op(self.operation, a.type, b.type)
         return result
 
+    def compile_short_circuit(self, context):
+        is_and = self.operation == OpBinaryType.LOGICAL_AND
+        a, likely = compile_condition(self.a, context)
+        if isinstance(a, ir.Constant):
+            if bool(a.constant) != is_and:
+                return a
+            return compile_expression(self.b, context, type_hint=BOOL)
+
+        builder = context.builder
+        a_block = builder.block
+        b_block = builder.append_basic_block()
+        end_block = builder.append_basic_block()
+        if is_and:
+            branch = builder.cbranch(a, b_block, end_block)
+        else:
+            branch = builder.cbranch(a, end_block, b_block)
+        set_branch_weights(branch, likely)
+
+        builder.position_at_end(b_block)
+        b = compile_expression(self.b, context, type_hint=BOOL)
+        b_block = builder.block
+        builder.branch(end_block)
+
+        builder.position_at_end(end_block)
+        result = builder.phi(BOOL)
+        result.add_incoming(ir.Constant(BOOL, int(not is_and)), a_block)
+        result.add_incoming(b, b_block)
+        return result
+
 
 @dataclass
 class Call(Expression):
@@ -150,10 +246,19 @@ class Call(Expression):
     args: List[Any]
 
     def compile(self, context):
+        if branch_hint(self, context) is not None:
+            return compile_expression(self.args[0], context, type_hint=BOOL)
+
         f = compile_expression(self.func, context)
         if isinstance(f, Type) and f.has_explicit_cast:
             assert len(self.args) == 1
             return f.explicit_cast(compile_expression(self.args[0], context), context)
 
-        args = [compile_expression(arg, context) for arg in self.args]
+        if isinstance(f, ir.Function):
+            args = [
+                compile_expression(arg, context, type_hint=arg_type)
+                for arg, arg_type in zip(self.args, f.ftype.args)
+            ]
+        else:
+            args = [compile_expression(arg, context) for arg in self.args]
         return context.builder.call(f, args)
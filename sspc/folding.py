@@ -0,0 +1,192 @@
+import dataclasses
+
+import llvmlite.ir as ir
+
+from sspc.datatypes import cast, wrap_integer, Boolean, Integer, BOOL
+from sspc.expression import Call, IntLiteral, OpBinary, OpBinaryType, OpUnary, OpUnaryType
+
+
+def _divide(a, b):
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
+
+
+def _remainder(a, b):
+    return a - b * _divide(a, b)
+
+
+ARITHMETIC = {
+    OpBinaryType.ADD: lambda a, b: a + b,
+    OpBinaryType.SUB: lambda a, b: a - b,
+    OpBinaryType.MUL: lambda a, b: a * b,
+    OpBinaryType.DIV: _divide,
+    OpBinaryType.MOD: _remainder,
+    OpBinaryType.BITWISE_AND: lambda a, b: a & b,
+    OpBinaryType.BITWISE_XOR: lambda a, b: a ^ b,
+    OpBinaryType.BITWISE_OR: lambda a, b: a | b,
+}
+
+COMPARISONS = {
+    OpBinaryType.EQ: lambda a, b: a == b,
+    OpBinaryType.LT: lambda a, b: a < b,
+    OpBinaryType.GT: lambda a, b: a > b,
+    OpBinaryType.LE: lambda a, b: a <= b,
+    OpBinaryType.GE: lambda a, b: a >= b,
+    OpBinaryType.NE: lambda a, b: a != b,
+}
+
+LOGICAL = {
+    OpBinaryType.LOGICAL_AND: lambda a, b: a and b,
+    OpBinaryType.LOGICAL_OR: lambda a, b: a or b,
+}
+
+
+def _constant_type(node):
+    if node.__class__ is IntLiteral:
+        return None
+    elif node.__class__ is ir.Constant and isinstance(node.type, (Integer, Boolean)):
+        return node.type
+    return False
+
+
+def _constant_value(node):
+    if node.__class__ is IntLiteral:
+        return node.value
+    return node.constant
+
+
+def _typed_constant(value, dtype):
+    if dtype is None:
+        return IntLiteral(value)
+    return ir.Constant(dtype, wrap_integer(value, dtype))
+
+
+def _common_type(a_type, b_type):
+    if a_type is None or b_type is None:
+        return a_type or b_type
+    elif a_type is BOOL or b_type is BOOL:
+        return None if a_type is not b_type else BOOL
+    elif a_type.is_unsigned != b_type.is_unsigned:
+        return None
+    return a_type if a_type.width >= b_type.width else b_type
+
+
+def fold_unary(node):
+    dtype = _constant_type(node.x)
+    if dtype is False:
+        return node
+
+    value = _constant_value(node.x)
+    if node.operation == OpUnaryType.LOGICAL_NOT:
+        return ir.Constant(BOOL, int(value == 0))
+    elif dtype is BOOL or (dtype is not None and dtype.is_unsigned):
+        return node
+    elif node.operation == OpUnaryType.PLUS:
+        return node.x
+    elif node.operation == OpUnaryType.MINUS:
+        return _typed_constant(-value, dtype)
+    elif node.operation == OpUnaryType.BITWISE_NOT:
+        return _typed_constant(~value, dtype)
+    return node
+
+
+def fold_binary(node):
+    a_type = _constant_type(node.a)
+    b_type = _constant_type(node.b)
+    if a_type is False or b_type is False:
+        return node
+
+    a = _constant_value(node.a)
+    b = _constant_value(node.b)
+    if node.operation in LOGICAL:
+        return ir.Constant(BOOL, int(LOGICAL[node.operation](a != 0, b != 0)))
+
+    dtype = _common_type(a_type, b_type)
+    if dtype is BOOL or (dtype is None and a_type is not None):
+        return node
+
+    if dtype is not None:
+        # an untyped literal must fit the other operand's type, exactly as when it is lowered
+        a = node.a.materialize(dtype).constant if a_type is None else wrap_integer(a, dtype)
+        b = node.b.materialize(dtype).constant if b_type is None else wrap_integer(b, dtype)
+
+    if node.operation in COMPARISONS:
+        return ir.Constant(BOOL, int(COMPARISONS[node.operation](a, b)))
+    elif node.operation in (OpBinaryType.DIV, OpBinaryType.MOD) and b == 0:
+        return node
+    return _typed_constant(ARITHMETIC[node.operation](a, b), dtype)
+
+
+def fold_call(node, context):
+    if isinstance(node.func, str) and len(node.args) == 1:
+        dtype = context.find(node.func)
+        value = node.args[0]
+        if isinstance(dtype, (Integer, Boolean)):
+            if isinstance(value, IntLiteral):
+                return _typed_constant(value.value, dtype)
+            elif _constant_type(value) is not False:
+                return cast(dtype, value, None)
+    return node
+
+
+def _fold_binary_node(node, context):
+    a = fold(node.a, context)
+    b = fold(node.b, context)
+    if a is not node.a or b is not node.b:
+        node = OpBinary(a=a, b=b, operation=node.operation)
+    return fold_binary(node)
+
+
+def _fold_unary_node(node, context):
+    x = fold(node.x, context)
+    if x is not node.x:
+        node = OpUnary(x=x, operation=node.operation)
+    return fold_unary(node)
+
+
+def _fold_call_node(node, context):
+    args = fold(node.args, context)
+    if args is not node.args:
+        node = Call(node.func, args)
+    return fold_call(node, context)
+
+
+def _fold_list(node, context):
+    items = [fold(item, context) for item in node]
+    if any(item is not original for item, original in zip(items, node)):
+        return items
+    return node
+
+
+def _fold_fields(node, context):
+    changes = {}
+    for name in node.__dataclass_fields__:
+        value = getattr(node, name)
+        folded = fold(value, context)
+        if folded is not value:
+            changes[name] = folded
+    if changes:
+        return dataclasses.replace(node, **changes)
+    return node
+
+
+def _keep(node, context):
+    return node
+
+
+_folders = {
+    OpBinary: _fold_binary_node,
+    OpUnary: _fold_unary_node,
+    Call: _fold_call_node,
+    IntLiteral: _keep,
+    list: _fold_list,
+}
+
+
+def fold(node, context):
+    node_class = node.__class__
+    try:
+        folder = _folders[node_class]
+    except KeyError:
+        folder = _folders[node_class] = _fold_fields if dataclasses.is_dataclass(node_class) else _keep
+    return folder(node, context)
@@ -0,0 +1,182 @@
+import dataclasses
+import functools
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import llvmlite.ir as ir
+
+from sspc import backend, datatypes, timing
+from sspc.cache import DiskCache
+from sspc.compiler import (
+    compile_function_unit,
+    create_module_context,
+    declare_function,
+    import_module,
+    iter_function_declarations,
+    iter_import_declarations,
+)
+
+
+class FunctionCache(DiskCache):
+    suffix = '.bc'
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_fingerprint():
+    digest = hashlib.sha256()
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for root, dirs, files in os.walk(package_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.endswith('.py'):
+                with open(os.path.join(root, filename), 'rb') as fp:
+                    digest.update(fp.read())
+    return digest.hexdigest()
+
+
+def referenced_names(node):
+    if isinstance(node, str):
+        yield node
+    elif isinstance(node, (list, tuple)):
+        for item in node:
+            yield from referenced_names(item)
+    elif dataclasses.is_dataclass(node):
+        for field in dataclasses.fields(node):
+            yield from referenced_names(getattr(node, field.name))
+
+
+def describe_type(dtype):
+    if isinstance(dtype, datatypes.Boolean):
+        return 'bool'
+    elif isinstance(dtype, datatypes.Integer):
+        return '%s%d' % ('u' if dtype.is_unsigned else 'i', dtype.width)
+    return str(dtype)
+
+
+def describe_symbol(symbol):
+    if isinstance(symbol, ir.Function):
+        return '(%s)->%s' % (
+            ','.join(describe_type(arg) for arg in symbol.ftype.args),
+            describe_type(symbol.ftype.return_type),
+        )
+    return describe_type(symbol)
+
+
+def function_key(function_ast, names, context, salt):
+    digest = hashlib.sha256()
+    digest.update(salt.encode())
+    digest.update(repr(function_ast).encode())
+    for name in sorted(names):
+        symbol = context.find(name)
+        if symbol is not None:
+            digest.update(('\0%s:%s' % (name, describe_symbol(symbol))).encode())
+    return digest.hexdigest()
+
+
+def build_salt(target_machine, opt_level, size_level):
+    return '%s|%s|%s|%s|O%d.%d' % (
+        compiler_fingerprint(),
+        target_machine.triple,
+        target_machine.target_data,
+        target_machine.options,
+        opt_level,
+        size_level,
+    )
+
+
+def compile_unit(function_ast, dependencies, target_machine, opt_level, size_level, imports=()):
+    unit_ir = compile_function_unit(function_ast, dependencies, imports=imports)
+    backend.prepare_module(unit_ir, target_machine)
+    unit_ref = backend.parse_module(str(unit_ir))
+    backend.optimize_module(unit_ref, target_machine, opt_level, size_level)
+    return unit_ref
+
+
+def signature(function_ast):
+    return function_ast._replace(body=None, decorators=())
+
+
+_worker_state = None
+
+
+def _init_worker(imports, opt_level, size_level, target_options):
+    global _worker_state
+    target_machine = backend.create_target_machine(opt_level, **target_options)
+    _worker_state = (imports, target_machine, opt_level, size_level)
+
+
+def _compile_unit_task(function_ast, dependencies):
+    imports, target_machine, opt_level, size_level = _worker_state
+    unit_ref = compile_unit(function_ast, dependencies, target_machine, opt_level, size_level, imports)
+    return unit_ref.as_bitcode()
+
+
+def compile_module_units(module_ast, target_machine, opt_level, size_level, cache=None, jobs=1, target_options=None):
+    declarations = list(iter_function_declarations(module_ast))
+    imports = list(iter_import_declarations(module_ast))
+    indices = {decl.name: index for index, decl in enumerate(declarations)}
+
+    context = create_module_context()
+    signatures = ir.Module('test')
+    for decl in imports:
+        import_module(decl, signatures, context)
+    for decl in declarations:
+        declare_function(decl, signatures, context)
+
+    salt = build_salt(target_machine, opt_level, size_level) if cache is not None else None
+    units = [None] * len(declarations)
+    pending = []
+    for index, decl in enumerate(declarations):
+        names = set(referenced_names(decl))
+        dependency_indices = sorted(indices[name] for name in names if name in indices and name != decl.name)
+
+        key = None
+        if cache is not None:
+            key = function_key(decl, names, context, salt)
+            units[index] = cache.load(key)
+        if units[index] is None:
+            pending.append((index, key, dependency_indices))
+
+    if jobs > 1 and len(pending) > 1:
+        # workers get the parsed function and only the signatures it calls, never the sources
+        chunksize = max(1, len(pending) // (jobs * 4))
+        initargs = (imports, opt_level, size_level, target_options or {})
+        with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=initargs) as executor:
+            results = executor.map(
+                _compile_unit_task,
+                [declarations[index] for index, _, _ in pending],
+                [[signature(declarations[i]) for i in dependency_indices] for _, _, dependency_indices in pending],
+                chunksize=chunksize,
+            )
+            for (index, key, _), bitcode in zip(pending, results):
+                units[index] = bitcode
+                if cache is not None:
+                    cache.store(key, bitcode)
+    else:
+        for index, key, dependency_indices in pending:
+            dependencies = [declarations[i] for i in dependency_indices]
+            with timing.function(declarations[index].name):
+                units[index] = compile_unit(
+                    declarations[index], dependencies, target_machine, opt_level, size_level, imports,
+                )
+            if cache is not None:
+                cache.store(key, units[index].as_bitcode())
+
+    with timing.phase('link-units'):
+        linked = link_units(units, target_machine)
+    # units were optimized in isolation; the module pipeline inlines and prunes across them
+    with timing.phase('optimize-linked'):
+        return backend.optimize_linked_module(linked, target_machine, opt_level, size_level)
+
+
+def link_units(units, target_machine):
+    linked_ir = ir.Module('test')
+    backend.prepare_module(linked_ir, target_machine)
+    linked = backend.parse_module(str(linked_ir))
+    for unit in units:
+        if isinstance(unit, bytes):
+            unit = backend.parse_bitcode(unit)
+        linked.link_in(unit)
+
+    return linked
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import re
+
+from sspc import ast
+from sspc.errors import CompileError
+
+SUFFIX = '.sspi'
+FORMAT_VERSION = 1
+ENTRY_POINT = 'main'
+
+IMPORT_PATTERN = re.compile(rb'^import[ \t]+(\w+)[ \t]*(?:#.*)?$', re.MULTILINE)
+
+
+def scan_imports(source):
+    return [name.decode() for name in IMPORT_PATTERN.findall(source)]
+
+
+def describe(module_ast):
+    imports = []
+    functions = []
+    for decl in module_ast.declarations:
+        if isinstance(decl, ast.import_declaration):
+            imports.append(decl.name)
+        elif isinstance(decl, ast.function_declaration) and decl.name != ENTRY_POINT:
+            functions.append([decl.name, [[arg.name, arg.type] for arg in decl.arguments], decl.return_type])
+    return {'imports': imports, 'functions': functions}
+
+
+def encode(data):
+    return json.dumps(data, separators=(',', ':'), sort_keys=True).encode()
+
+
+def signature_hash(functions):
+    return hashlib.sha256(encode(functions)).hexdigest()
+
+
+def write_interface(path, description, object_path):
+    data = encode({
+        'version': FORMAT_VERSION,
+        'module': os.path.splitext(os.path.basename(path))[0],
+        'object': os.path.relpath(object_path, os.path.dirname(os.path.abspath(path))),
+        'imports': description['imports'],
+        'functions': description['functions'],
+        'hash': signature_hash(description['functions']),
+    }) + b'\n'
+
+    try:
+        with open(path, 'rb') as fp:
+            if fp.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp_path, 'wb') as fp:
+        fp.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def find_interface(name, search_path):
+    for directory in search_path:
+        path = os.path.join(directory, name + SUFFIX)
+        if os.path.isfile(path):
+            return path
+    raise CompileError('Cannot find interface %s%s for import %s' % (name, SUFFIX, name))
+
+
+def load_interface(path):
+    with open(path, 'rb') as fp:
+        data = json.load(fp)
+    if data.get('version') != FORMAT_VERSION:
+        raise CompileError('Interface %s has unsupported format version %r' % (path, data.get('version')))
+    return data
+
+
+def signatures(data):
+    return tuple(
+        ast.function_declaration(name, [ast.argument(*argument) for argument in arguments], return_type, None)
+        for name, arguments, return_type in data['functions']
+    )
+
+
+def resolve_imports(module_ast, search_path):
+    declarations = []
+    for decl in module_ast.declarations:
+        if isinstance(decl, ast.import_declaration) and decl.interface is None:
+            decl = decl._replace(interface=signatures(load_interface(find_interface(decl.name, search_path))))
+        declarations.append(decl)
+    return ast.module(declarations)
+
+
+def import_hashes(names, search_path):
+    return {name: load_interface(find_interface(name, search_path))['hash'] for name in names}
+
+
+def imported_objects(names, search_path):
+    objects = []
+    seen = set()
+    pending = list(reversed(names))
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        path = find_interface(name, search_path)
+        data = load_interface(path)
+        objects.append(os.path.join(os.path.dirname(path), data['object']))
+        pending.extend(reversed(data['imports']))
+    return objects
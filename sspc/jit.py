@@ -0,0 +1,211 @@
+import ctypes
+import hashlib
+import struct
+import sys
+
+import llvmlite.binding as llvm
+import llvmlite.ir as ir
+
+from sspc import backend, timing
+from sspc.cache import DiskCache
+from sspc.datatypes import wrap_integer, Boolean
+
+PyBUF_WRITABLE = 0x0001
+PyBUF_RECORDS_RO = 0x001c
+
+NATIVE_BYTE_ORDER = '@=<' if sys.byteorder == 'little' else '@=>'
+
+
+class Py_buffer(ctypes.Structure):
+    _fields_ = [
+        ('buf', ctypes.c_void_p),
+        ('obj', ctypes.c_void_p),
+        ('len', ctypes.c_ssize_t),
+        ('itemsize', ctypes.c_ssize_t),
+        ('readonly', ctypes.c_int),
+        ('ndim', ctypes.c_int),
+        ('format', ctypes.c_char_p),
+        ('shape', ctypes.POINTER(ctypes.c_ssize_t)),
+        ('strides', ctypes.POINTER(ctypes.c_ssize_t)),
+        ('suboffsets', ctypes.POINTER(ctypes.c_ssize_t)),
+        ('internal', ctypes.c_void_p),
+    ]
+
+
+_get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+_get_buffer.argtypes = [ctypes.py_object, ctypes.POINTER(Py_buffer), ctypes.c_int]
+_get_buffer.restype = ctypes.c_int
+
+_release_buffer = ctypes.pythonapi.PyBuffer_Release
+_release_buffer.argtypes = [ctypes.POINTER(Py_buffer)]
+_release_buffer.restype = None
+
+
+class ObjectCache(DiskCache):
+    suffix = '.o'
+
+    def key(self, module_ref, target_machine):
+        digest = hashlib.sha256()
+        digest.update(str(target_machine.triple).encode())
+        digest.update(str(target_machine.target_data).encode())
+        digest.update(target_machine.options.encode())
+        digest.update(module_ref.as_bitcode())
+        return digest.hexdigest()
+
+    def attach(self, engine, key):
+        engine.set_object_cache(
+            lambda module_ref, object_code: self.store(key, object_code),
+            lambda module_ref: self.load(key),
+        )
+
+
+def create_engine(module_ref, target_machine, cache=None, objects=()):
+    engine = llvm.create_mcjit_compiler(module_ref, target_machine)
+    for path in objects:
+        engine.add_object_file(path)
+    if cache is not None:
+        cache.attach(engine, cache.key(module_ref, target_machine))
+    engine.finalize_object()
+    engine.run_static_constructors()
+    return engine
+
+
+def run(module_ref, target_machine, entry='main', restype=ctypes.c_int, cache=None, objects=()):
+    backend.initialize()
+    with timing.phase('jit-compile'):
+        engine = create_engine(module_ref, target_machine, cache=cache, objects=objects)
+        address = engine.get_function_address(entry)
+    if not address:
+        raise LookupError('Entry point "%s" is not defined' % entry)
+
+    with timing.phase('execute'):
+        result = ctypes.CFUNCTYPE(restype)(address)()
+        engine.run_static_destructors()
+    return result
+
+
+BUFFER_CODES = {8: 'b', 16: 'h', 32: 'i', 64: 'q'}
+
+
+def buffer_code(dtype):
+    if isinstance(dtype, Boolean):
+        return '?'
+    code = BUFFER_CODES[dtype.width]
+    return code.upper() if dtype.is_unsigned else code
+
+
+def scalar_type(dtype):
+    if isinstance(dtype, Boolean):
+        return ctypes.c_bool
+    return getattr(ctypes, 'c_%sint%d' % ('u' if dtype.is_unsigned else '', dtype.width))
+
+
+def buffer_matches(fmt, dtype):
+    fmt = fmt.lstrip(NATIVE_BYTE_ORDER)
+    if isinstance(dtype, Boolean):
+        return fmt == '?'
+    codes = 'BHILQ' if dtype.is_unsigned else 'bhilq'
+    return len(fmt) == 1 and fmt in codes and struct.calcsize(fmt) * 8 == dtype.width
+
+
+class BufferOperand:
+    def __init__(self, obj, dtype, writable=False):
+        self.view = Py_buffer()
+        _get_buffer(obj, ctypes.byref(self.view), PyBUF_RECORDS_RO | (PyBUF_WRITABLE if writable else 0))
+        try:
+            fmt = self.view.format.decode()
+            if not buffer_matches(fmt, dtype):
+                raise TypeError('Buffer of format "%s" does not hold %s values' % (fmt, dtype))
+            elif self.view.ndim != 1:
+                raise ValueError('Expected a one-dimensional buffer, got %d dimensions' % self.view.ndim)
+            elif self.view.strides[0] % self.view.itemsize:
+                raise ValueError('Buffer stride is not a multiple of its item size')
+        except Exception:
+            self.release()
+            raise
+
+        self.address = self.view.buf
+        self.length = self.view.shape[0]
+        self.stride = self.view.strides[0] // self.view.itemsize
+
+    def release(self):
+        _release_buffer(ctypes.byref(self.view))
+
+
+class ScalarOperand:
+    length = None
+    stride = 0
+
+    def __init__(self, value, dtype):
+        self.value = scalar_type(dtype)(wrap_integer(value, dtype))
+        self.address = ctypes.addressof(self.value)
+
+    def release(self):
+        pass
+
+
+def allocate_output(length, dtype):
+    try:
+        import numpy
+    except ImportError:
+        return memoryview(bytearray(length * max(1, dtype.width // 8))).cast(buffer_code(dtype))
+    return numpy.empty(length, dtype=buffer_code(dtype))
+
+
+class Vectorized:
+    def __init__(self, engine, func, address):
+        self.engine = engine
+        self.__name__ = func.name
+        self.arg_types = list(func.ftype.args)
+        self.return_type = func.ftype.return_type
+        operand_types = [ctypes.c_void_p, ctypes.c_int64] * (len(self.arg_types) + 1)
+        self.loop = ctypes.CFUNCTYPE(None, ctypes.c_int64, *operand_types)(address)
+
+    def __call__(self, *args, out=None):
+        if len(args) != len(self.arg_types):
+            raise TypeError('%s() takes %d arguments, got %d' % (self.__name__, len(self.arg_types), len(args)))
+
+        operands = []
+        try:
+            for arg, dtype in zip(args, self.arg_types):
+                if isinstance(arg, int):
+                    operands.append(ScalarOperand(arg, dtype))
+                else:
+                    operands.append(BufferOperand(arg, dtype))
+
+            lengths = {operand.length for operand in operands if operand.length is not None}
+            if len(lengths) > 1:
+                raise ValueError('Operands have different lengths: %s' % ', '.join(map(str, sorted(lengths))))
+            length = lengths.pop() if lengths else 1
+
+            if out is None:
+                out = allocate_output(length, self.return_type)
+            result = BufferOperand(out, self.return_type, writable=True)
+            operands.append(result)
+            if result.length != length:
+                raise ValueError('Output has length %d, expected %d' % (result.length, length))
+
+            self.loop(length, *[value for operand in operands for value in (operand.address, operand.stride)])
+        finally:
+            for operand in operands:
+                operand.release()
+        return out
+
+
+def vectorize(source, name, opt_level=3, cpu='native', features=''):
+    from sspc import ufunc
+    from sspc.compiler import compile_module
+    from sspc.parser.parser import Parser
+
+    module_ir = compile_module(Parser(engine='descent').parse(source))
+    func = module_ir.globals.get(name)
+    if not isinstance(func, ir.Function) or func.is_declaration:
+        raise LookupError('Function "%s" is not defined' % name)
+    loop = ufunc.define_loop(func)
+
+    target_machine = backend.create_target_machine(opt_level, jit=True, cpu=cpu, features=features)
+    backend.prepare_module(module_ir, target_machine)
+    module_ref = backend.parse_module(str(module_ir))
+    backend.optimize_module(module_ref, target_machine, opt_level)
+    engine = create_engine(module_ref, target_machine)
+    return Vectorized(engine, func, engine.get_function_address(loop.name))
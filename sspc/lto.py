@@ -0,0 +1,49 @@
+import llvmlite.binding as llvm
+
+from sspc import backend
+
+ENTRY_POINTS = ('main',)
+
+
+def is_intrinsic(value):
+    return value.name.startswith('llvm.')
+
+
+def internalize(module_ref, exported=ENTRY_POINTS):
+    for value in (*module_ref.functions, *module_ref.global_variables):
+        if value.is_declaration or is_intrinsic(value) or value.name in exported:
+            continue
+        value.linkage = llvm.Linkage.internal
+    return module_ref
+
+
+def merge_modules(bitcodes):
+    module_ref = backend.parse_bitcode(bitcodes[0])
+    for bitcode in bitcodes[1:]:
+        module_ref.link_in(backend.parse_bitcode(bitcode))
+    return module_ref
+
+
+def link_full(bitcodes, target_machine, opt_level, size_level=0, exported=ENTRY_POINTS):
+    module_ref = internalize(merge_modules(bitcodes), exported)
+    module_ref.verify()
+    return backend.optimize_module(module_ref, target_machine, opt_level, size_level)
+
+
+def import_definitions(module_ref, bitcodes):
+    for bitcode in bitcodes:
+        imported = backend.parse_bitcode(bitcode)
+        for func in imported.functions:
+            if not func.is_declaration and func.linkage == llvm.Linkage.external:
+                func.linkage = llvm.Linkage.available_externally
+        module_ref.link_in(imported)
+    return module_ref
+
+
+def link_partition(bitcode, imported_bitcodes, target_machine, opt_level, size_level=0, exported=None):
+    module_ref = backend.parse_bitcode(bitcode)
+    if exported is not None:
+        internalize(module_ref, exported)
+    import_definitions(module_ref, imported_bitcodes)
+    module_ref.verify()
+    return backend.optimize_module(module_ref, target_machine, opt_level, size_level)
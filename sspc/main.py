@@ -1,42 +1,306 @@
 import argparse
-import subprocess
-
-import llvmlite.binding as llvm
+import ctypes
+import os
+import sys
+import tempfile
 
+from sspc import interface, timing
+from sspc.cache import default_cache_dir
 from sspc.compiler import compile_module
 from sspc.parser.parser import Parser
+from sspc.source import load_source, parse_sources
+
+OPT_LEVELS = {
+    '0': (0, 0),
+    '1': (1, 0),
+    '2': (2, 0),
+    '3': (3, 0),
+    's': (2, 1),
+}
+
+RELOC_MODELS = ('default', 'static', 'pic', 'dynamicnopic')
+
+CODE_MODELS = ('default', 'jitdefault', 'small', 'kernel', 'medium', 'large')
+
+common_args = argparse.ArgumentParser(add_help=False)
+common_args.add_argument('sources', nargs='*', default=['test.ssp'])
+common_args.add_argument('--trace', action='store_true')
+common_args.add_argument('--parser', choices=Parser.ENGINES, default='lalr')
+common_args.add_argument('--lexer', choices=Parser.LEXERS, default=None)
+common_args.add_argument('-O', dest='opt_level', choices=tuple(OPT_LEVELS), default='0')
+common_args.add_argument('--emit-opt-ll', nargs='?', const=True, default=None)
+common_args.add_argument('--incremental', action='store_true')
+common_args.add_argument('--cache-dir', default=None)
+common_args.add_argument('-j', dest='jobs', type=int, default=None)
+common_args.add_argument('-I', dest='import_path', action='append', default=[], metavar='DIR')
+common_args.add_argument('--cpu', default='')
+common_args.add_argument('--features', default='')
+common_args.add_argument('--reloc', choices=RELOC_MODELS, default=None)
+common_args.add_argument('--code-model', choices=CODE_MODELS, default=None)
+common_args.add_argument('--codegen-opt', type=int, choices=(0, 1, 2, 3), default=None)
+common_args.add_argument('--time-phases', nargs='?', choices=('table', 'json'), const='table', default=None)
+common_args.add_argument('--time-phases-output', default=None)
+common_args.add_argument('--no-trace-memory', action='store_true')
+
+args_parser = argparse.ArgumentParser(prog='sspc')
+commands = args_parser.add_subparsers(dest='command')
+
+compile_args = commands.add_parser('compile', parents=[common_args])
+compile_args.add_argument('-o', '--output', default='test')
+compile_args.add_argument('--backend', choices=('native', 'llc'), default='native')
+compile_args.add_argument('--emit', choices=('exe', 'shared', 'obj', 'bc'), default='exe')
+compile_args.add_argument('--save-temps', action='store_true')
+compile_args.add_argument('--connect', nargs='?', const='', default=None, metavar='SOCKET')
+
+run_args = commands.add_parser('run', parents=[common_args])
+run_args.add_argument('--no-cache', action='store_true')
+
+build_args = commands.add_parser('build', parents=[common_args])
+build_args.add_argument('-o', '--output', default=None)
+build_args.add_argument('--build-dir', default='build')
+build_args.add_argument('--backend', choices=('native', 'llc'), default='native')
+build_args.add_argument('--lto', nargs='?', choices=('full', 'thin'), const='full', default=None)
+
+serve_args = commands.add_parser('serve')
+serve_args.add_argument('--socket', default=None)
+serve_args.add_argument('-j', dest='jobs', type=int, default=None)
+serve_args.add_argument('--cache-entries', type=int, default=1024)
+
+
+def parse_args(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or argv[0] not in commands.choices:
+        argv = ['compile', *argv]
+    return args_parser.parse_args(argv)
+
+
+def get_cache_dir(args, name):
+    return os.path.join(args.cache_dir or default_cache_dir(), name)
+
+
+def output_stem(args):
+    output = getattr(args, 'output', None) or args.sources[0]
+    if output == '-':
+        return 'stdin'
+    return os.path.splitext(output)[0]
+
+
+def import_search_path(args):
+    source_dirs = [os.path.dirname(path) or os.curdir for path in args.sources if path != '-']
+    return list(dict.fromkeys([*args.import_path, *source_dirs, os.curdir]))
+
+
+def read_sources(args):
+    if args.sources.count('-') > 1:
+        args_parser.error('stdin can only be read once')
+
+    with timing.phase('read'):
+        sources = [load_source(path) for path in args.sources]
+    module_ast = parse_sources(Parser(debug=args.trace, engine=args.parser, lexer=args.lexer), sources)
+    return interface.resolve_imports(module_ast, import_search_path(args))
+
+
+def target_options(args, jit=False):
+    return dict(
+        jit=jit,
+        cpu=args.cpu,
+        features=args.features,
+        reloc=args.reloc,
+        codemodel=args.code_model,
+        codegen_opt=args.codegen_opt,
+    )
+
+
+def create_target_machine(args, jit=False):
+    from sspc import backend
+
+    opt_level, _ = OPT_LEVELS[args.opt_level]
+    return backend.create_target_machine(opt_level, **target_options(args, jit))
 
-args_parser = argparse.ArgumentParser()
-args_parser.add_argument('--trace', action='store_true')
 
+def build_module_units(args, module_ast, target_machine, jit=False):
+    from sspc import incremental
 
-def main():
-    args = args_parser.parse_args()
+    opt_level, size_level = OPT_LEVELS[args.opt_level]
+    cache = incremental.FunctionCache(get_cache_dir(args, 'functions')) if args.incremental else None
+    with timing.phase('compile-units'):
+        module_ref = incremental.compile_module_units(
+            module_ast, target_machine, opt_level, size_level,
+            cache=cache, jobs=args.jobs or 1, target_options=target_options(args, jit),
+        )
+    if args.trace and cache is not None:
+        print('function cache: %d reused, %d compiled' % (cache.hits, cache.misses))
+    return module_ref
 
-    llvm.initialize()
-    llvm.initialize_native_target()
-    llvm.initialize_native_asmprinter()
 
-    parser = Parser(debug=args.trace)
-    with open('test.ssp') as fp:
-        module_ast = parser.parse(fp.read())
-        module_ir = compile_module(module_ast)
+def build_optimized_module(args, module_ast, target_machine, ll_path=None, jit=False):
+    from sspc import backend
 
-    target = llvm.Target.from_default_triple()
-    target_machine = target.create_target_machine()
-    module_ir.triple = target_machine.triple
-    module_ir.data_layout = target_machine.target_data
-    module_ir_raw = str(module_ir).encode()
-    with open('test.ll', 'wb') as fp:
-        fp.write(module_ir_raw)
+    if args.incremental or args.jobs is not None:
+        module_ref = build_module_units(args, module_ast, target_machine, jit=jit)
+    else:
+        with timing.phase('codegen'):
+            module_ir = compile_module(module_ast)
+        backend.prepare_module(module_ir, target_machine)
+        with timing.phase('ir-text'):
+            module_ir_text = backend.module_ir_text(module_ir)
+        del module_ir
+        if ll_path is not None:
+            with timing.phase('write-ll'), open(ll_path, 'w') as fp:
+                fp.write(module_ir_text)
 
-    with open('test.o', 'wb') as fp:
-        subprocess.run(['llc', '-filetype=obj', '-'], input=module_ir_raw, stdout=fp)
-        fp.write(b'\0' * 512)
+        opt_level, size_level = OPT_LEVELS[args.opt_level]
+        with timing.phase('llvm-parse'):
+            module_ref = backend.parse_module(module_ir_text)
+        del module_ir_text
+        with timing.phase('optimize'):
+            backend.optimize_module(module_ref, target_machine, opt_level, size_level)
 
-    subprocess.run(['gcc', 'test.o', '-o', 'test'])
+    if args.emit_opt_ll is not None:
+        opt_ll_path = output_stem(args) + '.opt.ll' if args.emit_opt_ll is True else args.emit_opt_ll
+        with timing.phase('write-opt-ll'), open(opt_ll_path, 'w') as fp:
+            fp.write(str(module_ref))
+    return module_ref
+
+
+def emit_object_code(args, module_ref, target_machine):
+    from sspc import backend
+
+    if args.backend == 'llc':
+        cpu, features = backend.resolve_cpu(args.cpu, args.features)
+        with timing.phase('llc'):
+            return backend.emit_object_llc(
+                module_ref.as_bitcode(), OPT_LEVELS[args.opt_level][0],
+                cpu=cpu, features=features, reloc=args.reloc or 'pic',
+            )
+    with timing.phase('emit-object'):
+        return backend.emit_object(module_ref, target_machine)
+
+
+def compile_command(args):
+    if args.emit == 'shared' and args.reloc not in (None, 'pic'):
+        args_parser.error('--emit=shared requires --reloc=pic')
+    if args.connect is not None:
+        local_only = [
+            flag for flag, value in (
+                ('--emit=bc', args.emit == 'bc'),
+                ('--emit-opt-ll', args.emit_opt_ll is not None),
+                ('--save-temps', args.save_temps),
+                ('-j', args.jobs is not None),
+                ('--cache-dir', args.cache_dir is not None),
+            ) if value
+        ]
+        if local_only:
+            args_parser.error('%s cannot be used with --connect' % ', '.join(local_only))
+    if args.save_temps and (args.incremental or args.jobs is not None):
+        args_parser.error('--save-temps cannot be used with -j or --incremental, functions are compiled separately')
+
+    stem = output_stem(args)
+    ll_path = stem + '.ll' if args.save_temps else None
+    if args.emit == 'bc':
+        module_ast = read_sources(args)
+        target_machine = create_target_machine(args)
+        module_ref = build_optimized_module(args, module_ast, target_machine, ll_path=ll_path)
+        with timing.phase('write-bc'), open(stem + '.bc', 'wb') as fp:
+            fp.write(module_ref.as_bitcode())
+        return
+
+    with tempfile.TemporaryDirectory(prefix='sspc-') as temp_dir:
+        keep_object = args.save_temps or args.emit == 'obj'
+        object_path = stem + '.o' if keep_object else os.path.join(temp_dir, os.path.basename(stem) + '.o')
+        emit_output(args, stem, object_path, ll_path, keep_object)
+
+
+def emit_output(args, stem, object_path, ll_path, keep_object):
+    from sspc import backend
+
+    module_ast = None
+    if args.connect is not None:
+        from sspc import server
+
+        with timing.phase('remote-compile'):
+            description = server.compile_remote(args, object_path)
+    else:
+        module_ast = read_sources(args)
+        target_machine = create_target_machine(args)
+        module_ref = build_optimized_module(args, module_ast, target_machine, ll_path=ll_path)
+        object_code = emit_object_code(args, module_ref, target_machine)
+        del module_ref
+        with open(object_path, 'wb') as fp:
+            fp.write(object_code)
+        description = interface.describe(module_ast)
+
+    if keep_object:
+        with timing.phase('write-interface'):
+            interface.write_interface(stem + interface.SUFFIX, description, object_path)
+    if args.emit == 'obj':
+        return
+
+    objects = interface.imported_objects(description['imports'], import_search_path(args))
+    if args.emit == 'shared':
+        from sspc import cabi
+
+        if module_ast is None:
+            module_ast = read_sources(args)
+        library_path = args.output if args.output.endswith('.so') else args.output + '.so'
+        with timing.phase('link'):
+            backend.link_shared(object_path, library_path, objects)
+        with timing.phase('bindings'):
+            cabi.write_header(stem + '.h', module_ast, args.sources)
+            cabi.write_ctypes_stub(stem + '_ctypes.py', library_path, module_ast, args.sources)
+    else:
+        with timing.phase('link'):
+            backend.link_executable(object_path, args.output, objects)
     # subprocess.run(['ld', 'test.o', '-o', 'test'])
 
 
+def run_command(args):
+    from sspc import jit
+
+    module_ast = read_sources(args)
+    target_machine = create_target_machine(args, jit=True)
+    module_ref = build_optimized_module(args, module_ast, target_machine, jit=True)
+
+    cache = None
+    if not args.no_cache:
+        cache = jit.ObjectCache(get_cache_dir(args, 'objects'))
+
+    entry = {decl.name: decl for decl in module_ast.declarations}.get('main')
+    restype = None if entry is not None and entry.return_type is None else ctypes.c_int
+    objects = interface.imported_objects(interface.describe(module_ast)['imports'], import_search_path(args))
+    return jit.run(module_ref, target_machine, restype=restype, cache=cache, objects=objects)
+
+
+def report_timings(args, timer):
+    report = timer.format_json() if args.time_phases == 'json' else timer.format_table()
+    if args.time_phases_output is None:
+        print(report, file=sys.stderr)
+    else:
+        with open(args.time_phases_output, 'w') as fp:
+            fp.write(report + '\n')
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'serve':
+        from sspc import server
+
+        return server.serve(args.socket, jobs=args.jobs, cache_entries=args.cache_entries)
+
+    if args.time_phases is not None:
+        timing.start(trace_memory=not args.no_trace_memory)
+    try:
+        if args.command == 'run':
+            return run_command(args)
+        elif args.command == 'build':
+            from sspc.build import build_command
+
+            return build_command(args)
+        compile_command(args)
+    finally:
+        if args.time_phases is not None:
+            report_timings(args, timing.stop())
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,205 @@
+from collections import namedtuple
+
+import llvmlite.ir as ir
+
+from sspc.errors import CompileError
+
+IsaFeature = namedtuple('IsaFeature', ['features', 'leaf', 'register', 'bit', 'xcr0'])
+
+XCR0_AVX = 0x6
+XCR0_AVX512 = 0xe6
+
+X86_FEATURES = {
+    'sse3': IsaFeature('+sse3', 1, 'ecx', 0, 0),
+    'ssse3': IsaFeature('+ssse3', 1, 'ecx', 9, 0),
+    'sse4_1': IsaFeature('+sse4.1', 1, 'ecx', 19, 0),
+    'sse4_2': IsaFeature('+sse4.2', 1, 'ecx', 20, 0),
+    'popcnt': IsaFeature('+popcnt', 1, 'ecx', 23, 0),
+    'fma': IsaFeature('+fma', 1, 'ecx', 12, XCR0_AVX),
+    'avx': IsaFeature('+avx', 1, 'ecx', 28, XCR0_AVX),
+    'avx2': IsaFeature('+avx2', 7, 'ebx', 5, XCR0_AVX),
+    'bmi2': IsaFeature('+bmi2', 7, 'ebx', 8, 0),
+    'avx512f': IsaFeature('+avx512f', 7, 'ebx', 16, XCR0_AVX512),
+    'avx512bw': IsaFeature('+avx512bw', 7, 'ebx', 30, XCR0_AVX512),
+}
+
+DEFAULT = 'default'
+
+OSXSAVE_BIT = 27
+
+CONSTRUCTOR_NAME = 'sspc.multiversion.init'
+
+RESOLVER_SUFFIX = '.resolver'
+
+X86_ARCHES = ('x86_64', 'amd64', 'i386', 'i486', 'i586', 'i686')
+
+I8 = ir.IntType(8)
+I32 = ir.IntType(32)
+VOID_FUNCTION = ir.FunctionType(ir.VoidType(), [])
+CPUID = ir.FunctionType(ir.LiteralStructType([I32] * 4), [I32, I32])
+XGETBV = ir.FunctionType(ir.LiteralStructType([I32] * 2), [I32])
+CTOR_ENTRY = ir.LiteralStructType([I32, VOID_FUNCTION.as_pointer(), I8.as_pointer()])
+
+
+class FunctionAttributes(ir.values.FunctionAttributes):
+    def add(self, name):
+        if name.startswith('"'):
+            return set.add(self, name)
+        return super().add(name)
+
+
+def target_clones(decorators):
+    targets = []
+    for decorator in decorators:
+        if decorator.name != 'target_clones':
+            raise CompileError('Unknown function decorator "@%s"' % decorator.name)
+
+        for arg in decorator.args:
+            target = arg.value
+            if arg.name is not None or not isinstance(target, str):
+                raise CompileError('@target_clones expects ISA names, e.g. @target_clones(avx2, sse4_2)')
+            elif target != DEFAULT and target not in X86_FEATURES:
+                raise CompileError('Unknown ISA "%s", expected one of: %s' % (target, ', '.join(X86_FEATURES)))
+            elif target not in targets:
+                targets.append(target)
+
+    if targets:
+        if DEFAULT in targets:
+            targets.remove(DEFAULT)
+        targets.append(DEFAULT)
+    return targets
+
+
+def declare_clones(func, targets):
+    clones = []
+    for target in targets:
+        clone = ir.Function(func.module, func.ftype, name='%s.%s' % (func.name, target))
+        clone.linkage = 'internal'
+        clone.attributes = FunctionAttributes()
+        if target != DEFAULT:
+            clone.attributes.add('"target-features"="%s"' % X86_FEATURES[target].features)
+        for arg, func_arg in zip(clone.args, func.args):
+            arg.name = func_arg.name
+        clones.append((target, clone))
+    return clones
+
+
+def emit_cpuid(builder, leaf):
+    args = [ir.Constant(I32, leaf), ir.Constant(I32, 0)]
+    registers = builder.asm(CPUID, 'cpuid', '={ax},={bx},={cx},={dx},{ax},{cx}', args, False)
+    return [builder.extract_value(registers, index) for index in range(4)]
+
+
+def emit_guarded(builder, condition, emit):
+    entry_block = builder.block
+    with builder.if_then(condition):
+        values = emit()
+        then_block = builder.block
+
+    results = []
+    for value in values:
+        phi = builder.phi(value.type)
+        phi.add_incoming(ir.Constant(value.type, 0), entry_block)
+        phi.add_incoming(value, then_block)
+        results.append(phi)
+    return results
+
+
+def emit_cpu_features(builder):
+    max_leaf, _, _, _ = emit_cpuid(builder, 0)
+    _, _, ecx1, edx1 = emit_cpuid(builder, 1)
+
+    osxsave = builder.icmp_unsigned('!=', builder.and_(ecx1, ir.Constant(I32, 1 << OSXSAVE_BIT)), ir.Constant(I32, 0))
+    xcr0, = emit_guarded(builder, osxsave, lambda: [
+        builder.extract_value(builder.asm(XGETBV, 'xgetbv', '={ax},={dx},{cx}', [ir.Constant(I32, 0)], False), 0),
+    ])
+
+    has_leaf7 = builder.icmp_unsigned('>=', max_leaf, ir.Constant(I32, 7))
+    ebx7, ecx7 = emit_guarded(builder, has_leaf7, lambda: emit_cpuid(builder, 7)[1:3])
+
+    return xcr0, {(1, 'ecx'): ecx1, (1, 'edx'): edx1, (7, 'ebx'): ebx7, (7, 'ecx'): ecx7}
+
+
+def emit_supports(builder, feature, xcr0, registers):
+    bit = builder.and_(registers[feature.leaf, feature.register], ir.Constant(I32, 1 << feature.bit))
+    result = builder.icmp_unsigned('!=', bit, ir.Constant(I32, 0))
+    if feature.xcr0:
+        mask = ir.Constant(I32, feature.xcr0)
+        result = builder.and_(result, builder.icmp_unsigned('==', builder.and_(xcr0, mask), mask))
+    return result
+
+
+def module_constructor(module):
+    constructor = module.globals.get(CONSTRUCTOR_NAME)
+    if constructor is not None:
+        return constructor
+
+    constructor = ir.Function(module, VOID_FUNCTION, name=CONSTRUCTOR_NAME)
+    constructor.linkage = 'internal'
+    ir.IRBuilder(constructor.append_basic_block()).ret_void()
+
+    entries_type = ir.ArrayType(CTOR_ENTRY, 1)
+    entries = ir.GlobalVariable(module, entries_type, name='llvm.global_ctors')
+    entries.linkage = 'appending'
+    entries.initializer = ir.Constant(entries_type, [
+        ir.Constant(CTOR_ENTRY, [ir.Constant(I32, 65535), constructor, ir.Constant(I8.as_pointer(), None)]),
+    ])
+    return constructor
+
+
+def define_resolver(func, clones, resolved):
+    resolver = ir.Function(func.module, VOID_FUNCTION, name=func.name + RESOLVER_SUFFIX)
+    resolver.linkage = 'internal'
+    resolver.attributes.add('noinline')
+    resolver.attributes.add('cold')
+    builder = ir.IRBuilder(resolver.append_basic_block())
+
+    xcr0, registers = emit_cpu_features(builder)
+    selected = dict(clones)[DEFAULT]
+    for target, clone in reversed(clones):
+        if target != DEFAULT:
+            supported = emit_supports(builder, X86_FEATURES[target], xcr0, registers)
+            selected = builder.select(supported, clone, selected)
+    builder.store(selected, resolved)
+    builder.ret_void()
+
+    constructor = module_constructor(func.module)
+    entry = constructor.blocks[0]
+    builder = ir.IRBuilder(entry)
+    builder.position_before(entry.terminator)
+    builder.call(resolver, [])
+    return resolver
+
+
+def define_dispatcher(func, clones):
+    pointer_type = func.ftype.as_pointer()
+    resolved = ir.GlobalVariable(func.module, pointer_type, name=func.name + '.resolved')
+    resolved.linkage = 'internal'
+    resolved.initializer = ir.Constant(pointer_type, None)
+    resolver = define_resolver(func, clones, resolved)
+
+    builder = ir.IRBuilder(func.append_basic_block())
+    target = builder.load(resolved)
+    entry_block = builder.block
+    with builder.if_then(builder.icmp_unsigned('==', target, ir.Constant(pointer_type, None)), likely=False):
+        builder.call(resolver, [])
+        late_target = builder.load(resolved)
+        resolve_block = builder.block
+
+    callee = builder.phi(pointer_type)
+    callee.add_incoming(target, entry_block)
+    callee.add_incoming(late_target, resolve_block)
+    result = builder.call(callee, list(func.args), tail=True)
+    if isinstance(func.ftype.return_type, ir.VoidType):
+        builder.ret_void()
+    else:
+        builder.ret(result)
+    return func
+
+
+def check_target(module, triple):
+    if triple.split('-')[0] in X86_ARCHES:
+        return
+    functions = [name[:-len(RESOLVER_SUFFIX)] for name in module.globals if name.endswith(RESOLVER_SUFFIX)]
+    if functions:
+        raise CompileError('@target_clones on %s requires an x86 target, not %s' % (', '.join(functions), triple))
@@ -0,0 +1,284 @@
+import llvmlite.ir as ir
+
+from sspc import ast, statement, expression, datatypes
+from sspc.parser.parser import binary_ops, precedence, unary_ops
+from sspc.parser.tokens import TOKEN_CODES
+
+(
+    ID, INTEGER, TRUE, FALSE, LPAREN, RPAREN, COMMA, COLON, ARROW, ASSIGN, AT,
+    DEF, IMPORT, VAR, LET, IF, ELSE, WHILE, FOR, IN, RETURN, PASS, NEWLINE, INDENT, DEDENT, EOF,
+) = (TOKEN_CODES[name] for name in (
+    'ID', 'INTEGER', 'TRUE', 'FALSE', 'LPAREN', 'RPAREN', 'COMMA', 'COLON', 'ARROW', 'ASSIGN', 'AT',
+    'DEF', 'IMPORT', 'VAR', 'LET', 'IF', 'ELSE', 'WHILE', 'FOR', 'IN', 'RETURN', 'PASS', 'NEWLINE', 'INDENT', 'DEDENT',
+    'EOF',
+))
+
+BINARY_PRECEDENCE = {
+    TOKEN_CODES[token_type]: level
+    for level, (_, *token_types) in enumerate(precedence, 1)
+    for token_type in token_types
+    if token_type in TOKEN_CODES
+}
+
+UNARY_TOKENS = frozenset(TOKEN_CODES[name] for name in ('PLUS', 'MINUS', 'TILDE', 'BANG'))
+
+EXPRESSION_START_TOKENS = UNARY_TOKENS | {INTEGER, TRUE, FALSE, LPAREN, ID}
+
+STATEMENT_START_TOKENS = EXPRESSION_START_TOKENS | {VAR, LET, IF, WHILE, FOR, AT, RETURN}
+
+
+class DescentParser:
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.types = buffer.types
+        self.values = buffer.values
+        self.constants = buffer.constants
+        self.pos = 0
+
+    def peek(self, offset=0):
+        return self.types[self.pos + offset]
+
+    def advance(self):
+        value = self.constants[self.values[self.pos]]
+        self.pos += 1
+        return value
+
+    def accept(self, token_type):
+        if self.types[self.pos] == token_type:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, token_type):
+        if self.types[self.pos] != token_type:
+            self.error()
+        return self.advance()
+
+    def error(self):
+        raise SyntaxError(self.buffer.token(self.pos) if self.pos < len(self.buffer) else None)
+
+    def parse_translation_unit(self):
+        declarations = [self.parse_declaration()]
+        while self.pos < len(self.types):
+            if self.types[self.pos] == EOF:
+                self.pos += 1
+            else:
+                declarations.append(self.parse_declaration())
+        return declarations
+
+    def parse_declaration(self):
+        if self.accept(IMPORT):
+            name = self.expect(ID)
+            self.expect(NEWLINE)
+            return ast.import_declaration(name)
+        return self.parse_function_declaration()
+
+    def parse_function_declaration(self):
+        decorators = self.parse_decorator_list()
+        self.expect(DEF)
+        name = self.expect(ID)
+        self.expect(LPAREN)
+        arguments = self.parse_arglist()
+        self.expect(RPAREN)
+        return_type = None
+        if self.accept(ARROW):
+            return_type = self.parse_type()
+        self.expect(COLON)
+        return ast.function_declaration(name, arguments, return_type, self.parse_compound_stmt(), decorators)
+
+    def parse_arglist(self):
+        arguments = []
+        if self.peek() == ID:
+            arguments.append(self.parse_argument())
+        while self.accept(COMMA):
+            arguments.append(self.parse_argument())
+        return arguments
+
+    def parse_argument(self):
+        name = self.expect(ID)
+        self.expect(COLON)
+        return ast.argument(name, self.parse_type())
+
+    def parse_type(self):
+        return self.expect(ID)
+
+    def parse_compound_stmt(self):
+        self.expect(INDENT)
+        if self.accept(PASS):
+            self.expect(DEDENT)
+            return []
+
+        body = self.parse_stmt_list()
+        self.expect(DEDENT)
+        return body
+
+    def parse_stmt_list(self):
+        body = [self.parse_stmt()]
+        while True:
+            token_type = self.peek()
+            if token_type == NEWLINE:
+                self.pos += 1
+                body.append(self.parse_stmt())
+            elif token_type in STATEMENT_START_TOKENS:
+                body.append(self.parse_stmt())
+            else:
+                return body
+
+    def parse_stmt(self):
+        token_type = self.peek()
+        if token_type == VAR:
+            return self.parse_var()
+        elif token_type == LET:
+            return self.parse_let()
+        elif token_type == IF:
+            return self.parse_if()
+        elif token_type == WHILE:
+            return self.parse_while()
+        elif token_type == FOR or token_type == AT:
+            return self.parse_for()
+        elif token_type == RETURN:
+            return self.parse_return()
+        elif token_type == ID and self.peek(1) == ASSIGN:
+            return self.parse_assignment()
+        elif token_type in EXPRESSION_START_TOKENS:
+            return self.parse_expression()
+        self.error()
+
+    def parse_let(self):
+        self.expect(LET)
+        name = self.expect(ID)
+        dtype = None
+        if self.accept(COLON):
+            dtype = self.parse_type()
+        self.expect(ASSIGN)
+        return statement.LetStmt(name=name, value=self.parse_expression(), dtype=dtype)
+
+    def parse_var(self):
+        self.expect(VAR)
+        name = self.expect(ID)
+        dtype = None
+        if self.accept(COLON):
+            dtype = self.parse_type()
+        self.expect(ASSIGN)
+        return statement.VarStmt(name=name, value=self.parse_expression(), dtype=dtype)
+
+    def parse_if(self):
+        self.expect(IF)
+        condition = self.parse_expression()
+        self.expect(COLON)
+        then_body = self.parse_compound_stmt()
+        if self.accept(ELSE):
+            self.expect(COLON)
+            return statement.IfStmt(condition=condition, then_body=then_body, else_body=self.parse_compound_stmt())
+        return statement.IfStmt(condition=condition, then_body=then_body)
+
+    def parse_while(self):
+        self.expect(WHILE)
+        condition = self.parse_expression()
+        self.expect(COLON)
+        return statement.WhileStmt(condition=condition, body=self.parse_compound_stmt())
+
+    def parse_for(self):
+        decorators = self.parse_decorator_list()
+        self.expect(FOR)
+        name = self.expect(ID)
+        self.expect(IN)
+        if self.peek() != ID or self.constants[self.values[self.pos]] != 'range':
+            self.error()
+        self.pos += 1
+        self.expect(LPAREN)
+        args = self.parse_expression_list()
+        self.expect(RPAREN)
+        self.expect(COLON)
+        return statement.ForStmt(name=name, args=args, body=self.parse_compound_stmt(), decorators=decorators)
+
+    def parse_decorator_list(self):
+        decorators = []
+        while self.accept(AT):
+            name = self.expect(ID)
+            args = []
+            if self.accept(LPAREN):
+                args = self.parse_decorator_args()
+                self.expect(RPAREN)
+            self.expect(NEWLINE)
+            decorators.append(ast.decorator(name, args))
+        return decorators
+
+    def parse_decorator_args(self):
+        args = []
+        if self.peek() in EXPRESSION_START_TOKENS:
+            args.append(self.parse_decorator_arg())
+        while self.accept(COMMA):
+            args.append(self.parse_decorator_arg())
+        return args
+
+    def parse_decorator_arg(self):
+        if self.peek() == ID and self.peek(1) == ASSIGN:
+            name = self.advance()
+            self.pos += 1
+            return ast.decorator_argument(name, self.parse_expression())
+        return ast.decorator_argument(None, self.parse_expression())
+
+    def parse_return(self):
+        self.expect(RETURN)
+        if self.peek() in EXPRESSION_START_TOKENS:
+            return statement.ReturnStmt(self.parse_expression())
+        return statement.ReturnStmt(None)
+
+    def parse_assignment(self):
+        target = self.expect(ID)
+        self.expect(ASSIGN)
+        return statement.AssignStmt(target=target, value=self.parse_expression())
+
+    def parse_expression(self, min_precedence=1):
+        lhs = self.parse_unary()
+        types = self.types
+        while True:
+            level = BINARY_PRECEDENCE.get(types[self.pos])
+            if level is None or level < min_precedence:
+                return lhs
+
+            operator = self.advance()
+            rhs = self.parse_expression(level + 1)
+            lhs = expression.OpBinary(a=lhs, b=rhs, operation=binary_ops.get(operator))
+
+    def parse_unary(self):
+        if self.peek() in UNARY_TOKENS:
+            operator = self.advance()
+            return expression.OpUnary(x=self.parse_unary(), operation=unary_ops.get(operator))
+        return self.parse_call()
+
+    def parse_call(self):
+        rvalue = self.parse_rvalue()
+        if self.accept(LPAREN):
+            args = self.parse_expression_list()
+            self.expect(RPAREN)
+            return expression.Call(rvalue, args)
+        return rvalue
+
+    def parse_expression_list(self):
+        args = []
+        if self.peek() in EXPRESSION_START_TOKENS:
+            args.append(self.parse_expression())
+        while self.accept(COMMA):
+            args.append(self.parse_expression())
+        return args
+
+    def parse_rvalue(self):
+        token_type = self.types[self.pos]
+        if token_type == INTEGER:
+            return expression.IntLiteral(self.advance())
+        elif token_type == TRUE:
+            self.pos += 1
+            return ir.Constant(datatypes.BOOL, 1)
+        elif token_type == FALSE:
+            self.pos += 1
+            return ir.Constant(datatypes.BOOL, 0)
+        elif token_type == ID:
+            return self.advance()
+        elif token_type == LPAREN:
+            self.pos += 1
+            result = self.parse_expression()
+            self.expect(RPAREN)
+            return result
+        self.error()
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ARROW', 'ASSIGN', 'AT', 'BANG', 'BITWISE_AND', 'BITWISE_OR', 'BITWISE_XOR', 'COLON', 'COMMA', 'DEDENT', 'DEF', 'DIV', 'ELSE', 'EOF', 'EQ', 'FALSE', 'FLOAT', 'FOR', 'GE', 'GT', 'ID', 'IF', 'IMPORT', 'IN', 'INDENT', 'INTEGER', 'LE', 'LET', 'LOGICAL_AND', 'LOGICAL_OR', 'LPAREN', 'LT', 'MINUS', 'MOD', 'MUL', 'NE', 'NEWLINE', 'PASS', 'PLUS', 'RETURN', 'RPAREN', 'SEMI', 'STRING', 'TILDE', 'TRUE', 'VAR', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_ID>[_a-zA-Z][_a-zA-Z0-9]*)|(?P<t_INTEGER>\\d+)|(?P<t_FLOAT>((\\d*\\.\\d+)([Ee][+-]?\\d+)?|([1-9]\\d*[Ee][+-]?\\d+)))|(?P<t_STRING>\\".*?\\")|(?P<t_newline>\\n+)|(?P<t_comment>\\s*\\043[^\\n]*)|(?P<t_LOGICAL_OR>\\|\\|)|(?P<t_PLUS>\\+)|(?P<t_MUL>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LE><=)|(?P<t_GE>>=)|(?P<t_EQ>==)|(?P<t_NE>!=)|(?P<t_BITWISE_XOR>\\^)|(?P<t_BITWISE_OR>\\|)|(?P<t_LOGICAL_AND>&&)|(?P<t_COMMA>\\,)|(?P<t_ARROW>->)|(?P<t_ASSIGN>=)|(?P<t_MINUS>-)|(?P<t_DIV>/)|(?P<t_MOD>%)|(?P<t_LT><)|(?P<t_GT>>)|(?P<t_BITWISE_AND>&)|(?P<t_BANG>!)|(?P<t_TILDE>~)|(?P<t_COLON>:)|(?P<t_SEMI>;)|(?P<t_AT>@)', [None, ('t_ID', 'ID'), ('t_INTEGER', 'INTEGER'), ('t_FLOAT', 'FLOAT'), None, None, None, None, ('t_STRING', 'STRING'), ('t_newline', 'newline'), ('t_comment', 'comment'), (None, 'LOGICAL_OR'), (None, 'PLUS'), (None, 'MUL'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LE'), (None, 'GE'), (None, 'EQ'), (None, 'NE'), (None, 'BITWISE_XOR'), (None, 'BITWISE_OR'), (None, 'LOGICAL_AND'), (None, 'COMMA'), (None, 'ARROW'), (None, 'ASSIGN'), (None, 'MINUS'), (None, 'DIV'), (None, 'MOD'), (None, 'LT'), (None, 'GT'), (None, 'BITWISE_AND'), (None, 'BANG'), (None, 'TILDE'), (None, 'COLON'), (None, 'SEMI'), (None, 'AT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -1,18 +1,24 @@
+import os
 from collections import deque
 
 import llvmlite.ir as ir
 from ply import lex, yacc
 
-from sspc import ast, statement, expression, datatypes
+from sspc import ast, statement, expression, datatypes, timing
+
+LEXTAB_MODULE = 'sspc.parser.lextab'
+PARSETAB_MODULE = 'sspc.parser.parsetab'
 
 keywords = {
     'def': 'DEF',
+    'import': 'IMPORT',
     'var': 'VAR',
     'let': 'LET',
     'if': 'IF',
     'else': 'ELSE',
     'while': 'WHILE',
     'for': 'FOR',
+    'in': 'IN',
     'pass': 'PASS',
     'return': 'RETURN',
     'true': 'TRUE',
@@ -50,6 +56,7 @@ tokens = (
     'COLON',
     'SEMI',
     'ARROW',
+    'AT',
     'NEWLINE',
     'INDENT',
     'DEDENT',
@@ -81,6 +88,7 @@ t_COMMA = r'\,'
 t_COLON = r':'
 t_SEMI = r';'
 t_ARROW = r'->'
+t_AT = r'@'
 
 t_ignore = " \t"
 
@@ -151,9 +159,19 @@ def p_declaration(p):
     p[0] = p[1]
 
 
+def p_declaration_import(p):
+    """declaration : IMPORT ID NEWLINE"""
+    p[0] = ast.import_declaration(p[2])
+
+
 def p_function_declaration(p):
     """function_declaration : DEF ID LPAREN arglist RPAREN function_return_type COLON compound_stmt"""
-    p[0] = ast.function_declaration(p[2], p[4], p[6], p[8])
+    p[0] = ast.function_declaration(p[2], p[4], p[6], p[8], [])
+
+
+def p_function_declaration_decorated(p):
+    """function_declaration : decorator_list DEF ID LPAREN arglist RPAREN function_return_type COLON compound_stmt"""
+    p[0] = ast.function_declaration(p[3], p[5], p[7], p[9], p[1])
 
 
 def p_arglist_empty(p):
@@ -219,9 +237,11 @@ def p_stmt_1(p):
     """
     stmt : expression
          | assignment
+         | var
          | let
          | if
          | while
+         | for
          | return
     """
     p[0] = p[1]
@@ -238,6 +258,17 @@ def p_let(p):
         p[0] = statement.LetStmt(name=p[2], value=p[4])
 
 
+def p_var(p):
+    """
+    var : VAR ID COLON type ASSIGN expression
+        | VAR ID ASSIGN expression
+    """
+    if len(p) == 7:
+        p[0] = statement.VarStmt(name=p[2], value=p[6], dtype=p[4])
+    else:
+        p[0] = statement.VarStmt(name=p[2], value=p[4])
+
+
 def p_if(p):
     """
     if : IF expression COLON compound_stmt
@@ -259,6 +290,72 @@ def p_while(p):
     p[0] = statement.WhileStmt(condition=p[2], body=p[4])
 
 
+def for_stmt(p, offset, decorators):
+    if p[offset + 3] != 'range':
+        raise SyntaxError(p.slice[offset + 3])
+    return statement.ForStmt(name=p[offset + 1], args=p[offset + 5], body=p[offset + 8], decorators=decorators)
+
+
+def p_for(p):
+    """
+    for : FOR ID IN ID LPAREN expression_list RPAREN COLON compound_stmt
+    """
+    p[0] = for_stmt(p, 1, [])
+
+
+def p_for_decorated(p):
+    """
+    for : decorator_list FOR ID IN ID LPAREN expression_list RPAREN COLON compound_stmt
+    """
+    p[0] = for_stmt(p, 2, p[1])
+
+
+def p_decorator_list(p):
+    """
+    decorator_list : decorator_list decorator
+                   | decorator
+    """
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[2])
+        p[0] = p[1]
+
+
+def p_decorator(p):
+    """
+    decorator : AT ID LPAREN decorator_args RPAREN NEWLINE
+              | AT ID NEWLINE
+    """
+    p[0] = ast.decorator(p[2], p[4] if len(p) == 7 else [])
+
+
+def p_decorator_args_empty(p):
+    """decorator_args :"""
+    p[0] = []
+
+
+def p_decorator_args(p):
+    """
+    decorator_args : decorator_args COMMA decorator_arg
+                   | decorator_arg
+    """
+    if len(p) == 2:
+        p[0] = [p[1]]
+    else:
+        p[1].append(p[3])
+        p[0] = p[1]
+
+
+def p_decorator_arg(p):
+    """
+    decorator_arg : ID ASSIGN expression
+                  | expression
+    """
+    if len(p) == 4:
+        p[0] = ast.decorator_argument(p[1], p[3])
+    else:
+        p[0] = ast.decorator_argument(None, p[1])
 
 
 def p_return(p):
@@ -271,12 +368,14 @@ def p_return(p):
 
 def p_assignment(p):
     """assignment : lvalue ASSIGN expression"""
-    p[0] = ast.assign(p[2], p[4])
+    p[0] = statement.AssignStmt(target=p[1], value=p[3])
 
 
 unary_ops = {
     '+': expression.OpUnaryType.PLUS,
     '-': expression.OpUnaryType.MINUS,
+    '~': expression.OpUnaryType.BITWISE_NOT,
+    '!': expression.OpUnaryType.LOGICAL_NOT,
 }
 
 binary_ops = {
@@ -377,7 +476,7 @@ def p_rvalue_int_literal(p):
     """
     rvalue : INTEGER
     """
-    p[0] = ir.Constant(datatypes.Integer(32, False), p[1])
+    p[0] = expression.IntLiteral(p[1])
 
 
 # def p_rvalue_float_literal(p):
@@ -395,12 +494,12 @@ def p_rvalue_int_literal(p):
 
 def p_rvalue_true(p):
     """rvalue : TRUE"""
-    p[0] = ir.Constant(datatypes.Boolean(), 1)
+    p[0] = ir.Constant(datatypes.BOOL, 1)
 
 
 def p_rvalue_false(p):
     """rvalue : FALSE"""
-    p[0] = ir.Constant(datatypes.Boolean(), 0)
+    p[0] = ir.Constant(datatypes.BOOL, 0)
 
 
 def p_rvalue_parentheses(p):
@@ -427,10 +526,20 @@ def p_error(p):
     raise SyntaxError(p)
 
 
+def build_tables():
+    outputdir = os.path.dirname(os.path.abspath(__file__))
+    lextab_path = os.path.join(outputdir, LEXTAB_MODULE.rpartition('.')[2] + '.py')
+    if os.path.exists(lextab_path):
+        os.remove(lextab_path)
+
+    lex.lex(optimize=True, lextab=LEXTAB_MODULE, outputdir=outputdir)
+    yacc.yacc(start='translation_unit', tabmodule=PARSETAB_MODULE, outputdir=outputdir, debug=False)
+
+
 class Lexer:
     def __init__(self, debug=False):
         self.debug = debug
-        self.lexer = lex.lex()
+        self.lexer = lex.lex(optimize=True, lextab=LEXTAB_MODULE)
         self.token_stream = iter(())
 
     def input(self, s):
@@ -502,14 +611,72 @@ class Lexer:
 
 
 class Parser(object):
-    def __init__(self, debug=False):
+    ENGINES = ('lalr', 'descent')
+    LEXERS = ('stream', 'buffer')
+
+    def __init__(self, debug=False, engine='lalr', lexer=None):
+        if engine not in self.ENGINES:
+            raise ValueError('Unknown parser engine %s' % engine)
+        if lexer is not None and lexer not in self.LEXERS:
+            raise ValueError('Unknown lexer mode %s' % lexer)
+
         self.debug = debug
+        self.engine = engine
+        self.lexer_mode = lexer
         self.lexer = Lexer(debug=self.debug)
-        self.parser = yacc.yacc(start='translation_unit')
+        if engine == 'descent':
+            self.parser = None
+            return
+
+        self.parser = yacc.yacc(
+            start='translation_unit',
+            tabmodule=PARSETAB_MODULE,
+            optimize=True,
+            write_tables=False,
+            debug=False,
+            errorlog=yacc.NullLogger(),
+        )
+
+    def select_lexer(self, code):
+        if self.lexer_mode is not None:
+            return self.lexer_mode
+        # the stream lexer needs text; bytes and mmapped sources are tokenized in place
+        return 'stream' if self.engine == 'lalr' and isinstance(code, str) else 'buffer'
+
+    def tokenize(self, code):
+        from sspc.parser.tokens import TokenBuffer, tokenize
+
+        if self.select_lexer(code) == 'buffer':
+            return tokenize(code)
+
+        self.lexer.input(self._decode(code))
+        return TokenBuffer.from_tokens(iter(self.lexer.token, None))
+
+    @staticmethod
+    def _decode(code):
+        if isinstance(code, str):
+            return code
+        return bytes(code).decode()
 
     def parse(self, code):
-        self.lexer.input(code)
-        result = self.parser.parse(lexer=self.lexer, debug=self.debug)
+        if self.engine == 'descent':
+            from sspc.parser.descent import DescentParser
+
+            with timing.phase('lex'):
+                tokens = self.tokenize(code)
+            with timing.phase('parse'):
+                result = DescentParser(tokens).parse_translation_unit()
+        elif self.select_lexer(code) == 'buffer':
+            from sspc.parser.tokens import BufferLexer
+
+            with timing.phase('lex'):
+                tokens = self.tokenize(code)
+            with timing.phase('parse'):
+                result = self.parser.parse(lexer=BufferLexer(tokens, debug=self.debug), debug=self.debug)
+        else:
+            with timing.phase('lex+parse'):
+                self.lexer.input(self._decode(code))
+                result = self.parser.parse(lexer=self.lexer, debug=self.debug)
         return ast.module(result)
 
         # while True:
@@ -517,3 +684,7 @@ class Parser(object):
         #     if not t:
         #         break
         #     print(t)
+
+
+if __name__ == '__main__':
+    build_tables()
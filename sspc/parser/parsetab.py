@@ -0,0 +1,109 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'translation_unitleftLOGICAL_ORleftLOGICAL_ANDleftLTLEGTGEEQNEleftBITWISE_ORBITWISE_XORleftBITWISE_ANDleftPLUSMINUSleftMULDIVMODrightLOGICAL_NOTrightUNARY_PLUSUNARY_MINUSBITWISE_NOTARROW ASSIGN AT BANG BITWISE_AND BITWISE_OR BITWISE_XOR COLON COMMA DEDENT DEF DIV ELSE EOF EQ FALSE FLOAT FOR GE GT ID IF IMPORT IN INDENT INTEGER LE LET LOGICAL_AND LOGICAL_OR LPAREN LT MINUS MOD MUL NE NEWLINE PASS PLUS RETURN RPAREN SEMI STRING TILDE TRUE VAR WHILE\n    translation_unit : translation_unit declaration\n                     | declaration\n    translation_unit : translation_unit EOFdeclaration : function_declarationdeclaration : IMPORT ID NEWLINEfunction_declaration : DEF ID LPAREN arglist RPAREN function_return_type COLON compound_stmtfunction_declaration : decorator_list DEF ID LPAREN arglist RPAREN function_return_type COLON compound_stmtarglist :\n    arglist : arglist COMMA argument\n            | argument\n    argument : ID COLON typefunction_return_type : ARROW typefunction_return_type :compound_stmt : INDENT stmt_list DEDENTcompound_stmt : INDENT PASS DEDENT\n    stmt_list : stmt_list NEWLINE stmt\n              | stmt_list stmt_list\n              | stmt\n    \n    stmt : expression\n         | assignment\n         | var\n         | let\n         | if\n         | while\n         | for\n         | return\n    \n    let : LET ID COLON type ASSIGN expression\n        | LET ID ASSIGN expression\n    \n    var : VAR ID COLON type ASSIGN expression\n        | VAR ID ASSIGN expression\n    \n    if : IF expression COLON compound_stmt\n    \n    if : IF expression COLON compound_stmt ELSE COLON compound_stmt\n    \n    while : WHILE expression COLON compound_stmt\n    \n    for : FOR ID IN ID LPAREN expression_list RPAREN COLON compound_stmt\n    \n    for : decorator_list FOR ID IN ID LPAREN expression_list RPAREN COLON compound_stmt\n    \n    decorator_list : decorator_list decorator\n                   | decorator\n    \n    decorator : AT ID LPAREN decorator_args RPAREN NEWLINE\n              | AT ID NEWLINE\n    decorator_args :\n    decorator_args : decorator_args COMMA decorator_arg\n                   | decorator_arg\n    \n    decorator_arg : ID ASSIGN expression\n                  | expression\n    \n    return : RETURN expression\n           | RETURN\n    assignment : lvalue ASSIGN expression\n    expression : rvalue\n    \n    expression : PLUS expression %prec UNARY_PLUS\n               | MINUS expression %prec UNARY_MINUS\n               | TILDE expression %prec BITWISE_NOT\n               | BANG expression %prec LOGICAL_NOT\n\n    \n    expression : expression PLUS expression\n               | expression MINUS expression\n               | expression MUL expression\n               | expression DIV expression\n               | expression MOD expression\n               | expression BITWISE_AND expression\n               | expression BITWISE_XOR expression\n               | expression BITWISE_OR expression\n               | expression EQ expression\n               | expression LT expression\n               | expression GT expression\n               | expression LE expression\n               | expression GE expression\n               | expression NE expression\n               | expression LOGICAL_AND expression\n               | expression LOGICAL_OR expression\n    expression : rvalue LPAREN expression_list RPARENexpression_list :\n    expression_list : expression_list COMMA expression\n                    | expression\n    \n    rvalue : INTEGER\n    rvalue : TRUErvalue : FALSErvalue : LPAREN expression RPARENrvalue : IDlvalue : IDtype : ID'
+    
+_lr_action_items = {'IMPORT':([0,1,2,3,9,10,16,101,125,127,129,],[4,4,-2,-4,-1,-3,-5,-6,-7,-14,-15,]),'DEF':([0,1,2,3,6,7,9,10,14,16,20,76,101,125,127,129,],[5,5,-2,-4,13,-37,-1,-3,-36,-5,-39,-38,-6,-7,-14,-15,]),'AT':([0,1,2,3,6,7,9,10,14,16,20,30,35,36,37,44,64,65,66,67,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,101,102,105,107,108,109,110,111,112,113,114,115,118,123,124,125,126,127,128,129,137,138,139,149,151,152,153,161,162,166,171,173,],[8,8,-2,-4,8,-37,-1,-3,-36,-5,-39,-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-38,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-6,8,8,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,8,-46,-7,8,-14,8,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'$end':([1,2,3,9,10,16,101,125,127,129,],[0,-2,-4,-1,-3,-5,-6,-7,-14,-15,]),'EOF':([1,2,3,9,10,16,101,125,127,129,],[10,-2,-4,-1,-3,-5,-6,-7,-14,-15,]),'ID':([4,5,8,13,17,19,24,26,30,31,32,33,34,35,36,37,38,40,42,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,71,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,100,102,105,107,108,109,110,111,112,113,114,115,117,118,119,120,121,122,124,126,127,128,129,130,136,137,138,139,140,141,142,143,146,149,151,152,153,155,156,157,159,161,162,165,166,171,173,],[11,12,15,18,21,25,21,44,-48,44,44,44,44,-73,-74,-75,68,21,44,-77,25,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-49,-50,-51,-52,68,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,44,118,118,-18,-19,-20,-21,-22,-23,-24,-25,-26,131,-77,132,44,44,135,44,118,-14,118,-15,44,147,-45,-16,-47,68,44,68,44,154,-30,-28,-31,-33,160,44,44,44,-29,-27,44,-32,-34,-35,]),'FOR':([7,14,20,30,35,36,37,44,64,65,66,67,75,76,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,102,105,107,108,109,110,111,112,113,114,115,118,123,124,126,127,128,129,137,138,139,149,151,152,153,161,162,166,171,173,],[-37,-36,-39,-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-38,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,122,122,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,136,-46,122,-14,122,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'NEWLINE':([11,15,30,35,36,37,44,45,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,105,107,108,109,110,111,112,113,114,115,118,124,126,127,129,137,138,139,149,151,152,153,161,162,166,171,173,],[16,20,-48,-73,-74,-75,-77,76,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,128,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,-46,128,-14,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'LPAREN':([12,15,18,19,25,26,30,31,32,33,34,35,36,37,42,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,100,102,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,137,138,139,141,143,149,151,152,153,154,156,157,159,160,161,162,165,166,171,173,],[17,19,24,26,-77,26,63,26,26,26,26,-73,-74,-75,26,-77,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,26,26,26,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,26,26,26,26,-14,26,-15,26,-45,-16,-47,26,26,-30,-28,-31,-33,159,26,26,26,165,-29,-27,26,-32,-34,-35,]),'RPAREN':([17,19,22,23,24,25,27,28,29,30,35,36,37,41,43,44,63,64,65,66,67,68,69,72,74,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,99,104,159,164,165,168,],[-8,-40,39,-10,-8,-77,45,-42,-44,-48,-73,-74,-75,73,75,-77,-70,-49,-50,-51,-52,-79,-11,-9,-43,-76,-41,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,99,-72,-69,-71,-70,167,-70,170,]),'COMMA':([17,19,22,23,24,25,27,28,29,30,35,36,37,41,44,63,64,65,66,67,68,69,72,74,75,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,99,104,159,164,165,168,],[-8,-40,40,-10,-8,-77,46,-42,-44,-48,-73,-74,-75,40,-77,-70,-49,-50,-51,-52,-79,-11,-9,-43,-76,-41,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,100,-72,-69,-71,-70,100,-70,100,]),'PLUS':([19,25,26,29,30,31,32,33,34,35,36,37,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,100,102,104,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,133,134,137,138,139,141,143,149,151,152,153,156,157,159,161,162,165,166,171,173,],[31,-77,31,47,-48,31,31,31,31,-73,-74,-75,31,47,-77,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,-49,-50,-51,-52,47,-76,-53,-54,-55,-56,-57,47,47,47,47,47,47,47,47,47,47,47,47,-69,31,31,47,31,-18,47,-20,-21,-22,-23,-24,-25,-26,-77,31,31,31,31,-14,31,-15,31,47,47,47,-16,47,31,31,47,47,-31,-33,31,31,31,47,47,31,-32,-34,-35,]),'MINUS':([19,25,26,29,30,31,32,33,34,35,36,37,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,100,102,104,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,133,134,137,138,139,141,143,149,151,152,153,156,157,159,161,162,165,166,171,173,],[32,-77,32,48,-48,32,32,32,32,-73,-74,-75,32,48,-77,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-49,-50,-51,-52,48,-76,-53,-54,-55,-56,-57,48,48,48,48,48,48,48,48,48,48,48,48,-69,32,32,48,32,-18,48,-20,-21,-22,-23,-24,-25,-26,-77,32,32,32,32,-14,32,-15,32,48,48,48,-16,48,32,32,48,48,-31,-33,32,32,32,48,48,32,-32,-34,-35,]),'TILDE':([19,26,30,31,32,33,34,35,36,37,42,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,100,102,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,137,138,139,141,143,149,151,152,153,156,157,159,161,162,165,166,171,173,],[33,33,-48,33,33,33,33,-73,-74,-75,33,-77,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,33,33,33,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,33,33,33,33,-14,33,-15,33,-45,-16,-47,33,33,-30,-28,-31,-33,33,33,33,-29,-27,33,-32,-34,-35,]),'BANG':([19,26,30,31,32,33,34,35,36,37,42,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,100,102,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,137,138,139,141,143,149,151,152,153,156,157,159,161,162,165,166,171,173,],[34,34,-48,34,34,34,34,-73,-74,-75,34,-77,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,34,34,34,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,34,34,34,34,-14,34,-15,34,-45,-16,-47,34,34,-30,-28,-31,-33,34,34,34,-29,-27,34,-32,-34,-35,]),'INTEGER':([19,26,30,31,32,33,34,35,36,37,42,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,100,102,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,137,138,139,141,143,149,151,152,153,156,157,159,161,162,165,166,171,173,],[35,35,-48,35,35,35,35,-73,-74,-75,35,-77,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,35,35,35,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,35,35,35,35,-14,35,-15,35,-45,-16,-47,35,35,-30,-28,-31,-33,35,35,35,-29,-27,35,-32,-34,-35,]),'TRUE':([19,26,30,31,32,33,34,35,36,37,42,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,100,102,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,137,138,139,141,143,149,151,152,153,156,157,159,161,162,165,166,171,173,],[36,36,-48,36,36,36,36,-73,-74,-75,36,-77,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,36,36,36,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,36,36,36,36,-14,36,-15,36,-45,-16,-47,36,36,-30,-28,-31,-33,36,36,36,-29,-27,36,-32,-34,-35,]),'FALSE':([19,26,30,31,32,33,34,35,36,37,42,44,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,100,102,105,107,108,109,110,111,112,113,114,115,118,120,121,124,126,127,128,129,130,137,138,139,141,143,149,151,152,153,156,157,159,161,162,165,166,171,173,],[37,37,-48,37,37,37,37,-73,-74,-75,37,-77,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,37,37,37,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,37,37,37,37,-14,37,-15,37,-45,-16,-47,37,37,-30,-28,-31,-33,37,37,37,-29,-27,37,-32,-34,-35,]),'COLON':([21,30,35,36,37,39,44,64,65,66,67,68,70,73,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,97,98,99,131,132,133,134,158,167,170,],[38,-48,-73,-74,-75,-13,-77,-49,-50,-51,-52,-79,96,-13,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-12,103,-69,140,142,144,145,163,169,172,]),'ASSIGN':([25,68,116,118,131,132,148,150,],[42,-79,130,-78,141,143,156,157,]),'MUL':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,49,-48,-73,-74,-75,49,-77,-49,-50,-51,-52,49,-76,49,49,-55,-56,-57,49,49,49,49,49,49,49,49,49,49,49,49,-69,49,49,-77,49,49,49,49,49,49,49,49,]),'DIV':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,50,-48,-73,-74,-75,50,-77,-49,-50,-51,-52,50,-76,50,50,-55,-56,-57,50,50,50,50,50,50,50,50,50,50,50,50,-69,50,50,-77,50,50,50,50,50,50,50,50,]),'MOD':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,51,-48,-73,-74,-75,51,-77,-49,-50,-51,-52,51,-76,51,51,-55,-56,-57,51,51,51,51,51,51,51,51,51,51,51,51,-69,51,51,-77,51,51,51,51,51,51,51,51,]),'BITWISE_AND':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,52,-48,-73,-74,-75,52,-77,-49,-50,-51,-52,52,-76,-53,-54,-55,-56,-57,-58,52,52,52,52,52,52,52,52,52,52,52,-69,52,52,-77,52,52,52,52,52,52,52,52,]),'BITWISE_XOR':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,53,-48,-73,-74,-75,53,-77,-49,-50,-51,-52,53,-76,-53,-54,-55,-56,-57,-58,-59,-60,53,53,53,53,53,53,53,53,53,-69,53,53,-77,53,53,53,53,53,53,53,53,]),'BITWISE_OR':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,54,-48,-73,-74,-75,54,-77,-49,-50,-51,-52,54,-76,-53,-54,-55,-56,-57,-58,-59,-60,54,54,54,54,54,54,54,54,54,-69,54,54,-77,54,54,54,54,54,54,54,54,]),'EQ':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,55,-48,-73,-74,-75,55,-77,-49,-50,-51,-52,55,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,55,55,55,-69,55,55,-77,55,55,55,55,55,55,55,55,]),'LT':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,56,-48,-73,-74,-75,56,-77,-49,-50,-51,-52,56,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,56,56,56,-69,56,56,-77,56,56,56,56,56,56,56,56,]),'GT':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,57,-48,-73,-74,-75,57,-77,-49,-50,-51,-52,57,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,57,57,57,-69,57,57,-77,57,57,57,57,57,57,57,57,]),'LE':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,58,-48,-73,-74,-75,58,-77,-49,-50,-51,-52,58,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,58,58,58,-69,58,58,-77,58,58,58,58,58,58,58,58,]),'GE':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,59,-48,-73,-74,-75,59,-77,-49,-50,-51,-52,59,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,59,59,59,-69,59,59,-77,59,59,59,59,59,59,59,59,]),'NE':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,60,-48,-73,-74,-75,60,-77,-49,-50,-51,-52,60,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,60,60,60,-69,60,60,-77,60,60,60,60,60,60,60,60,]),'LOGICAL_AND':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,61,-48,-73,-74,-75,61,-77,-49,-50,-51,-52,61,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,61,61,-69,61,61,-77,61,61,61,61,61,61,61,61,]),'LOGICAL_OR':([25,29,30,35,36,37,43,44,64,65,66,67,74,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,99,104,108,118,133,134,137,139,149,151,161,162,],[-77,62,-48,-73,-74,-75,62,-77,-49,-50,-51,-52,62,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,62,-69,62,62,-77,62,62,62,62,62,62,62,62,]),'DEDENT':([30,35,36,37,44,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,105,106,107,108,109,110,111,112,113,114,115,118,124,126,127,129,137,138,139,149,151,152,153,161,162,166,171,173,],[-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,127,129,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,-46,-17,-14,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'VAR':([30,35,36,37,44,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,102,105,107,108,109,110,111,112,113,114,115,118,124,126,127,128,129,137,138,139,149,151,152,153,161,162,166,171,173,],[-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,117,117,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,-46,117,-14,117,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'LET':([30,35,36,37,44,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,102,105,107,108,109,110,111,112,113,114,115,118,124,126,127,128,129,137,138,139,149,151,152,153,161,162,166,171,173,],[-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,119,119,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,-46,119,-14,119,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'IF':([30,35,36,37,44,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,102,105,107,108,109,110,111,112,113,114,115,118,124,126,127,128,129,137,138,139,149,151,152,153,161,162,166,171,173,],[-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,120,120,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,-46,120,-14,120,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'WHILE':([30,35,36,37,44,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,102,105,107,108,109,110,111,112,113,114,115,118,124,126,127,128,129,137,138,139,149,151,152,153,161,162,166,171,173,],[-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,121,121,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,-46,121,-14,121,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'RETURN':([30,35,36,37,44,64,65,66,67,75,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,99,102,105,107,108,109,110,111,112,113,114,115,118,124,126,127,128,129,137,138,139,149,151,152,153,161,162,166,171,173,],[-48,-73,-74,-75,-77,-49,-50,-51,-52,-76,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,124,124,-18,-19,-20,-21,-22,-23,-24,-25,-26,-77,-46,124,-14,124,-15,-45,-16,-47,-30,-28,-31,-33,-29,-27,-32,-34,-35,]),'ARROW':([39,73,],[71,71,]),'INDENT':([96,103,144,145,163,169,172,],[102,102,102,102,102,102,102,]),'PASS':([102,],[106,]),'ELSE':([127,129,152,],[-14,-15,158,]),'IN':([135,147,],[146,155,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'translation_unit':([0,],[1,]),'declaration':([0,1,],[2,9,]),'function_declaration':([0,1,],[3,3,]),'decorator_list':([0,1,102,105,126,128,],[6,6,123,123,123,123,]),'decorator':([0,1,6,102,105,123,126,128,],[7,7,14,7,7,14,7,7,]),'arglist':([17,24,],[22,41,]),'argument':([17,24,40,],[23,23,72,]),'decorator_args':([19,],[27,]),'decorator_arg':([19,46,],[28,77,]),'expression':([19,26,31,32,33,34,42,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,100,102,105,120,121,124,126,128,130,141,143,156,157,159,165,],[29,43,64,65,66,67,74,29,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,104,108,108,133,134,137,108,108,139,149,151,161,162,95,95,]),'rvalue':([19,26,31,32,33,34,42,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,100,102,105,120,121,124,126,128,130,141,143,156,157,159,165,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'type':([38,71,140,142,],[69,97,148,150,]),'function_return_type':([39,73,],[70,98,]),'expression_list':([63,159,165,],[94,164,168,]),'compound_stmt':([96,103,144,145,163,169,172,],[101,125,152,153,166,171,173,]),'stmt_list':([102,105,126,],[105,126,126,]),'stmt':([102,105,126,128,],[107,107,107,138,]),'assignment':([102,105,126,128,],[109,109,109,109,]),'var':([102,105,126,128,],[110,110,110,110,]),'let':([102,105,126,128,],[111,111,111,111,]),'if':([102,105,126,128,],[112,112,112,112,]),'while':([102,105,126,128,],[113,113,113,113,]),'for':([102,105,126,128,],[114,114,114,114,]),'return':([102,105,126,128,],[115,115,115,115,]),'lvalue':([102,105,126,128,],[116,116,116,116,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit","S'",1,None,None,None),
+  ('translation_unit -> translation_unit declaration','translation_unit',2,'p_translation_unit','parser.py',142),
+  ('translation_unit -> declaration','translation_unit',1,'p_translation_unit','parser.py',143),
+  ('translation_unit -> translation_unit EOF','translation_unit',2,'p_translation_unit_eof','parser.py',153),
+  ('declaration -> function_declaration','declaration',1,'p_declaration','parser.py',158),
+  ('declaration -> IMPORT ID NEWLINE','declaration',3,'p_declaration_import','parser.py',163),
+  ('function_declaration -> DEF ID LPAREN arglist RPAREN function_return_type COLON compound_stmt','function_declaration',8,'p_function_declaration','parser.py',168),
+  ('function_declaration -> decorator_list DEF ID LPAREN arglist RPAREN function_return_type COLON compound_stmt','function_declaration',9,'p_function_declaration_decorated','parser.py',173),
+  ('arglist -> <empty>','arglist',0,'p_arglist_empty','parser.py',178),
+  ('arglist -> arglist COMMA argument','arglist',3,'p_arglist','parser.py',184),
+  ('arglist -> argument','arglist',1,'p_arglist','parser.py',185),
+  ('argument -> ID COLON type','argument',3,'p_argument','parser.py',195),
+  ('function_return_type -> ARROW type','function_return_type',2,'p_function_return_type','parser.py',200),
+  ('function_return_type -> <empty>','function_return_type',0,'p_function_return_type_void','parser.py',205),
+  ('compound_stmt -> INDENT stmt_list DEDENT','compound_stmt',3,'p_compound_stmt','parser.py',211),
+  ('compound_stmt -> INDENT PASS DEDENT','compound_stmt',3,'p_compound_stmt_empty','parser.py',216),
+  ('stmt_list -> stmt_list NEWLINE stmt','stmt_list',3,'p_stmt_list','parser.py',222),
+  ('stmt_list -> stmt_list stmt_list','stmt_list',2,'p_stmt_list','parser.py',223),
+  ('stmt_list -> stmt','stmt_list',1,'p_stmt_list','parser.py',224),
+  ('stmt -> expression','stmt',1,'p_stmt_1','parser.py',238),
+  ('stmt -> assignment','stmt',1,'p_stmt_1','parser.py',239),
+  ('stmt -> var','stmt',1,'p_stmt_1','parser.py',240),
+  ('stmt -> let','stmt',1,'p_stmt_1','parser.py',241),
+  ('stmt -> if','stmt',1,'p_stmt_1','parser.py',242),
+  ('stmt -> while','stmt',1,'p_stmt_1','parser.py',243),
+  ('stmt -> for','stmt',1,'p_stmt_1','parser.py',244),
+  ('stmt -> return','stmt',1,'p_stmt_1','parser.py',245),
+  ('let -> LET ID COLON type ASSIGN expression','let',6,'p_let','parser.py',252),
+  ('let -> LET ID ASSIGN expression','let',4,'p_let','parser.py',253),
+  ('var -> VAR ID COLON type ASSIGN expression','var',6,'p_var','parser.py',263),
+  ('var -> VAR ID ASSIGN expression','var',4,'p_var','parser.py',264),
+  ('if -> IF expression COLON compound_stmt','if',4,'p_if','parser.py',274),
+  ('if -> IF expression COLON compound_stmt ELSE COLON compound_stmt','if',7,'p_if_else','parser.py',281),
+  ('while -> WHILE expression COLON compound_stmt','while',4,'p_while','parser.py',288),
+  ('for -> FOR ID IN ID LPAREN expression_list RPAREN COLON compound_stmt','for',9,'p_for','parser.py',301),
+  ('for -> decorator_list FOR ID IN ID LPAREN expression_list RPAREN COLON compound_stmt','for',10,'p_for_decorated','parser.py',308),
+  ('decorator_list -> decorator_list decorator','decorator_list',2,'p_decorator_list','parser.py',315),
+  ('decorator_list -> decorator','decorator_list',1,'p_decorator_list','parser.py',316),
+  ('decorator -> AT ID LPAREN decorator_args RPAREN NEWLINE','decorator',6,'p_decorator','parser.py',327),
+  ('decorator -> AT ID NEWLINE','decorator',3,'p_decorator','parser.py',328),
+  ('decorator_args -> <empty>','decorator_args',0,'p_decorator_args_empty','parser.py',334),
+  ('decorator_args -> decorator_args COMMA decorator_arg','decorator_args',3,'p_decorator_args','parser.py',340),
+  ('decorator_args -> decorator_arg','decorator_args',1,'p_decorator_args','parser.py',341),
+  ('decorator_arg -> ID ASSIGN expression','decorator_arg',3,'p_decorator_arg','parser.py',352),
+  ('decorator_arg -> expression','decorator_arg',1,'p_decorator_arg','parser.py',353),
+  ('return -> RETURN expression','return',2,'p_return','parser.py',363),
+  ('return -> RETURN','return',1,'p_return','parser.py',364),
+  ('assignment -> lvalue ASSIGN expression','assignment',3,'p_assignment','parser.py',370),
+  ('expression -> rvalue','expression',1,'p_expression','parser.py',415),
+  ('expression -> PLUS expression','expression',2,'p_expression_op_unary','parser.py',422),
+  ('expression -> MINUS expression','expression',2,'p_expression_op_unary','parser.py',423),
+  ('expression -> TILDE expression','expression',2,'p_expression_op_unary','parser.py',424),
+  ('expression -> BANG expression','expression',2,'p_expression_op_unary','parser.py',425),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_op_binary','parser.py',433),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_op_binary','parser.py',434),
+  ('expression -> expression MUL expression','expression',3,'p_expression_op_binary','parser.py',435),
+  ('expression -> expression DIV expression','expression',3,'p_expression_op_binary','parser.py',436),
+  ('expression -> expression MOD expression','expression',3,'p_expression_op_binary','parser.py',437),
+  ('expression -> expression BITWISE_AND expression','expression',3,'p_expression_op_binary','parser.py',438),
+  ('expression -> expression BITWISE_XOR expression','expression',3,'p_expression_op_binary','parser.py',439),
+  ('expression -> expression BITWISE_OR expression','expression',3,'p_expression_op_binary','parser.py',440),
+  ('expression -> expression EQ expression','expression',3,'p_expression_op_binary','parser.py',441),
+  ('expression -> expression LT expression','expression',3,'p_expression_op_binary','parser.py',442),
+  ('expression -> expression GT expression','expression',3,'p_expression_op_binary','parser.py',443),
+  ('expression -> expression LE expression','expression',3,'p_expression_op_binary','parser.py',444),
+  ('expression -> expression GE expression','expression',3,'p_expression_op_binary','parser.py',445),
+  ('expression -> expression NE expression','expression',3,'p_expression_op_binary','parser.py',446),
+  ('expression -> expression LOGICAL_AND expression','expression',3,'p_expression_op_binary','parser.py',447),
+  ('expression -> expression LOGICAL_OR expression','expression',3,'p_expression_op_binary','parser.py',448),
+  ('expression -> rvalue LPAREN expression_list RPAREN','expression',4,'p_expression_call','parser.py',454),
+  ('expression_list -> <empty>','expression_list',0,'p_expression_list_empty','parser.py',459),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','parser.py',465),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',466),
+  ('rvalue -> INTEGER','rvalue',1,'p_rvalue_int_literal','parser.py',477),
+  ('rvalue -> TRUE','rvalue',1,'p_rvalue_true','parser.py',496),
+  ('rvalue -> FALSE','rvalue',1,'p_rvalue_false','parser.py',501),
+  ('rvalue -> LPAREN expression RPAREN','rvalue',3,'p_rvalue_parentheses','parser.py',506),
+  ('rvalue -> ID','rvalue',1,'p_rvalue_variable','parser.py',511),
+  ('lvalue -> ID','lvalue',1,'p_lvalue_variable','parser.py',516),
+  ('type -> ID','type',1,'p_type','parser.py',521),
+]
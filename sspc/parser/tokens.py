@@ -0,0 +1,233 @@
+import re
+import sys
+from array import array
+
+from ply import lex
+
+from sspc.parser import parser as grammar
+
+TOKEN_TYPES = grammar.tokens
+TOKEN_CODES = {name: code for code, name in enumerate(TOKEN_TYPES)}
+
+ID = TOKEN_CODES['ID']
+INTEGER = TOKEN_CODES['INTEGER']
+FLOAT = TOKEN_CODES['FLOAT']
+STRING = TOKEN_CODES['STRING']
+NEWLINE = TOKEN_CODES['NEWLINE']
+INDENT = TOKEN_CODES['INDENT']
+DEDENT = TOKEN_CODES['DEDENT']
+EOF = TOKEN_CODES['EOF']
+
+
+def _build_master_pattern():
+    rules = vars(grammar)
+    functions = sorted(
+        (rule for name, rule in rules.items() if name.startswith('t_') and callable(rule) and name != 't_error'),
+        key=lambda rule: rule.__code__.co_firstlineno,
+    )
+    strings = sorted(
+        ((name[2:], rule) for name, rule in rules.items() if name.startswith('t_') and isinstance(rule, str)
+         and name != 't_ignore'),
+        key=lambda item: len(item[1]),
+        reverse=True,
+    )
+
+    parts = ['(?P<ignore>[%s]+)' % re.escape(grammar.t_ignore)]
+    parts.extend('(?P<%s>%s)' % (rule.__name__, rule.__doc__) for rule in functions)
+    parts.extend('(?P<%s>%s)' % (name, pattern) for name, pattern in strings)
+    parts.append('(?P<error>(?s:.))')
+    return '|'.join(parts)
+
+
+MASTER_PATTERN = _build_master_pattern()
+_master_regex = re.compile(MASTER_PATTERN, re.VERBOSE)
+_master_regex_bytes = re.compile(MASTER_PATTERN.encode(), re.VERBOSE)
+
+_simple_codes = {name: TOKEN_CODES[name] for name in TOKEN_TYPES}
+_keyword_codes = {keyword: TOKEN_CODES[token_type] for keyword, token_type in grammar.keywords.items()}
+
+
+class TokenBuffer:
+    __slots__ = ('types', 'positions', 'lines', 'values', 'constants', '_constant_index')
+
+    def __init__(self):
+        self.types = array('B')
+        self.positions = array('q')
+        self.lines = array('I')
+        self.values = array('I')
+        self.constants = [None]
+        self._constant_index = {}
+
+    def __len__(self):
+        return len(self.types)
+
+    def intern(self, value):
+        if value is None:
+            return 0
+
+        key = (value.__class__, value)
+        index = self._constant_index.get(key)
+        if index is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            index = self._constant_index[key] = len(self.constants)
+            self.constants.append(value)
+        return index
+
+    def append(self, code, position, line, value=None):
+        self.types.append(code)
+        self.positions.append(position)
+        self.lines.append(line)
+        self.values.append(self.intern(value))
+
+    def type_name(self, index):
+        return TOKEN_TYPES[self.types[index]]
+
+    def value(self, index):
+        return self.constants[self.values[index]]
+
+    def token(self, index):
+        token = lex.LexToken()
+        token.type = TOKEN_TYPES[self.types[index]]
+        token.value = self.constants[self.values[index]]
+        token.lineno = self.lines[index]
+        token.lexpos = self.positions[index]
+        return token
+
+    @classmethod
+    def from_tokens(cls, tokens):
+        buffer = cls()
+        for token in tokens:
+            buffer.append(TOKEN_CODES[token.type], token.lexpos, token.lineno, token.value)
+        return buffer
+
+
+def _text_value(kind, text):
+    if kind == 't_INTEGER':
+        return int(text)
+    elif kind == 't_FLOAT':
+        return float(text)
+    elif kind == 't_STRING':
+        return text[1:-1]
+    return text
+
+
+def tokenize(source):
+    is_text = isinstance(source, str)
+    master_regex = _master_regex if is_text else _master_regex_bytes
+    newline = '\n' if is_text else b'\n'
+
+    buffer = TokenBuffer()
+    types_append = buffer.types.append
+    positions_append = buffer.positions.append
+    lines_append = buffer.lines.append
+    values_append = buffer.values.append
+    text_values = {}
+
+    lineno = 1
+    line_start = 0
+    prev_code = None
+    prev_indent = 0
+    indent_stack = []
+    pending_newline = None
+
+    for match in master_regex.finditer(source):
+        kind = match.lastgroup
+        if kind == 'ignore' or kind == 't_comment':
+            continue
+
+        position = match.start()
+        text = match.group()
+        if kind == 'error':
+            print('Illegal character "%s"' % (text if is_text else text.decode(errors='replace')))
+            continue
+
+        value = text_values.get(text)
+        if value is None:
+            value = text_values[text] = buffer.intern(
+                _text_value(kind, text if is_text else text.decode())
+            )
+
+        if kind == 't_newline':
+            if prev_code is not None:
+                pending_newline = (position, lineno, value)
+                prev_code = NEWLINE
+            lineno += text.count(newline)
+            line_start = match.end()
+            continue
+
+        if kind == 't_ID':
+            code = _keyword_codes.get(buffer.constants[value], ID)
+        elif kind == 't_INTEGER':
+            code = INTEGER
+        elif kind == 't_FLOAT':
+            code = FLOAT
+        elif kind == 't_STRING':
+            code = STRING
+        else:
+            code = _simple_codes[kind]
+
+        cur_indent = position - line_start
+        if prev_code is None:
+            if cur_indent > prev_indent:
+                types_append(INDENT)
+                positions_append(position)
+                lines_append(lineno)
+                values_append(0)
+
+        elif prev_code == NEWLINE:
+            is_indent_changed = False
+            if cur_indent > prev_indent:
+                is_indent_changed = True
+                types_append(INDENT)
+                positions_append(line_start)
+                lines_append(lineno)
+                values_append(0)
+                indent_stack.append(prev_indent)
+                prev_indent = cur_indent
+
+            else:
+                while cur_indent < prev_indent and indent_stack:
+                    is_indent_changed = True
+                    prev_indent = indent_stack.pop()
+                    types_append(DEDENT)
+                    positions_append(line_start)
+                    lines_append(lineno)
+                    values_append(0)
+
+            if not is_indent_changed:
+                types_append(NEWLINE)
+                positions_append(pending_newline[0])
+                lines_append(pending_newline[1])
+                values_append(pending_newline[2])
+
+        types_append(code)
+        positions_append(position)
+        lines_append(lineno)
+        values_append(value)
+        prev_code = code
+
+    end = len(source) + 1
+    if prev_code is not None:
+        for _ in indent_stack:
+            buffer.append(DEDENT, end, lineno)
+
+    buffer.append(EOF, end, lineno)
+    return buffer
+
+
+class BufferLexer:
+    def __init__(self, buffer, debug=False):
+        self.buffer = buffer
+        self.debug = debug
+        self.index = 0
+
+    def token(self):
+        if self.index >= len(self.buffer):
+            return None
+
+        token = self.buffer.token(self.index)
+        self.index += 1
+        if self.debug:
+            print(token)
+        return token
@@ -0,0 +1,280 @@
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from sspc import interface
+from sspc.source import load_source
+
+HEADER = struct.Struct('!IQ')
+
+CHUNK_SIZE = 1 << 16
+
+AST_CACHE_ENTRIES = 4096
+
+REMOTE_OPTIONS = (
+    'parser', 'lexer', 'opt_level', 'backend', 'incremental',
+    'cpu', 'features', 'reloc', 'code_model', 'codegen_opt',
+)
+
+PROTOCOL_OPTIONS = ('import_path', 'interfaces')
+
+
+def default_socket_path():
+    path = os.environ.get('SSPC_SOCKET')
+    if path:
+        return path
+    return os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(), 'sspc-%d.sock' % os.getuid())
+
+
+def receive_exactly(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            raise ConnectionError('Connection closed after %d of %d bytes' % (received, size))
+        received += count
+    return bytes(buffer)
+
+
+def send_message(sock, header, payload=b''):
+    header_bytes = json.dumps(header).encode()
+    sock.sendall(HEADER.pack(len(header_bytes), len(payload)) + header_bytes)
+    view = memoryview(payload)
+    for offset in range(0, len(view), CHUNK_SIZE):
+        sock.sendall(view[offset:offset + CHUNK_SIZE])
+
+
+def receive_header(sock):
+    header_size, payload_size = HEADER.unpack(receive_exactly(sock, HEADER.size))
+    return json.loads(receive_exactly(sock, header_size)), payload_size
+
+
+def iter_payload(sock, size):
+    while size > 0:
+        chunk = sock.recv(min(size, CHUNK_SIZE))
+        if not chunk:
+            raise ConnectionError('Connection closed with %d bytes of payload left' % size)
+        size -= len(chunk)
+        yield chunk
+
+
+def split_sources(payload, sizes):
+    sources = []
+    offset = 0
+    for size in sizes:
+        sources.append(payload[offset:offset + size])
+        offset += size
+    return sources
+
+
+_worker_state = None
+
+
+def _init_worker():
+    global _worker_state
+    from sspc import backend
+    from sspc.parser.parser import Parser
+
+    backend.initialize()
+    _worker_state = ({(Parser.ENGINES[0], None): Parser()}, {}, OrderedDict())
+
+
+def _parse(args, sources):
+    from sspc import ast
+    from sspc.parser.parser import Parser
+
+    parsers, _, asts = _worker_state
+    key = (args.parser, args.lexer)
+    if key not in parsers:
+        parsers[key] = Parser(engine=args.parser, lexer=args.lexer)
+
+    declarations = []
+    for source in sources:
+        source_key = (key, hashlib.sha256(source).digest())
+        if source_key in asts:
+            asts.move_to_end(source_key)
+        else:
+            asts[source_key] = parsers[key].parse(source).declarations
+            if len(asts) > AST_CACHE_ENTRIES:
+                asts.popitem(last=False)
+        declarations.extend(asts[source_key])
+    return ast.module(declarations)
+
+
+def _target_machine(args):
+    from sspc import main
+
+    _, target_machines, _ = _worker_state
+    key = json.dumps(main.target_options(args), sort_keys=True) + args.opt_level
+    if key not in target_machines:
+        target_machines[key] = main.create_target_machine(args)
+    return target_machines[key]
+
+
+def _compile_task(options, sources):
+    from sspc import main
+
+    args = main.parse_args(['compile'])
+    for name in (*REMOTE_OPTIONS, 'import_path'):
+        setattr(args, name, options[name])
+    try:
+        module_ast = interface.resolve_imports(_parse(args, sources), args.import_path)
+        target_machine = _target_machine(args)
+        module_ref = main.build_optimized_module(args, module_ast, target_machine)
+        return (main.emit_object_code(args, module_ref, target_machine), interface.describe(module_ast)), None
+    except Exception as error:
+        return None, '%s: %s' % (type(error).__name__, error)
+
+
+class CompileFailed(Exception):
+    pass
+
+
+def check_options(options):
+    from sspc import main
+    from sspc.parser.parser import Parser
+
+    if set(options) != {*REMOTE_OPTIONS, *PROTOCOL_OPTIONS}:
+        unexpected = sorted(set(options) - {*REMOTE_OPTIONS, *PROTOCOL_OPTIONS})
+        missing = sorted({*REMOTE_OPTIONS, *PROTOCOL_OPTIONS} - set(options))
+        raise CompileFailed('Rejected options: unexpected %s, missing %s' % (unexpected, missing))
+
+    choices = {
+        'parser': Parser.ENGINES,
+        'lexer': (None, *Parser.LEXERS),
+        'opt_level': tuple(main.OPT_LEVELS),
+        'backend': ('native', 'llc'),
+        'incremental': (False, True),
+        'reloc': (None, *main.RELOC_MODELS),
+        'code_model': (None, *main.CODE_MODELS),
+        'codegen_opt': (None, 0, 1, 2, 3),
+    }
+    for name, allowed in choices.items():
+        if options[name] not in allowed:
+            raise CompileFailed('Invalid value %r for option %s' % (options[name], name))
+    for name in ('cpu', 'features'):
+        if not isinstance(options[name], str):
+            raise CompileFailed('Invalid value %r for option %s' % (options[name], name))
+    if not isinstance(options['import_path'], list) or not all(
+        isinstance(directory, str) and os.path.isabs(directory) for directory in options['import_path']
+    ):
+        raise CompileFailed('Invalid import path %r' % (options['import_path'],))
+    if not isinstance(options['interfaces'], dict):
+        raise CompileFailed('Invalid interface hashes %r' % (options['interfaces'],))
+
+
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, jobs=None, cache_entries=1024):
+        super().__init__(path, RequestHandler)
+        self.executor = ProcessPoolExecutor(jobs, initializer=_init_worker)
+        self.cache_entries = cache_entries
+        self.objects = OrderedDict()
+        self.lock = threading.Lock()
+
+    def compile(self, options, sources):
+        check_options(options)
+        digest = hashlib.sha256(json.dumps(options, sort_keys=True).encode())
+        for source in sources:
+            digest.update(b'%d:' % len(source))
+            digest.update(source)
+        key = digest.digest()
+
+        with self.lock:
+            result = self.objects.get(key)
+            if result is not None:
+                self.objects.move_to_end(key)
+                return result, True
+
+        result, error = self.executor.submit(_compile_task, options, sources).result()
+        if error is not None:
+            raise CompileFailed(error)
+        with self.lock:
+            self.objects[key] = result
+            if len(self.objects) > self.cache_entries:
+                self.objects.popitem(last=False)
+        return result, False
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+class RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        try:
+            header, payload_size = receive_header(self.request)
+            sources = split_sources(receive_exactly(self.request, payload_size), header['sizes'])
+        except ConnectionError:
+            return
+
+        try:
+            (object_code, description), cached = self.server.compile(header['options'], sources)
+        except CompileFailed as error:
+            send_message(self.request, {'ok': False, 'error': str(error)})
+            return
+        except Exception as error:
+            send_message(self.request, {'ok': False, 'error': '%s: %s' % (type(error).__name__, error)})
+            return
+        send_message(self.request, {'ok': True, 'cached': cached, 'interface': description}, object_code)
+
+
+def serve(path=None, jobs=None, cache_entries=1024):
+    path = path or default_socket_path()
+    if os.path.exists(path):
+        try:
+            with socket.socket(socket.AF_UNIX) as sock:
+                sock.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+        else:
+            raise SystemExit('sspc: a server is already listening on %s' % path)
+
+    umask = os.umask(0o177)
+    try:
+        server = CompileServer(path, jobs=jobs, cache_entries=cache_entries)
+    finally:
+        os.umask(umask)
+    os.chmod(path, 0o600)
+    print('sspc: serving on %s' % path, file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(path)
+
+
+def compile_remote(args, object_path):
+    from sspc.main import import_search_path
+
+    sources = [bytes(load_source(path)) for path in args.sources]
+    search_path = [os.path.abspath(directory) for directory in import_search_path(args)]
+    imports = dict.fromkeys(name for source in sources for name in interface.scan_imports(source))
+    options = {name: getattr(args, name) for name in REMOTE_OPTIONS}
+    options.update(import_path=search_path, interfaces=interface.import_hashes(imports, search_path))
+    header = {'options': options, 'sizes': [len(source) for source in sources]}
+
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.connect(args.connect or default_socket_path())
+        send_message(sock, header, b''.join(sources))
+        response, payload_size = receive_header(sock)
+        if not response['ok']:
+            raise SystemExit('sspc: %s' % response['error'])
+
+        with open(object_path, 'wb') as fp:
+            for chunk in iter_payload(sock, payload_size):
+                fp.write(chunk)
+    return response['interface']
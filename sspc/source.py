@@ -0,0 +1,25 @@
+import mmap
+import os
+import sys
+
+from sspc import ast
+
+MMAP_THRESHOLD = 1 << 20
+
+
+def load_source(path):
+    if path == '-':
+        return sys.stdin.buffer.read()
+
+    with open(path, 'rb') as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        return fp.read()
+
+
+def parse_sources(parser, sources):
+    declarations = []
+    for source in sources:
+        declarations.extend(parser.parse(source).declarations)
+    return ast.module(declarations)
@@ -1,9 +1,59 @@
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Optional
-
-from sspc.datatypes import Boolean
-from sspc.expression import compile_expression
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+import llvmlite.ir as ir
+
+from sspc.context import Context
+from sspc.datatypes import Integer
+from sspc.errors import CompileError, UnknownIdentifierError
+from sspc.expression import IntLiteral, compile_condition, compile_expression, set_branch_weights
+
+LOOP_HINTS = {
+    'unroll': lambda value: (
+        [('llvm.loop.unroll.count', value)] if value > 1 else [('llvm.loop.unroll.disable',)]
+    ),
+    'vectorize': lambda value: (
+        [('llvm.loop.vectorize.width', value), ('llvm.loop.vectorize.enable', True)] if value > 1
+        else [('llvm.loop.vectorize.width', 1)]
+    ),
+    'interleave': lambda value: [('llvm.loop.interleave.count', value)],
+}
+
+
+def compile_block(body, context):
+    with Context(context) as scope:
+        for stmt in body:
+            stmt.compile(scope)
+
+
+def loop_properties(decorators):
+    properties = []
+    for decorator in decorators:
+        if decorator.name != 'loop':
+            raise CompileError('Unknown loop decorator "%s"' % decorator.name)
+        for argument in decorator.args:
+            if argument.name not in LOOP_HINTS:
+                raise CompileError('Unknown loop hint "%s"' % argument.name)
+            if not isinstance(argument.value, IntLiteral):
+                raise CompileError('Loop hint "%s" must be an integer constant' % argument.name)
+            properties.extend(LOOP_HINTS[argument.name](argument.value.value))
+    return properties
+
+
+def loop_metadata(module, properties):
+    operands = []
+    for name, *values in properties:
+        node = [ir.MetaDataString(module, name)]
+        for value in values:
+            value_type = ir.IntType(1) if isinstance(value, bool) else ir.IntType(32)
+            node.append(ir.Constant(value_type, value))
+        operands.append(module.add_metadata(node))
+
+    marker = ir.MetaDataString(module, 'sspc.loop.%d' % len(module.metadata))
+    loop_id = module.add_metadata([marker, *operands])
+    loop_id.operands = (loop_id, *operands)
+    return loop_id
 
 
 class Statement(metaclass=ABCMeta):
@@ -24,6 +74,36 @@ class LetStmt(Statement):
         context.register(self.name, value)
 
 
+@dataclass
+class VarStmt(Statement):
+    name: str
+    value: Any
+    dtype: Optional[Any] = None
+
+    def compile(self, context):
+        dtype = context.find_type(self.dtype) if self.dtype is not None else None
+        value = compile_expression(self.value, context, type_hint=dtype)
+        slot = context.allocate(value.type, self.name)
+        context.builder.store(value, slot)
+        context.register(self.name, slot)
+
+
+@dataclass
+class AssignStmt(Statement):
+    target: str
+    value: Any
+
+    def compile(self, context):
+        slot = context.find(self.target)
+        if slot is None:
+            raise UnknownIdentifierError(self.target)
+        elif not isinstance(slot, ir.AllocaInstr):
+            raise CompileError('Cannot assign to "%s", it is not declared with var' % self.target)
+
+        value = compile_expression(self.value, context, type_hint=slot.type.pointee)
+        context.builder.store(value, slot)
+
+
 @dataclass
 class IfStmt(Statement):
     condition: Any
@@ -31,19 +111,16 @@ class IfStmt(Statement):
     else_body: Any = None
 
     def compile(self, context):
-        condition = compile_expression(self.condition, context, type_hint=Boolean())
+        condition, likely = compile_condition(self.condition, context)
         if self.else_body is not None:
-            with context.builder.if_else(condition) as (then, otherwise):
+            with context.builder.if_else(condition, likely=likely) as (then, otherwise):
                 with then:
-                    for stmt in self.then_body:
-                        stmt.compile(context)
+                    compile_block(self.then_body, context)
                 with otherwise:
-                    for stmt in self.else_body:
-                        stmt.compile(context)
+                    compile_block(self.else_body, context)
         else:
-            with context.builder.if_then(condition):
-                for stmt in self.then_body:
-                    stmt.compile(context)
+            with context.builder.if_then(condition, likely=likely):
+                compile_block(self.then_body, context)
 
 
 @dataclass
@@ -52,25 +129,90 @@ class WhileStmt(Statement):
     body: Any
 
     def compile(self, context):
-        print(self)
-
         condition_block = context.builder.function.append_basic_block()
         context.builder.branch(condition_block)
         loop_block = context.builder.function.append_basic_block()
         end_block = context.builder.function.append_basic_block()
 
         with context.builder.goto_block(condition_block):
-            condition = compile_expression(self.condition, context, type_hint=Boolean())
-            context.builder.cbranch(condition, loop_block, end_block)
+            condition, likely = compile_condition(self.condition, context)
+            set_branch_weights(context.builder.cbranch(condition, loop_block, end_block), likely)
 
         with context.builder.goto_block(loop_block):
-            for stmt in self.body:
-                stmt.compile(context)
-            context.builder.branch(condition_block)
+            compile_block(self.body, context)
+            if not context.builder.block.is_terminated:
+                context.builder.branch(condition_block)
 
         context.builder.position_at_end(end_block)
 
 
+@dataclass
+class ForStmt(Statement):
+    name: str
+    args: List[Any]
+    body: Any
+    decorators: List[Any] = field(default_factory=list)
+
+    def compile_range(self, context):
+        if not 1 <= len(self.args) <= 3:
+            raise CompileError('range() takes 1 to 3 arguments')
+
+        start, stop, step = IntLiteral(0), self.args[0], IntLiteral(1)
+        if len(self.args) > 1:
+            start, stop = self.args[:2]
+        if len(self.args) > 2:
+            step = self.args[2]
+
+        if isinstance(start, IntLiteral):
+            stop = compile_expression(stop, context)
+            start = compile_expression(start, context, type_hint=stop.type)
+        else:
+            start = compile_expression(start, context)
+            stop = compile_expression(stop, context, type_hint=start.type)
+        step = compile_expression(step, context, type_hint=start.type)
+
+        if not isinstance(start.type, Integer):
+            raise CompileError('range() bounds must be integers, got %s' % start.type)
+        elif not isinstance(step, ir.Constant) or step.constant == 0:
+            raise CompileError('range() step must be a non-zero constant')
+        return start, stop, step
+
+    def compile(self, context):
+        properties = loop_properties(self.decorators)
+        start, stop, step = self.compile_range(context)
+        dtype = start.type
+
+        builder = context.builder
+        preheader_block = builder.block
+        header_block = builder.append_basic_block()
+        body_block = builder.append_basic_block()
+        latch_block = builder.append_basic_block()
+        exit_block = builder.append_basic_block()
+        builder.branch(header_block)
+
+        builder.position_at_end(header_block)
+        index = builder.phi(dtype, name=self.name)
+        index.add_incoming(start, preheader_block)
+        condition = dtype.op_comparison('<' if step.constant > 0 else '>', index, stop, context)
+        builder.cbranch(condition, body_block, exit_block)
+
+        builder.position_at_end(body_block)
+        with Context(context) as scope:
+            scope.register(self.name, index)
+            compile_block(self.body, scope)
+        if not builder.block.is_terminated:
+            builder.branch(latch_block)
+
+        builder.position_at_end(latch_block)
+        next_index = builder.add(index, step)
+        index.add_incoming(next_index, latch_block)
+        backedge = builder.branch(header_block)
+        if properties:
+            backedge.set_metadata('llvm.loop', loop_metadata(builder.function.module, properties))
+
+        builder.position_at_end(exit_block)
+
+
 @dataclass
 class ReturnStmt(Statement):
     value: Optional[Any]
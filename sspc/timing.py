@@ -0,0 +1,146 @@
+import contextlib
+import json
+import time
+import tracemalloc
+from collections import namedtuple
+
+Measurement = namedtuple('Measurement', ['name', 'kind', 'depth', 'wall', 'cpu', 'peak', 'count'])
+
+SLOWEST_FUNCTIONS = 10
+
+_active = None
+_inactive = contextlib.nullcontext()
+
+
+class PhaseTimer:
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.records = []
+        self.llvm_report = None
+        self._stack = []
+
+    @contextlib.contextmanager
+    def phase(self, name, kind='phase'):
+        start_memory = 0
+        if self.trace_memory:
+            start_memory, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][0] = max(self._stack[-1][0], peak)
+            tracemalloc.reset_peak()
+        frame = [start_memory]
+        self._stack.append(frame)
+        index = len(self.records)
+        self.records.append(None)
+
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            self._stack.pop()
+
+            peak = 0
+            if self.trace_memory:
+                absolute_peak = max(frame[0], tracemalloc.get_traced_memory()[1])
+                peak = absolute_peak - start_memory
+                if self._stack:
+                    self._stack[-1][0] = max(self._stack[-1][0], absolute_peak)
+            self.records[index] = Measurement(name, kind, len(self._stack), wall, cpu, peak, 1)
+
+    def phases(self):
+        merged = {}
+        for record in self.records:
+            if record is None or record.kind != 'phase':
+                continue
+            key = (record.depth, record.name)
+            if key in merged:
+                previous = merged[key]
+                record = previous._replace(
+                    wall=previous.wall + record.wall,
+                    cpu=previous.cpu + record.cpu,
+                    peak=max(previous.peak, record.peak),
+                    count=previous.count + 1,
+                )
+            merged[key] = record
+        return list(merged.values())
+
+    def functions(self):
+        return [record for record in self.records if record is not None and record.kind == 'function']
+
+    def as_dict(self):
+        return {
+            'phases': [record._asdict() for record in self.phases()],
+            'functions': [record._asdict() for record in self.functions()],
+            'llvm_pass_timings': self.llvm_report,
+        }
+
+    def format_json(self):
+        return json.dumps(self.as_dict(), indent=2)
+
+    def format_table(self):
+        lines = ['%-32s %10s %10s %12s' % ('phase', 'wall ms', 'cpu ms', 'peak KiB')]
+        for record in self.phases():
+            name = '  ' * record.depth + record.name
+            if record.count > 1:
+                name += ' (x%d)' % record.count
+            lines.append(self._format_row(name, record))
+
+        functions = sorted(self.functions(), key=lambda record: record.wall, reverse=True)
+        if functions:
+            lines.append('')
+            lines.append('slowest functions (%d of %d)' % (min(SLOWEST_FUNCTIONS, len(functions)), len(functions)))
+            for record in functions[:SLOWEST_FUNCTIONS]:
+                lines.append(self._format_row('  ' + record.name, record))
+
+        if self.llvm_report:
+            lines.append('')
+            lines.append(self.llvm_report.rstrip())
+        return '\n'.join(lines)
+
+    def _format_row(self, name, record):
+        return '%-32s %10.2f %10.2f %12.1f' % (name, record.wall * 1e3, record.cpu * 1e3, record.peak / 1024)
+
+
+def _llvm_timing_hooks():
+    import llvmlite.binding as llvm
+
+    return getattr(llvm, 'set_time_passes', None), getattr(llvm, 'report_and_reset_timings', None)
+
+
+def start(trace_memory=True):
+    global _active
+    if trace_memory:
+        tracemalloc.start()
+    set_time_passes, _ = _llvm_timing_hooks()
+    if set_time_passes is not None:
+        set_time_passes(True)
+    _active = PhaseTimer(trace_memory=trace_memory)
+    return _active
+
+
+def stop():
+    global _active
+    timer, _active = _active, None
+    if timer is None:
+        return None
+
+    set_time_passes, report_and_reset_timings = _llvm_timing_hooks()
+    if report_and_reset_timings is not None:
+        timer.llvm_report = report_and_reset_timings() or None
+    if set_time_passes is not None:
+        set_time_passes(False)
+    if timer.trace_memory:
+        tracemalloc.stop()
+    return timer
+
+
+def phase(name, kind='phase'):
+    if _active is None:
+        return _inactive
+    return _active.phase(name, kind)
+
+
+def function(name):
+    return phase(name, 'function')
@@ -0,0 +1,70 @@
+import llvmlite.ir as ir
+
+from sspc.datatypes import Boolean, Integer
+from sspc.errors import CompileError
+
+I8 = ir.IntType(8)
+I64 = ir.IntType(64)
+
+
+def memory_type(dtype):
+    if isinstance(dtype, Boolean):
+        return I8
+    elif isinstance(dtype, Integer):
+        return dtype
+    raise CompileError('Type %s cannot be stored in a buffer' % dtype)
+
+
+def load_element(builder, pointer, dtype):
+    value = builder.load(pointer)
+    if isinstance(dtype, Boolean):
+        return builder.icmp_unsigned('!=', value, ir.Constant(I8, 0))
+    return value
+
+
+def store_element(builder, value, pointer, dtype):
+    if isinstance(dtype, Boolean):
+        value = builder.zext(value, I8)
+    builder.store(value, pointer)
+
+
+def define_loop(func):
+    operand_types = [*func.ftype.args, func.ftype.return_type]
+    params = [I64]
+    for dtype in operand_types:
+        params += [memory_type(dtype).as_pointer(), I64]
+
+    loop = ir.Function(func.module, ir.FunctionType(ir.VoidType(), params), name=func.name + '.loop')
+    count = loop.args[0]
+    count.name = 'n'
+    buffers = loop.args[1::2]
+    strides = loop.args[2::2]
+    for operand, (buffer, stride) in enumerate(zip(buffers, strides)):
+        buffer.name = 'buffer%d' % operand
+        stride.name = 'stride%d' % operand
+
+    builder = ir.IRBuilder(loop.append_basic_block('entry'))
+    body_block = loop.append_basic_block('body')
+    exit_block = loop.append_basic_block('exit')
+    builder.cbranch(builder.icmp_signed('>', count, ir.Constant(I64, 0)), body_block, exit_block)
+
+    builder.position_at_end(body_block)
+    index = builder.phi(I64, name='i')
+    index.add_incoming(ir.Constant(I64, 0), loop.entry_basic_block)
+    pointers = [
+        builder.gep(buffer, [builder.mul(index, stride)])
+        for buffer, stride in zip(buffers, strides)
+    ]
+    args = [
+        load_element(builder, pointer, dtype)
+        for pointer, dtype in zip(pointers, func.ftype.args)
+    ]
+    store_element(builder, builder.call(func, args), pointers[-1], func.ftype.return_type)
+
+    next_index = builder.add(index, ir.Constant(I64, 1))
+    index.add_incoming(next_index, body_block)
+    builder.cbranch(builder.icmp_signed('<', next_index, count), body_block, exit_block)
+
+    builder.position_at_end(exit_block)
+    builder.ret_void()
+    return loop
@@ -0,0 +1,48 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LIBRARY = '''\
+def twice(x: int) -> int:
+    return x * 2
+
+def is_small(x: ubyte) -> bool:
+    return x < 10
+
+def main() -> int:
+    return twice(3)
+'''
+
+HOST = '''\
+#include "libdemo.h"
+
+int main(void) {
+    return twice(20) + (is_small(3) ? 2 : 0);
+}
+'''
+
+
+@pytest.mark.skipif(shutil.which('gcc') is None, reason='gcc is not available')
+def test_c_host_compiles_against_generated_header(tmp_path):
+    (tmp_path / 'libdemo.ssp').write_text(LIBRARY)
+    (tmp_path / 'host.c').write_text(HOST)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    subprocess.run(
+        [sys.executable, '-m', 'sspc.main', 'libdemo.ssp', '--emit', 'shared', '-o', 'libdemo.so'],
+        cwd=tmp_path, env=env, check=True,
+    )
+
+    header = (tmp_path / 'libdemo.h').read_text()
+    assert 'twice(' in header
+    assert ' main(' not in header
+
+    subprocess.run(
+        ['gcc', '-Wall', '-Werror', 'host.c', '-o', 'host', '-L.', '-ldemo', '-Wl,-rpath,$ORIGIN'],
+        cwd=tmp_path, check=True,
+    )
+    assert subprocess.run([str(tmp_path / 'host')]).returncode == 42
@@ -0,0 +1,25 @@
+import pytest
+
+from sspc.compiler import compile_module
+from sspc.errors import TypeMismatch
+from sspc.parser.parser import Parser
+
+
+def compile_source(source):
+    return compile_module(Parser(engine='descent').parse(source))
+
+
+def test_typed_constants_wrap():
+    module_ir = compile_source('def main() -> int:\n    let b: byte = byte(100) + 100\n    return int(b)\n')
+    assert 'ret i32 -56' in str(module_ir)
+
+
+@pytest.mark.parametrize('expression', ['byte(1) + 300', '300 + byte(1)', 'ubyte(1) + -1', 'byte(1) < 300'])
+def test_folded_literal_must_fit_operand_type(expression):
+    with pytest.raises(TypeMismatch, match='does not fit'):
+        compile_source('def main() -> int:\n    let b: bool = bool(%s)\n    return 0\n' % expression)
+
+
+def test_unfolded_literal_must_fit_operand_type():
+    with pytest.raises(TypeMismatch, match='does not fit'):
+        compile_source('def f(x: byte) -> byte:\n    return x + 300\n')
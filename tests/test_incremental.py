@@ -0,0 +1,48 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sspc import backend, incremental
+from sspc.parser.parser import Parser
+
+SOURCE = '''\
+def square(x: int) -> int:
+    return x * x
+
+def cube(x: int) -> int:
+    return square(x) * x
+
+def main() -> int:
+    return cube(3) - square(4)
+'''
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        RecordingExecutor.created += 1
+
+
+def test_workers_do_not_parse(monkeypatch):
+    module_ast = Parser(engine='descent').parse(SOURCE)
+    target_machine = backend.create_target_machine(2)
+
+    def fail(*args, **kwargs):
+        pytest.fail('a unit worker parsed the sources again')
+
+    monkeypatch.setattr(Parser, 'parse', fail)
+    # threads run the pool initializer and tasks in this process, where the parser is patched out
+    monkeypatch.setattr(incremental, 'ProcessPoolExecutor', RecordingExecutor)
+    module_ref = incremental.compile_module_units(module_ast, target_machine, 2, 0, jobs=2)
+
+    assert RecordingExecutor.created == 1
+    defined = {func.name for func in module_ref.functions if not func.is_declaration}
+    assert {'square', 'cube', 'main'} <= defined
+
+
+def test_unit_payloads_pickle():
+    module_ast = Parser(engine='descent').parse('import foo\n' + SOURCE)
+    assert repr(pickle.loads(pickle.dumps(module_ast))) == repr(module_ast)